@@ -79,6 +79,12 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Write a report of the time integrations take to start up to the "
+        "configuration directory",
+    )
     parser.add_argument(
         "--skip-pip",
         action="store_true",
@@ -307,6 +313,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        profile_startup=args.profile_startup,
     )
 
     exit_code = runner.run(runtime_conf)
@@ -3,12 +3,17 @@ import asyncio
 from collections import OrderedDict
 from datetime import timedelta
 import logging
+from time import monotonic, time
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
 
 from homeassistant import data_entry_flow
-from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
+from homeassistant.auth.const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_CACHE_TTL,
+    ACCESS_TOKEN_EXPIRATION,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
@@ -146,6 +151,10 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Verified access token -> (refresh token id, trusted until)
+        self._access_token_cache: "OrderedDict[str, Tuple[str, float]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -431,6 +440,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(refresh_token.id)
 
     @callback
     def async_create_access_token(
@@ -454,6 +464,17 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            refresh_token_id, trusted_until = cached
+            if monotonic() < trusted_until:
+                self._access_token_cache.move_to_end(token)
+                refresh_token = await self.async_get_refresh_token(refresh_token_id)
+                if refresh_token is None or not refresh_token.user.is_active:
+                    return None
+                return refresh_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -471,15 +492,45 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            self._async_cache_access_token(token, refresh_token.id, claims["exp"])
         return refresh_token
 
+    @callback
+    def _async_cache_access_token(
+        self, token: str, refresh_token_id: str, expires_at: float
+    ) -> None:
+        """Trust a verified access token until it expires or the TTL passes."""
+        trust_for = min(ACCESS_TOKEN_CACHE_TTL.total_seconds(), expires_at - time())
+        if trust_for <= 0:
+            return
+
+        self._access_token_cache[token] = (
+            refresh_token_id,
+            monotonic() + trust_for,
+        )
+        if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            self._access_token_cache.popitem(last=False)
+
+    @callback
+    def _async_invalidate_access_tokens(self, refresh_token_id: str) -> None:
+        """Stop trusting the cached access tokens of a refresh token."""
+        for token in [
+            token
+            for token, (token_refresh_token_id, _) in self._access_token_cache.items()
+            if token_refresh_token_id == refresh_token_id
+        ]:
+            del self._access_token_cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -35,10 +35,11 @@ class AuthStore:
         """Initialize the auth store."""
         self.hass = hass
         self._users: Optional[Dict[str, models.User]] = None
+        self._refresh_tokens: Dict[str, models.RefreshToken] = {}
         self._groups: Optional[Dict[str, models.Group]] = None
         self._perm_lookup: Optional[PermissionLookup] = None
         self._store = hass.helpers.storage.Store(
-            STORAGE_VERSION, STORAGE_KEY, private=True
+            STORAGE_VERSION, STORAGE_KEY, private=True, compact=True
         )
         self._lock = asyncio.Lock()
 
@@ -141,6 +142,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token_id in user.refresh_tokens:
+            self._refresh_tokens.pop(refresh_token_id, None)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -223,6 +226,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens[refresh_token.id] = refresh_token
 
         self._async_schedule_save()
         return refresh_token
@@ -235,10 +239,10 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        found = self._refresh_tokens.pop(refresh_token.id, None)
+        if found is not None:
+            found.user.refresh_tokens.pop(refresh_token.id, None)
+            self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -248,12 +252,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -265,10 +264,9 @@ class AuthStore:
 
         found = None
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        for refresh_token in self._refresh_tokens.values():
+            if hmac.compare_digest(refresh_token.token, token):
+                found = refresh_token
 
         return found
 
@@ -425,6 +423,8 @@ class AuthStore:
                 )
             )
 
+        refresh_tokens: Dict[str, models.RefreshToken] = {}
+
         for rt_dict in data["refresh_tokens"]:
             # Filter out the old keys that don't have jwt_key (pre-0.76)
             if "jwt_key" not in rt_dict:
@@ -471,8 +471,10 @@ class AuthStore:
                 last_used_ip=rt_dict.get("last_used_ip"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            refresh_tokens[token.id] = token
 
         self._groups = groups
+        self._refresh_tokens = refresh_tokens
         self._users = users
 
     @callback
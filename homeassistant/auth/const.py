@@ -4,6 +4,10 @@ from datetime import timedelta
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
+# Verified access tokens are trusted without verifying them again for this long
+ACCESS_TOKEN_CACHE_TTL = timedelta(seconds=60)
+ACCESS_TOKEN_CACHE_SIZE = 256
+
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
 GROUP_ID_READ_ONLY = "system-read-only"
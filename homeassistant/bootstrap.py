@@ -21,6 +21,7 @@ from homeassistant.const import (
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform, startup_profiler
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -43,6 +44,7 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 DATA_LOGGING = "logging"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
+LOG_SLOWEST_IMPORTS = 10
 
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
@@ -81,6 +83,11 @@ async def async_setup_hass(
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
 
+    if runtime_config.profile_startup:
+        hass.data[
+            startup_profiler.DATA_STARTUP_PROFILER
+        ] = profiler = startup_profiler.StartupProfiler()
+
     async_enable_logging(
         hass,
         runtime_config.verbose,
@@ -153,6 +160,9 @@ async def async_setup_hass(
         hass.config.external_url = old_config.external_url
         hass.config.config_dir = old_config.config_dir
 
+        if runtime_config.profile_startup:
+            hass.data[startup_profiler.DATA_STARTUP_PROFILER] = profiler
+
     if safe_mode:
         _LOGGER.info("Starting in safe mode")
         hass.config.safe_mode = True
@@ -163,6 +173,9 @@ async def async_setup_hass(
             {"safe_mode": {}, "http": http_conf}, hass,
         )
 
+    if runtime_config.profile_startup:
+        await startup_profiler.async_write_report(hass)
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
@@ -395,6 +408,53 @@ async def _async_log_pending_setups(
             )
 
 
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant, domains: Set[str], config: Dict[str, Any]
+) -> None:
+    """Import integrations and the platforms the config refers to in the executor.
+
+    Platforms that are not in the config are imported when they are set up.
+    """
+    platforms: Dict[str, Set[str]] = {domain: set() for domain in domains}
+
+    for domain in domains:
+        for p_type, _ in config_per_platform(config, domain):
+            if isinstance(p_type, str):
+                platforms.setdefault(p_type, set()).add(domain)
+
+    async def preimport(domain: str, platform_names: Set[str]) -> None:
+        try:
+            integration = await loader.async_get_integration(hass, domain)
+        except loader.IntegrationNotFound:
+            return
+        await hass.async_add_executor_job(integration.preimport, platform_names)
+
+    await asyncio.gather(
+        *(
+            preimport(domain, platform_names)
+            for domain, platform_names in platforms.items()
+        )
+    )
+
+
+@core.callback
+def _async_log_slowest_imports(hass: core.HomeAssistant) -> None:
+    """Log the modules that took the longest to import."""
+    import_times = hass.data.get(loader.DATA_IMPORT_TIMES)
+
+    if not import_times:
+        return
+
+    slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)
+    _LOGGER.info(
+        "Slowest imports: %s",
+        ", ".join(
+            f"{name} ({duration:.2f}s)"
+            for name, duration in slowest[:LOG_SLOWEST_IMPORTS]
+        ),
+    )
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: Set[str],
@@ -425,7 +485,11 @@ async def _async_set_up_integrations(
 ) -> None:
     """Set up all the integrations."""
     setup_started = hass.data[DATA_SETUP_STARTED] = {}
-    domains_to_setup = _get_domains(hass, config)
+    # The manifest index has the dependencies of all known integrations,
+    # so the first round below usually loads every integration needed.
+    domains_to_setup = loader.dependencies_from_index(
+        await loader.async_get_manifest_index(hass), _get_domains(hass, config)
+    )
 
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start rightaway
@@ -439,7 +503,12 @@ async def _async_set_up_integrations(
             int_or_exc
             for int_or_exc in await asyncio.gather(
                 *(
-                    loader.async_get_integration(hass, domain)
+                    startup_profiler.async_profile(
+                        hass,
+                        domain,
+                        startup_profiler.PHASE_MANIFEST,
+                        loader.async_get_integration(hass, domain),
+                    )
                     for domain in old_to_resolve
                 ),
                 return_exceptions=True,
@@ -511,6 +580,10 @@ async def _async_set_up_integrations(
     asyncio.create_task(hass.helpers.entity_registry.async_get_registry())
     asyncio.create_task(hass.helpers.area_registry.async_get_registry())
 
+    # Import the stage 2 integrations while stage 1 is being set up, so the
+    # imports do not block the event loop.
+    hass.async_create_task(_async_preimport_integrations(hass, stage_2_domains, config))
+
     # Start setup
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
@@ -546,3 +619,5 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    _async_log_slowest_imports(hass)
@@ -1,14 +1,28 @@
 """Provide pre-made queries on top of the recorder component."""
+import asyncio
 from collections import defaultdict
 from datetime import timedelta
 from itertools import groupby
 import json
 import logging
+import math
+from operator import itemgetter
+import re
+import threading
 import time
 from typing import Optional, cast
 
 from aiohttp import web
-from sqlalchemy import and_, bindparam, func
+from sqlalchemy import (
+    Float,
+    Integer,
+    and_,
+    bindparam,
+    extract,
+    func,
+    literal_column,
+    type_coerce,
+)
 from sqlalchemy.ext import baked
 import voluptuous as vol
 
@@ -21,14 +35,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_UNIT_OF_MEASUREMENT,
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import Context, State, split_entity_id
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -40,6 +60,18 @@ CONF_ORDER = "use_include_order"
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+MIN_KEY = "min"
+MAX_KEY = "max"
+MEAN_KEY = "mean"
+
+# States that are never aggregated for numeric entities
+NON_NUMERIC_STATES = (STATE_UNKNOWN, STATE_UNAVAILABLE, "")
+NUMERIC_STATE_PATTERN = r"^[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?$"
+NUMERIC_STATE_RE = re.compile(NUMERIC_STATE_PATTERN)
+# SQLite has no regular expressions, so it rejects states with other
+# characters than the ones a number is made of or without any digit
+SQLITE_NON_NUMERIC_GLOB = "*[^-+.eE0-9]*"
+SQLITE_DIGIT_GLOB = "*[0-9]*"
 
 # Not reusing from entityfilter because history does not support glob filtering
 _FILTER_SCHEMA_INNER = vol.Schema(
@@ -88,6 +120,11 @@ QUERY_STATES = [
 
 HISTORY_BAKERY = "history_bakery"
 
+# Number of rows fetched from the database at once when streaming
+STREAM_BATCH_SIZE = 1000
+# Number of serialized entities buffered between the database and the client
+STREAM_QUEUE_SIZE = 10
+
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
@@ -95,26 +132,17 @@ def get_significant_states(hass, *args, **kwargs):
         return _get_significant_states(hass, session, *args, **kwargs)
 
 
-def _get_significant_states(
+def _significant_states_query(
     hass,
     session,
     start_time,
-    end_time=None,
-    entity_ids=None,
-    filters=None,
-    include_start_time_state=True,
-    significant_changes_only=True,
-    minimal_response=False,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+    exclude_entity_ids=None,
 ):
-    """
-    Return states changes during UTC period start_time - end_time.
-
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
-    """
-    timer_start = time.perf_counter()
-
+    """Build the query for the significant states ordered by entity_id."""
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
@@ -136,11 +164,50 @@ def _get_significant_states(
     if end_time is not None:
         baked_query += lambda q: q.filter(States.last_updated < bindparam("end_time"))
 
+    if exclude_entity_ids:
+        baked_query += lambda q: q.filter(
+            ~States.entity_id.in_(bindparam("exclude_entity_ids", expanding=True))
+        )
+
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
+    return baked_query(session).params(
+        start_time=start_time,
+        end_time=end_time,
+        entity_ids=entity_ids,
+        exclude_entity_ids=exclude_entity_ids,
+    )
+
+
+def _get_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """
+    Return states changes during UTC period start_time - end_time.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    timer_start = time.perf_counter()
+
     states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
         )
     )
 
@@ -356,65 +423,364 @@ def _sorted_states_to_json(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
         ):
-            state.last_changed = start_time
-            state.last_updated = start_time
             result[state.entity_id].append(state)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
-
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+        _append_entity_states(result[ent_id], ent_id, group, minimal_response)
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _get_aggregated_states(
+    hass,
+    session,
+    start_time,
+    end_time,
+    bucket_size,
+    numeric_entity_ids,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """Return states changes during UTC period with numeric entities aggregated.
+
+    The states of the numeric entities are reduced to the min, max and mean
+    value per bucket of bucket_size seconds, all other entities are returned
+    the same way as _get_significant_states does. The state of a numeric
+    entity at the start time is counted in its first bucket.
+    """
+    timer_start = time.perf_counter()
+
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+            numeric_entity_ids,
+        )
+    )
+
+    result = _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+    if numeric_entity_ids:
+        rows = _aggregate_numeric_states(
+            session,
+            start_time,
+            end_time,
+            bucket_size,
+            numeric_entity_ids,
+            entity_ids,
+            filters,
+        )
+        for ent_id in numeric_entity_ids:
+            # Only the start time state is left for the numeric entities
+            start_states = result.get(ent_id)
+            start_value = None
+            if start_states:
+                start_value = _numeric_value(start_states[0].state)
+
+            buckets = _entity_buckets(
+                ent_id, rows.get(ent_id, []), start_value, start_time, bucket_size
+            )
+            if buckets:
+                result[ent_id] = buckets
+            else:
+                result.pop(ent_id, None)
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_aggregated_states took %fs", elapsed)
+
+    return result
+
+
+def _entity_id(state):
+    """Return the entity_id of a state or of the first bucket of an entity."""
+    if isinstance(state, dict):
+        return state[ATTR_ENTITY_ID]
+    return state.entity_id
+
+
+def _numeric_value(state):
+    """Return the value of a numeric state or None."""
+    if not NUMERIC_STATE_RE.match(state):
+        return None
+    return float(state)
+
+
+def _entity_buckets(ent_id, rows, start_value, start_time, bucket_size):
+    """Return the buckets of an entity with its start value in the first one."""
+    if start_value is not None:
+        if rows and rows[0][0] == 0:
+            _, min_value, max_value, mean_value, count = rows[0]
+            rows[0] = (
+                0,
+                min(min_value, start_value),
+                max(max_value, start_value),
+                (mean_value * count + start_value) / (count + 1),
+                count + 1,
+            )
+        else:
+            rows.insert(0, (0, start_value, start_value, start_value, 1))
+
+    buckets = [
+        {
+            LAST_CHANGED_KEY: process_timestamp_to_utc_isoformat(
+                start_time + timedelta(seconds=int(index) * bucket_size)
+            ),
+            MIN_KEY: min_value,
+            MAX_KEY: max_value,
+            MEAN_KEY: mean_value,
+        }
+        for index, min_value, max_value, mean_value, _ in rows
+    ]
+    if buckets:
+        buckets[0][ATTR_ENTITY_ID] = ent_id
+    return buckets
+
+
+def _aggregate_numeric_states(
+    session, start_time, end_time, bucket_size, numeric_entity_ids, entity_ids, filters
+):
+    """Return the rows of the buckets of each numeric entity.
+
+    A row holds the bucket index, min, max, mean and number of states. The
+    aggregation is done by the database if we know how to compute the
+    bucket of a row in its dialect, otherwise the rows are aggregated here.
+    """
+    dialect_name = session.bind.dialect.name
+    bucket = _bucket_expression(dialect_name, start_time, bucket_size)
+
+    if bucket is not None:
+        if dialect_name == "mysql":
+            # MySQL cannot CAST to FLOAT, SQLAlchemy drops the cast and
+            # the strings would be compared. Adding a number converts them.
+            value = type_coerce(States.state, Float) + 0.0
+        else:
+            value = States.state.cast(Float)
+        query = session.query(
+            States.entity_id,
+            bucket.label("bucket"),
+            func.min(value),
+            func.max(value),
+            func.avg(value),
+            func.count(),
+        )
+    else:
+        query = session.query(States.entity_id, States.state, States.last_updated)
+
+    query = query.filter(
+        States.entity_id.in_(numeric_entity_ids),
+        States.state.notin_(NON_NUMERIC_STATES),
+        States.last_updated > start_time,
+    )
+    if end_time is not None:
+        query = query.filter(States.last_updated < end_time)
+    if filters:
+        query = filters.apply(query, entity_ids)
+
+    # Casting text that is not a number fails on PostgreSQL and gives 0 or
+    # the leading digits on SQLite and MySQL, so only numbers are aggregated
+    if dialect_name == "postgresql":
+        query = query.filter(States.state.op("~")(NUMERIC_STATE_PATTERN))
+    elif dialect_name == "mysql":
+        query = query.filter(States.state.op("REGEXP")(NUMERIC_STATE_PATTERN))
+    elif dialect_name == "sqlite":
+        query = query.filter(
+            ~States.state.op("GLOB")(SQLITE_NON_NUMERIC_GLOB),
+            States.state.op("GLOB")(SQLITE_DIGIT_GLOB),
+        )
+
+    if bucket is not None:
+        query = query.group_by(States.entity_id, "bucket").order_by(
+            States.entity_id, "bucket"
+        )
+        rows = execute(query)
+    else:
+        query = query.order_by(States.entity_id, States.last_updated)
+        rows = _aggregate_rows(execute(query), start_time, bucket_size)
+
+    return {
+        ent_id: [tuple(row[1:]) for row in group]
+        for ent_id, group in groupby(rows, itemgetter(0))
+    }
+
+
+def _bucket_expression(dialect_name, start_time, bucket_size):
+    """Return the SQL expression of the bucket index of a row or None."""
+    if dialect_name == "sqlite":
+        # Integer division as strftime only has second resolution
+        start_ts = int(process_timestamp(start_time).timestamp())
+        return (
+            func.strftime("%s", States.last_updated).cast(Integer) - start_ts
+        ) / bucket_size
+    if dialect_name == "mysql":
+        return func.floor(
+            func.timestampdiff(
+                literal_column("SECOND"), start_time, States.last_updated
+            )
+            / bucket_size
+        )
+    if dialect_name == "postgresql":
+        return func.floor(
+            extract("epoch", States.last_updated - start_time) / bucket_size
+        )
+    return None
+
+
+def _aggregate_rows(rows, start_time, bucket_size):
+    """Aggregate rows sorted by entity_id and last_updated into buckets."""
+    start_ts = process_timestamp(start_time).timestamp()
+    current = None
+    for ent_id, state, last_updated in rows:
+        value = _numeric_value(state)
+        if value is None:
+            continue
+        index = int(
+            (process_timestamp(last_updated).timestamp() - start_ts) // bucket_size
+        )
+        if current is not None and current[:2] == [ent_id, index]:
+            current[2] = min(current[2], value)
+            current[3] = max(current[3], value)
+            current[4] += value
+            current[5] += 1
+            continue
+        if current is not None:
+            yield (*current[:4], current[4] / current[5], current[5])
+        current = [ent_id, index, value, value, value, 1]
+
+    if current is not None:
+        yield (*current[:4], current[4] / current[5], current[5])
+
+
+def _stream_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """Yield the list of states of each entity during UTC period.
+
+    This is the streaming counterpart of _get_significant_states. Rows are
+    fetched from the database in batches of STREAM_BATCH_SIZE and the states
+    of an entity are yielded as soon as its last row has been read, so only
+    a single entity is held in memory at any time. Entities are yielded
+    ordered by entity_id, followed by the entities that only have a state
+    at the start time.
+    """
+    start_states = {}
+    if include_start_time_state:
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        ):
+            start_states[state.entity_id] = state
+
+    states = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        ent_results = []
+        start_state = start_states.pop(ent_id, None)
+        if start_state is not None:
+            ent_results.append(start_state)
+        _append_entity_states(ent_results, ent_id, group, minimal_response)
+        yield ent_results
+
+    for start_state in start_states.values():
+        yield [start_state]
+
+
+def _get_start_time_states(hass, session, start_time, entity_ids, filters):
+    """Return the states at the start time as synthetic zero data points."""
+    run = recorder.run_information_from_instance(hass, start_time)
+    states = _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    )
+    for state in states:
+        state.last_changed = start_time
+        state.last_updated = start_time
+    return states
+
+
+def _append_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the states of a single entity from a group of sorted rows."""
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -494,6 +860,56 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app["hass"]
 
+        bucket_size = request.query.get("bucket_size")
+        resolution = request.query.get("resolution")
+        if bucket_size or resolution:
+            try:
+                if bucket_size:
+                    bucket_size = int(bucket_size)
+                else:
+                    bucket_size = math.ceil(
+                        (end_time - start_time).total_seconds() / int(resolution)
+                    )
+            except (ValueError, ZeroDivisionError):
+                return self.json_message("Invalid bucket_size", HTTP_BAD_REQUEST)
+            if bucket_size < 1:
+                return self.json_message("Invalid bucket_size", HTTP_BAD_REQUEST)
+
+            numeric_entity_ids = [
+                state.entity_id
+                for state in hass.states.async_all()
+                if ATTR_UNIT_OF_MEASUREMENT in state.attributes
+                and (entity_ids is None or state.entity_id in entity_ids)
+            ]
+
+            return cast(
+                web.Response,
+                await hass.async_add_executor_job(
+                    self._sorted_significant_states_json,
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    bucket_size,
+                    numeric_entity_ids,
+                ),
+            )
+
+        if "stream" in request.query:
+            return await self._async_stream_significant_states(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -517,22 +933,39 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        bucket_size=None,
+        numeric_entity_ids=None,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
 
         with session_scope(hass=hass) as session:
-            result = _get_significant_states(
-                hass,
-                session,
-                start_time,
-                end_time,
-                entity_ids,
-                self.filters,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-            )
+            if bucket_size is None:
+                result = _get_significant_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                )
+            else:
+                result = _get_aggregated_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    bucket_size,
+                    numeric_entity_ids,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                )
 
         result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -545,7 +978,7 @@ class HistoryPeriodView(HomeAssistantView):
             sorted_result = []
             for order_entity in self.filters.included_entities:
                 for state_list in result:
-                    if state_list[0].entity_id == order_entity:
+                    if _entity_id(state_list[0]) == order_entity:
                         sorted_result.append(state_list)
                         result.remove(state_list)
                         break
@@ -554,6 +987,98 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    async def _async_stream_significant_states(self, request, hass, *args):
+        """Stream the significant states as a chunked JSON response.
+
+        The database is read in the executor while the serialized states of
+        each entity are written to the client as soon as they are ready. The
+        configured include order is not applied to streamed responses.
+        """
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+        cancel = threading.Event()
+        job = hass.async_add_executor_job(
+            self._stream_significant_states_json, hass, queue, cancel, *args
+        )
+
+        finished = False
+        try:
+            await response.write(b"[")
+            separator = b""
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                await response.write(separator + chunk)
+                separator = b","
+            finished = True
+        finally:
+            if not finished:
+                # Unblock the producer so it can release its session
+                cancel.set()
+                while await queue.get() is not None:
+                    pass
+
+        # Leave the array unterminated if the producer failed so the
+        # client cannot mistake a truncated response for a complete one.
+        await job
+        await response.write(b"]")
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        queue,
+        cancel,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Serialize the significant states of each entity into the queue."""
+        timer_start = time.perf_counter()
+        count = 0
+
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), hass.loop).result()
+
+        try:
+            with session_scope(hass=hass) as session:
+                for ent_results in _stream_significant_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                ):
+                    if cancel.is_set():
+                        return
+                    count += len(ent_results)
+                    put(
+                        json.dumps(
+                            ent_results,
+                            sort_keys=True,
+                            cls=JSONEncoder,
+                            allow_nan=False,
+                        ).encode("UTF-8")
+                    )
+        finally:
+            put(None)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", count, elapsed)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -1,9 +1,17 @@
 """Ban logic for HTTP component."""
-from collections import defaultdict
+from collections import OrderedDict
 from datetime import datetime
-from ipaddress import ip_address
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import logging
-from typing import List, Optional
+from time import monotonic
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from aiohttp.web import middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -30,6 +38,14 @@ NOTIFICATION_ID_LOGIN = "http-login"
 IP_BANS_FILE = "ip_bans.yaml"
 ATTR_BANNED_AT = "banned_at"
 
+# Remote addresses with failed login attempts that are remembered
+MAX_FAILED_LOGIN_ADDRESSES = 1000
+# Seconds after which failed login attempts of an address are forgotten
+FAILED_LOGIN_EXPIRY = 24 * 60 * 60
+
+IPAddress = Union[IPv4Address, IPv6Address]
+IPNetwork = Union[IPv4Network, IPv6Network]
+
 SCHEMA_IP_BAN_ENTRY = vol.Schema(
     {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
 )
@@ -39,13 +55,13 @@ SCHEMA_IP_BAN_ENTRY = vol.Schema(
 def setup_bans(hass, app, login_threshold):
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
-    app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict(int)
+    app[KEY_FAILED_LOGIN_ATTEMPTS] = FailedLoginAttempts()
     app[KEY_LOGIN_THRESHOLD] = login_threshold
 
     async def ban_startup(app):
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE)
+        app[KEY_BANNED_IPS] = IpBans(
+            await async_load_ip_bans_config(hass, hass.config.path(IP_BANS_FILE))
         )
 
     app.on_startup.append(ban_startup)
@@ -59,12 +75,7 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = ip_address(request.remote)
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
-
-    if is_banned:
+    if request.app[KEY_BANNED_IPS].is_banned(ip_address(request.remote)):
         raise HTTPForbidden()
 
     try:
@@ -107,7 +118,7 @@ async def process_wrong_login(request):
     if KEY_BANNED_IPS not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
-    request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] += 1
+    failed_attempts = request.app[KEY_FAILED_LOGIN_ATTEMPTS].increment(remote_addr)
 
     # Supervisor IP should never be banned
     if "hassio" in hass.config.components and hass.components.hassio.get_supervisor_ip() == str(
@@ -115,10 +126,7 @@ async def process_wrong_login(request):
     ):
         return
 
-    if (
-        request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr]
-        >= request.app[KEY_LOGIN_THRESHOLD]
-    ):
+    if failed_attempts >= request.app[KEY_LOGIN_THRESHOLD]:
         new_ban = IpBan(remote_addr)
         request.app[KEY_BANNED_IPS].append(new_ban)
 
@@ -159,14 +167,117 @@ async def process_success_login(request):
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
     def __init__(self, ip_ban: str, banned_at: Optional[datetime] = None) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_address: Union[IPAddress, IPNetwork]
+        try:
+            self.ip_address = ip_address(ip_ban)
+        except ValueError:
+            self.ip_address = ip_network(ip_ban)
         self.banned_at = banned_at or datetime.utcnow()
 
 
+class IpBans:
+    """Banned IP addresses and networks indexed for lookups.
+
+    Addresses are kept in a set. Networks are kept in a set per prefix
+    length, so a lookup hashes the address once per prefix length in use.
+    """
+
+    def __init__(self, ip_bans: Iterable[IpBan] = ()) -> None:
+        """Initialize the banned IPs."""
+        self._ip_bans: List[IpBan] = []
+        self._addresses: Set[IPAddress] = set()
+        self._networks: Dict[Tuple[int, int], Set[IPNetwork]] = {}
+        for ip_ban in ip_bans:
+            self.append(ip_ban)
+
+    def append(self, ip_ban: IpBan) -> None:
+        """Add a ban."""
+        self._ip_bans.append(ip_ban)
+        if isinstance(ip_ban.ip_address, (IPv4Network, IPv6Network)):
+            network = ip_ban.ip_address
+            self._networks.setdefault((network.version, network.prefixlen), set()).add(
+                network
+            )
+        else:
+            self._addresses.add(ip_ban.ip_address)
+
+    def is_banned(self, address: IPAddress) -> bool:
+        """Return if an address is banned."""
+        if address in self._addresses:
+            return True
+
+        for (version, prefixlen), networks in self._networks.items():
+            if (
+                version == address.version
+                and ip_network((address, prefixlen), strict=False) in networks
+            ):
+                return True
+
+        return False
+
+    def __len__(self) -> int:
+        """Return the number of bans."""
+        return len(self._ip_bans)
+
+    def __iter__(self) -> Iterator[IpBan]:
+        """Iterate over the bans."""
+        return iter(self._ip_bans)
+
+
+class FailedLoginAttempts:
+    """Count failed login attempts per remote address.
+
+    Only the MAX_FAILED_LOGIN_ADDRESSES addresses with the most recent
+    attempts are remembered, and attempts expire after FAILED_LOGIN_EXPIRY
+    seconds without a new one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the failed login attempts."""
+        # Ordered by the time of the last attempt
+        self._attempts: "OrderedDict[IPAddress, Tuple[int, float]]" = OrderedDict()
+
+    def increment(self, address: IPAddress) -> int:
+        """Count a failed attempt and return the attempts of the address."""
+        now = monotonic()
+        self._expire(now)
+        count = self._attempts.pop(address, (0, now))[0] + 1
+        self._attempts[address] = (count, now)
+        if len(self._attempts) > MAX_FAILED_LOGIN_ADDRESSES:
+            self._attempts.popitem(last=False)
+        return count
+
+    def pop(self, address: IPAddress) -> int:
+        """Forget the attempts of an address and return them."""
+        return self._attempts.pop(address, (0, 0.0))[0]
+
+    def _expire(self, now: float) -> None:
+        """Forget the attempts that are too old."""
+        while self._attempts:
+            address, (_, last_attempt) = next(iter(self._attempts.items()))
+            if now - last_attempt < FAILED_LOGIN_EXPIRY:
+                return
+            del self._attempts[address]
+
+    def __getitem__(self, address: IPAddress) -> int:
+        """Return the failed attempts of an address."""
+        self._expire(monotonic())
+        return self._attempts.get(address, (0, 0.0))[0]
+
+    def __contains__(self, address: object) -> bool:
+        """Return if an address has failed attempts."""
+        self._expire(monotonic())
+        return address in self._attempts
+
+    def __len__(self) -> int:
+        """Return the number of addresses with failed attempts."""
+        return len(self._attempts)
+
+
 async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBan]:
     """Load list of banned IPs from config file."""
     ip_list: List[IpBan] = []
@@ -183,6 +294,9 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBa
         try:
             ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
             ip_list.append(IpBan(ip_ban, ip_info["banned_at"]))
+        except ValueError as err:
+            _LOGGER.error("Failed to load IP ban %s: %s", ip_ban, err)
+            continue
         except vol.Invalid as err:
             _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
             continue
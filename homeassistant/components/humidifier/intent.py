@@ -41,8 +41,7 @@ class HumidityHandler(intent.IntentHandler):
         hass = intent_obj.hass
         slots = self.async_validate_slots(intent_obj.slots)
         state = hass.helpers.intent.async_match_state(
-            slots["name"]["value"],
-            [state for state in hass.states.async_all() if state.domain == DOMAIN],
+            slots["name"]["value"], hass.states.async_all(DOMAIN),
         )
 
         service_data = {ATTR_ENTITY_ID: state.entity_id}
@@ -86,8 +85,7 @@ class SetModeHandler(intent.IntentHandler):
         hass = intent_obj.hass
         slots = self.async_validate_slots(intent_obj.slots)
         state = hass.helpers.intent.async_match_state(
-            slots["name"]["value"],
-            [state for state in hass.states.async_all() if state.domain == DOMAIN],
+            slots["name"]["value"], hass.states.async_all(DOMAIN),
         )
 
         service_data = {ATTR_ENTITY_ID: state.entity_id}
@@ -0,0 +1,143 @@
+"""Measure the time integrations keep the event loop busy."""
+import logging
+from typing import Any, Dict
+
+import voluptuous as vol
+
+from homeassistant import loader
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+from homeassistant.helpers import discovery
+from homeassistant.helpers.typing import ConfigType, HomeAssistantType
+from homeassistant.util.loop_watchdog import STALL_THRESHOLD, LoopWatchdog
+
+from .const import CONF_STALL_THRESHOLD, CORE_DOMAIN, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_STALL_THRESHOLD, default=STALL_THRESHOLD): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.001)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistantType, config: ConfigType) -> bool:
+    """Set up the Loop Watchdog integration."""
+    conf = config.get(DOMAIN)
+    if conf is None:
+        conf = CONFIG_SCHEMA({DOMAIN: {}})[DOMAIN]
+
+    logged = set()
+
+    @callback
+    def async_log_stall(target: Any, module: str, duration: float) -> None:
+        """Warn once per module about a job that stalled the event loop."""
+        if module in logged:
+            return
+
+        logged.add(module)
+        _LOGGER.warning(
+            "Detected a job of integration %s that blocked the event loop for "
+            "%.3f seconds: %s",
+            async_module_domain(hass, module),
+            duration,
+            getattr(target, "__qualname__", target),
+        )
+
+    hass.data[DOMAIN] = hass.loop_watchdog = LoopWatchdog(
+        conf[CONF_STALL_THRESHOLD], async_log_stall
+    )
+
+    hass.components.websocket_api.async_register_command(websocket_stats)
+    hass.async_create_task(
+        discovery.async_load_platform(hass, "sensor", DOMAIN, {}, config)
+    )
+
+    return True
+
+
+@callback
+def async_module_domain(hass: HomeAssistantType, module: str) -> str:
+    """Return the domain of the integration a module belongs to."""
+    return _module_domain(_pkg_paths(hass), module)
+
+
+@callback
+def async_domain_stats(hass: HomeAssistantType) -> Dict[str, Dict[str, Any]]:
+    """Return the time jobs kept the event loop busy per integration."""
+    watchdog: LoopWatchdog = hass.data[DOMAIN]
+    pkg_paths = _pkg_paths(hass)
+    domains: Dict[str, Dict[str, Any]] = {}
+
+    for module, stats in list(watchdog.stats.items()):
+        domain = _module_domain(pkg_paths, module)
+        info = domains.get(domain)
+
+        if info is None:
+            info = domains[domain] = {
+                "calls": 0,
+                "time": 0.0,
+                "max_time": 0.0,
+                "stalls": 0,
+            }
+
+        info["calls"] += stats.calls
+        info["time"] += stats.time
+        info["max_time"] = max(info["max_time"], stats.max_time)
+        info["stalls"] += stats.stalls
+
+    return dict(sorted(domains.items(), key=lambda item: item[1]["time"], reverse=True))
+
+
+def _pkg_paths(hass: HomeAssistantType) -> Dict[str, str]:
+    """Return the domains of the loaded integrations by package path."""
+    return {
+        integration.pkg_path: domain
+        for domain, integration in hass.data.get(loader.DATA_INTEGRATIONS, {}).items()
+        if isinstance(integration, loader.Integration)
+    }
+
+
+def _module_domain(pkg_paths: Dict[str, str], module: str) -> str:
+    """Return the domain of the integration package that contains a module.
+
+    Modules outside of integrations belong to their top level package.
+    """
+    parts = module.split(".")
+    for idx in range(len(parts), 0, -1):
+        domain = pkg_paths.get(".".join(parts[:idx]))
+        if domain is not None:
+            return domain
+
+    # Integrations that were imported without being loaded
+    for package in (loader.PACKAGE_BUILTIN, loader.PACKAGE_CUSTOM_COMPONENTS):
+        if module.startswith(f"{package}."):
+            return module[len(package) + 1 :].split(".", 1)[0]
+
+    if parts[0] == "homeassistant":
+        return CORE_DOMAIN
+
+    return parts[0]
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "loop_watchdog/stats"})
+def websocket_stats(
+    hass: HomeAssistantType, connection: websocket_api.ActiveConnection, msg: Dict
+) -> None:
+    """Return the event loop time per integration."""
+    connection.send_result(
+        msg["id"],
+        {
+            "stall_threshold": hass.data[DOMAIN].stall_threshold,
+            "domains": async_domain_stats(hass),
+        },
+    )
@@ -0,0 +1,7 @@
+"""Constants for the Loop Watchdog integration."""
+DOMAIN = "loop_watchdog"
+
+CONF_STALL_THRESHOLD = "stall_threshold"
+
+# Jobs from modules outside of integrations are counted for these
+CORE_DOMAIN = "homeassistant"
@@ -0,0 +1,67 @@
+"""Sensor with the time integrations kept the event loop busy."""
+from datetime import timedelta
+
+from homeassistant.const import TIME_SECONDS
+from homeassistant.helpers.entity import Entity
+
+from . import async_domain_stats
+
+SCAN_INTERVAL = timedelta(minutes=1)
+
+# Only the busiest integrations are kept in the state attributes
+MAX_DOMAINS = 10
+
+ICON = "mdi:timer-sand"
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the event loop time sensor."""
+    if discovery_info is None:
+        return
+
+    async_add_entities([LoopTimeSensor()], True)
+
+
+class LoopTimeSensor(Entity):
+    """Total time jobs kept the event loop busy, per integration as attributes."""
+
+    def __init__(self):
+        """Initialize the sensor."""
+        self._state = None
+        self._attributes = {}
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "Event loop busy time"
+
+    @property
+    def icon(self):
+        """Return the icon of the sensor."""
+        return ICON
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement of the sensor."""
+        return TIME_SECONDS
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    @property
+    def device_state_attributes(self):
+        """Return the busiest integrations."""
+        return self._attributes
+
+    async def async_update(self):
+        """Update the totals from the watchdog."""
+        domains = async_domain_stats(self.hass)
+
+        self._state = round(sum(info["time"] for info in domains.values()), 2)
+        self._attributes = {
+            domain: round(info["time"], 2)
+            for domain, info in list(domains.items())[:MAX_DOMAINS]
+        }
+        self._attributes["stalls"] = sum(info["stalls"] for info in domains.values())
@@ -74,6 +74,7 @@ from .debug_info import log_messages
 from .discovery import MQTT_DISCOVERY_UPDATED, clear_discovery_hash, set_discovery_hash
 from .models import Message, MessageCallbackType, PublishPayloadType
 from .subscription import async_subscribe_topics, async_unsubscribe_topics
+from .topic_trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -620,6 +621,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        self._subscription_index = TopicTrie()
         self.connected = False
         self._mqttc: mqtt.Client = None
         self._paho_lock = asyncio.Lock()
@@ -783,6 +785,7 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        self._subscription_index.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -794,8 +797,9 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
+            self._subscription_index.remove(topic, subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._subscription_index.has_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -889,10 +893,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
-
+        for subscription in self._subscription_index.iter_match(msg.topic):
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
@@ -942,20 +943,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
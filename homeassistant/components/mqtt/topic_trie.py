@@ -0,0 +1,128 @@
+"""Topic trie used to dispatch MQTT messages to subscriptions."""
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+class _TrieNode:
+    """A single topic level in the trie."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.items: List[Tuple[int, Any]] = []
+
+
+class TopicTrie:
+    """Index of items keyed by MQTT topic filters.
+
+    Items are stored on the node of the topic filter they were added with.
+    Looking up a topic walks the trie level by level and follows the exact
+    level, the single level wildcard and the multi level wildcard, making the
+    cost of a lookup proportional to the depth of the topic instead of the
+    number of stored filters. Matching follows the same rules as
+    paho.mqtt.matcher.MQTTMatcher.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TrieNode()
+        self._sequence = count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of items in the trie."""
+        return self._size
+
+    def add(self, topic_filter: str, item: Any) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TrieNode()
+            node = child
+        node.items.append((next(self._sequence), item))
+        self._size += 1
+
+    def remove(self, topic_filter: str, item: Any) -> None:
+        """Remove an item for a topic filter.
+
+        Raises ValueError if the item was not stored for the topic filter.
+        """
+        path = [self._root]
+        for level in topic_filter.split("/"):
+            child = path[-1].children.get(level)
+            if child is None:
+                raise ValueError(f"{item} is not stored for {topic_filter}")
+            path.append(child)
+
+        items = path[-1].items
+        for index, (_, stored) in enumerate(items):
+            if stored == item:
+                del items[index]
+                break
+        else:
+            raise ValueError(f"{item} is not stored for {topic_filter}")
+        self._size -= 1
+
+        # Prune nodes that no longer hold items or children.
+        levels = topic_filter.split("/")
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.items or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if any item is stored for exactly this topic filter."""
+        node: Optional[_TrieNode] = self._root
+        for level in topic_filter.split("/"):
+            node = node.children.get(level)  # type: ignore
+            if node is None:
+                return False
+        return bool(node.items)  # type: ignore
+
+    def iter_match(self, topic: str) -> Iterator[Any]:
+        """Iterate over the items whose topic filter matches the topic.
+
+        Items are returned in the order they were added.
+        """
+        matches: List[Tuple[int, Any]] = []
+        levels = topic.split("/")
+        # Wildcards at the first level do not match topics starting with $
+        wildcards_at_root = not topic.startswith("$")
+        last = len(levels)
+
+        def collect(node: _TrieNode, index: int) -> None:
+            children = node.children
+            if index == last:
+                matches.extend(node.items)
+            else:
+                child = children.get(levels[index])
+                if child is not None:
+                    collect(child, index + 1)
+                if index or wildcards_at_root:
+                    child = children.get(SINGLE_LEVEL_WILDCARD)
+                    if child is not None:
+                        collect(child, index + 1)
+            if index or wildcards_at_root:
+                child = children.get(MULTI_LEVEL_WILDCARD)
+                if child is not None:
+                    matches.extend(child.items)
+
+        collect(self._root, 0)
+
+        if len(matches) > 1:
+            matches.sort(key=_sequence_key)
+
+        return (item for _, item in matches)
+
+
+def _sequence_key(entry: Tuple[int, Any]) -> int:
+    """Return the insertion sequence of a stored entry."""
+    return entry[0]
@@ -3,6 +3,7 @@ import asyncio
 from collections import namedtuple
 import concurrent.futures
 from datetime import datetime
+from itertools import groupby
 import logging
 import queue
 import threading
@@ -35,7 +36,12 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import migration, purge
-from .const import DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
+from .const import (
+    DATA_INSTANCE,
+    DOMAIN,
+    EVENT_RECORDER_PURGE_PROGRESS,
+    SQLITE_URL_PREFIX,
+)
 from .models import Base, Events, RecorderRuns, States
 from .util import session_scope, validate_or_move_away_sqlite_database
 
@@ -58,6 +64,7 @@ DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
+MAX_BATCH_SIZE = 1000
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
@@ -227,6 +234,9 @@ class Recorder(threading.Thread):
         self._timechanges_seen = 0
         self._keepalive_count = 0
         self._old_state_ids = {}
+        self._pending_events = []
+        self._uncommitted_events = []
+        self.purge_progress = None
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -335,7 +345,16 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         while True:
+            # Write out the pending batch before blocking on an empty queue
+            if self._pending_events and self.queue.empty():
+                self._process_pending_events()
             event = self.queue.get()
+            if (
+                event is None
+                or isinstance(event, PurgeTask)
+                or event.event_type == EVENT_TIME_CHANGED
+            ):
+                self._process_pending_events()
             if event is None:
                 self._close_run()
                 self._close_connection()
@@ -359,7 +378,12 @@ class Recorder(threading.Thread):
                         self._timechanges_seen = 0
                         self._commit_event_session_or_retry()
                 continue
-            if event.event_type in self.exclude_t:
+            if (
+                event.event_type in self.exclude_t
+                # Recording the progress of a purge would add rows while it
+                # deletes them
+                or event.event_type == EVENT_RECORDER_PURGE_PROGRESS
+            ):
                 self.queue.task_done()
                 continue
 
@@ -369,47 +393,155 @@ class Recorder(threading.Thread):
                     self.queue.task_done()
                     continue
 
+            self._pending_events.append(event)
+            if len(self._pending_events) >= MAX_BATCH_SIZE:
+                self._process_pending_events()
+
+    def _process_pending_events(self):
+        """Write the pending batch of events and mark them done."""
+        if not self._pending_events:
+            return
+
+        rows = self._rows_from_events(self._pending_events)
+
+        try:
+            self._insert_rows(rows)
+            self._uncommitted_events.extend(event for event, _, _ in rows)
+        except exc.SQLAlchemyError as err:
+            _LOGGER.warning(
+                "Error adding a batch of %s events, retrying them one at a time: %s",
+                len(rows),
+                err,
+            )
+            # The rollback also drops the earlier batches that are not
+            # committed yet, so they are written again with this one
+            events = self._uncommitted_events + [event for event, _, _ in rows]
+            self._rollback_event_session()
+            self._insert_rows_one_at_a_time(self._rows_from_events(events))
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding events: %s", err)
+            events = self._uncommitted_events
+            self._rollback_event_session()
+            self._insert_rows_one_at_a_time(self._rows_from_events(events))
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+        for _ in self._pending_events:
+            self.queue.task_done()
+        self._pending_events = []
+
+    def _rows_from_events(self, events):
+        """Return the rows to insert for each event.
+
+        An event that cannot be converted is logged and left out, without
+        affecting the other events of the batch.
+        """
+        rows = []
+
+        for event in events:
             try:
-                dbevent = Events.from_event(event)
-                if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
-                self.event_session.add(dbevent)
-                self.event_session.flush()
-            except (TypeError, ValueError):
-                _LOGGER.warning("Event is not JSON serializable: %s", event)
-            except Exception as err:  # pylint: disable=broad-except
-                # Must catch the exception to prevent the loop from collapsing
-                _LOGGER.exception("Error adding event: %s", err)
+                if event.event_type != EVENT_STATE_CHANGED:
+                    try:
+                        rows.append((event, Events.from_event(event), None))
+                    except (TypeError, ValueError):
+                        _LOGGER.warning("Event is not JSON serializable: %s", event)
+                    continue
 
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
+                # The state is stored in the states table, not in the event data
+                dbevent = Events.from_event(event, event_data="{}")
                 try:
                     dbstate = States.from_event(event)
-                    has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
-                    if not has_new_state:
-                        dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
-                    self.event_session.add(dbstate)
-                    self.event_session.flush()
-                    if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
                 except (TypeError, ValueError):
                     _LOGGER.warning(
                         "State is not JSON serializable: %s",
                         event.data.get("new_state"),
                     )
-                except Exception as err:  # pylint: disable=broad-except
-                    # Must catch the exception to prevent the loop from collapsing
-                    _LOGGER.exception("Error adding state change: %s", err)
+                    dbstate = None
+                rows.append((event, dbevent, dbstate))
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Error converting event %s: %s", event, err)
 
-            # If they do not have a commit interval
-            # than we commit right away
-            if not self.commit_interval:
-                self._commit_event_session_or_retry()
+        return rows
 
-            self.queue.task_done()
+    def _insert_rows_one_at_a_time(self, rows):
+        """Insert and commit the rows of each event on its own.
+
+        Used after a batch failed, so only the events the database refuses
+        are lost.
+        """
+        for row in rows:
+            old_state_ids = dict(self._old_state_ids)
+            try:
+                self._insert_rows([row])
+                self.event_session.commit()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Error adding event %s: %s", row[0], err)
+                self._rollback_event_session()
+                # The states of the rows before it are committed
+                self._old_state_ids.update(old_state_ids)
+
+    def _rollback_event_session(self):
+        """Roll back the event session after a failed insert."""
+        try:
+            self.event_session.rollback()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Error rolling back the event session: %s", err)
+        # The rolled back states may be linked from the next ones
+        self._old_state_ids.clear()
+        self._uncommitted_events = []
+
+    def _insert_rows(self, rows):
+        """Bulk insert the rows of a batch of events.
+
+        Events are inserted in firing order, so their event_ids follow it.
+        A run of events that nothing refers to is inserted with a single
+        executemany. State changes need their ids back: the event_id for the
+        state row and the state_id to link the next state of the same entity.
+        SQLAlchemy inserts rows one at a time to return their ids. Their
+        states are inserted in rounds, so every state in a round can resolve
+        its old_state_id from an earlier round or an earlier batch.
+        """
+        state_changes = []
+        for is_state_change, run in groupby(rows, lambda row: row[2] is not None):
+            run = list(run)
+            self.event_session.bulk_save_objects(
+                [dbevent for _, dbevent, _ in run], return_defaults=is_state_change
+            )
+            if is_state_change:
+                state_changes.extend(run)
+
+        if not state_changes:
+            return
+
+        rounds = []
+        depth = {}
+        for event, dbevent, dbstate in state_changes:
+            dbstate.event_id = dbevent.event_id
+            idx = depth.get(dbstate.entity_id, 0)
+            depth[dbstate.entity_id] = idx + 1
+            if idx == len(rounds):
+                rounds.append([])
+            rounds[idx].append((event, dbstate))
+
+        for states in rounds:
+            for event, dbstate in states:
+                dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+                if not event.data.get("new_state"):
+                    dbstate.state = None
+
+            self.event_session.bulk_save_objects(
+                [dbstate for _, dbstate in states], return_defaults=True
+            )
+
+            for event, dbstate in states:
+                if event.data.get("new_state"):
+                    self._old_state_ids[dbstate.entity_id] = dbstate.state_id
+                else:
+                    self._old_state_ids.pop(dbstate.entity_id, None)
 
     def _send_keep_alive(self):
         try:
@@ -461,6 +593,7 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        self._uncommitted_events = []
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -486,6 +619,8 @@ class Recorder(threading.Thread):
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
             raise
+        finally:
+            self._uncommitted_events = []
 
     @callback
     def event_listener(self, event):
@@ -3,3 +3,5 @@
 DATA_INSTANCE = "recorder_instance"
 SQLITE_URL_PREFIX = "sqlite://"
 DOMAIN = "recorder"
+
+EVENT_RECORDER_PURGE_PROGRESS = "recorder_purge_progress"
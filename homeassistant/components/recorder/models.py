@@ -52,11 +52,16 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
-        """Create an event database object from a native event."""
+    def from_event(event, event_data=None):
+        """Create an event database object from a native event.
+
+        The event data is serialized unless it is passed in already encoded.
+        """
+        if event_data is None:
+            event_data = json.dumps(event.data, cls=JSONEncoder)
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data,
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -124,7 +129,9 @@ class States(Base):  # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            dbstate.attributes = json.dumps(
+                state.as_dict()["attributes"], cls=JSONEncoder
+            )
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
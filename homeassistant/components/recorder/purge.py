@@ -7,61 +7,94 @@ from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
+from .const import EVENT_RECORDER_PURGE_PROGRESS
 from .models import Events, RecorderRuns, States
-from .util import execute, session_scope
+from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Max number of rows deleted from a table in a single purge pass
+PURGE_CHUNK_SIZE = 1000
+
+
+class PurgeProgress:
+    """Keep track of a purge across its passes."""
+
+    def __init__(self, purge_days, state_ids, event_ids):
+        """Initialize the progress with the (first, last) ids to purge."""
+        self.purge_days = purge_days
+        self.state_ids = state_ids
+        self.event_ids = event_ids
+        self.deleted_states = 0
+        self.deleted_events = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        """Return the rate at which rows have been deleted."""
+        if not self.elapsed:
+            return 0.0
+        return (self.deleted_states + self.deleted_events) / self.elapsed
+
+    @property
+    def remaining(self):
+        """Return an estimate of the number of rows left to purge.
+
+        The estimate is based on the range of ids that is left, so it is an
+        upper bound when ids have gaps.
+        """
+        return sum(
+            max(last - first + 1, 0)
+            for first, last in (self.state_ids, self.event_ids)
+            if first is not None
+        )
+
+    def as_dict(self):
+        """Return the progress as a dictionary."""
+        return {
+            "deleted_states": self.deleted_states,
+            "deleted_events": self.deleted_events,
+            "rows_per_second": round(self.rows_per_second, 1),
+            "remaining": self.remaining,
+        }
+
 
 def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Every call deletes at most PURGE_CHUNK_SIZE rows so the recorder can
+    process the events queued in the meantime before the next pass. States
+    are purged before events as they refer to them.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging states and events before target %s", purge_before)
 
     try:
         with session_scope(session=instance.get_session()) as session:
-            # Purge a max of 1 hour, based on the oldest states or events record
-            batch_purge_before = purge_before
-
-            query = session.query(States).order_by(States.last_updated.asc()).limit(1)
-            states = execute(query, to_native=True, validate_entity_ids=False)
-            if states:
-                batch_purge_before = min(
-                    batch_purge_before, states[0].last_updated + timedelta(hours=1),
-                )
-
-            query = session.query(Events).order_by(Events.time_fired.asc()).limit(1)
-            events = execute(query, to_native=True)
-            if events:
-                batch_purge_before = min(
-                    batch_purge_before, events[0].time_fired + timedelta(hours=1),
+            progress = instance.purge_progress
+            if progress is None or progress.purge_days != purge_days:
+                progress = instance.purge_progress = PurgeProgress(
+                    purge_days,
+                    _id_range(
+                        session, States.state_id, States.last_updated, purge_before
+                    ),
+                    _id_range(
+                        session, Events.event_id, Events.time_fired, purge_before
+                    ),
                 )
 
-            _LOGGER.debug("Purging states and events before %s", batch_purge_before)
+            timer_start = time.perf_counter()
+            deleted = _purge_chunk(session, progress, purge_before)
 
-            deleted_rows = (
-                session.query(States)
-                .filter(States.last_updated < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
-
-            deleted_rows = (
-                session.query(Events)
-                .filter(Events.time_fired < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
+        # The chunk is committed when the session scope ends
+        progress.elapsed += time.perf_counter() - timer_start
 
-            # If states or events purging isn't processing the purge_before yet,
-            # return false, as we are not done yet.
-            if batch_purge_before != purge_before:
-                _LOGGER.debug("Purging hasn't fully completed yet")
-                return False
+        if deleted:
+            _LOGGER.debug("Purging hasn't fully completed yet")
+            instance.hass.bus.fire(EVENT_RECORDER_PURGE_PROGRESS, progress.as_dict())
+            return False
 
+        with session_scope(session=instance.get_session()) as session:
             # Recorder runs is small, no need to batch run it
             deleted_rows = (
                 session.query(RecorderRuns)
@@ -70,6 +103,15 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             )
             _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
+        instance.purge_progress = None
+        _LOGGER.debug(
+            "Purged %s states and %s events at %.1f rows/s",
+            progress.deleted_states,
+            progress.deleted_events,
+            progress.rows_per_second,
+        )
+        instance.hass.bus.fire(EVENT_RECORDER_PURGE_PROGRESS, progress.as_dict())
+
         if repack:
             # Execute sqlite or postgresql vacuum command to free up space on disk
             if instance.engine.driver in ("pysqlite", "postgresql"):
@@ -97,4 +139,68 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
         _LOGGER.warning("Error purging history: %s", err)
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s", err)
+    instance.purge_progress = None
     return True
+
+
+def _purge_chunk(session, progress, purge_before):
+    """Delete the next chunk of states, or events once all states are gone.
+
+    Return the number of deleted rows.
+    """
+    state_ids = _ids_to_purge(
+        session, States.state_id, States.last_updated, purge_before
+    )
+    if state_ids:
+        deleted_rows = (
+            session.query(States)
+            .filter(States.state_id.in_(state_ids))
+            .delete(synchronize_session=False)
+        )
+        _LOGGER.debug("Deleted %s states", deleted_rows)
+        progress.deleted_states += deleted_rows
+        progress.state_ids = _advance(progress.state_ids, state_ids)
+        return deleted_rows
+
+    event_ids = _ids_to_purge(session, Events.event_id, Events.time_fired, purge_before)
+    if event_ids:
+        deleted_rows = (
+            session.query(Events)
+            .filter(Events.event_id.in_(event_ids))
+            .delete(synchronize_session=False)
+        )
+        _LOGGER.debug("Deleted %s events", deleted_rows)
+        progress.deleted_events += deleted_rows
+        progress.event_ids = _advance(progress.event_ids, event_ids)
+        return deleted_rows
+
+    return 0
+
+
+def _ids_to_purge(session, id_column, time_column, purge_before):
+    """Return the ids of the oldest chunk of rows before purge_before.
+
+    Walks the index on the time column and only fetches the primary keys.
+    """
+    return [
+        row[0]
+        for row in session.query(id_column)
+        .filter(time_column < purge_before)
+        .order_by(time_column.asc())
+        .limit(PURGE_CHUNK_SIZE)
+    ]
+
+
+def _id_range(session, id_column, time_column, purge_before):
+    """Return the (first, last) ids of the rows before purge_before."""
+    query = session.query(id_column).filter(time_column < purge_before)
+    first = query.order_by(time_column.asc()).limit(1).scalar()
+    last = query.order_by(time_column.desc()).limit(1).scalar()
+    return (first, last)
+
+
+def _advance(id_range, deleted_ids):
+    """Move the start of an id range past the deleted ids."""
+    if id_range[0] is None:
+        return id_range
+    return (max(id_range[0], max(deleted_ids) + 1), id_range[1])
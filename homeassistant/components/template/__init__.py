@@ -3,7 +3,12 @@
 from itertools import chain
 import logging
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.core import callback
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_template_result,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,43 +23,44 @@ def initialise_templates(hass, templates, attribute_templates=None):
         template.hass = hass
 
 
-def extract_entities(
-    device_name, device_type, manual_entity_ids, templates, attribute_templates=None
-):
-    """Extract entity ids from templates and attribute templates."""
-    if attribute_templates is None:
-        attribute_templates = {}
-    entity_ids = set()
-    if manual_entity_ids is None:
-        invalid_templates = []
-        for template_name, template in chain(
-            templates.items(), attribute_templates.items()
-        ):
-            if template is None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-
-            if template_entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-            else:
-                invalid_templates.append(template_name.replace("_template", ""))
-
-        entity_ids = list(entity_ids)
-
-        if invalid_templates:
-            if not entity_ids:
-                entity_ids = MATCH_ALL
-            _LOGGER.warning(
-                "Template %s '%s' has no entity ids configured to track nor"
-                " were we able to extract the entities to track from the %s "
-                "template(s). This entity will only be able to be updated "
-                "manually",
-                device_type,
-                device_name,
-                ", ".join(invalid_templates),
+@callback
+def async_track_templates(entity, manual_entity_ids, templates, action):
+    """Call action when the result of one of the templates of an entity changes.
+
+    Each template is tracked by the states it accessed during its last render.
+    If entity ids are configured manually, their state changes call the action
+    instead. The listeners are removed together with the entity.
+    """
+    if manual_entity_ids is not None:
+
+        @callback
+        def state_listener(event):
+            """Handle a state change of a configured entity."""
+            action()
+
+        entity.async_on_remove(
+            async_track_state_change_event(
+                entity.hass, manual_entity_ids, state_listener
             )
-    else:
-        entity_ids = manual_entity_ids
+        )
+        return
+
+    @callback
+    def result_listener(event, last_result, result):
+        """Handle a new result of a template."""
+        if _same_result(last_result, result):
+            return
+        action()
+
+    for template in templates:
+        if template is None:
+            continue
+        info = async_track_template_result(entity.hass, template, result_listener)
+        entity.async_on_remove(info.async_remove)
+
 
-    return entity_ids
+def _same_result(last_result, result):
+    """Return if two renders of a template have the same outcome."""
+    if isinstance(last_result, TemplateError) or isinstance(result, TemplateError):
+        return type(last_result) is type(result) and str(last_result) == str(result)
+    return last_result == result
@@ -20,7 +20,6 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     STATE_ALARM_ARMED_AWAY,
     STATE_ALARM_ARMED_HOME,
     STATE_ALARM_ARMED_NIGHT,
@@ -33,9 +32,10 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import Script
 
+from . import async_track_templates
+
 _LOGGER = logging.getLogger(__name__)
 _VALID_STATES = [
     STATE_ALARM_ARMED_AWAY,
@@ -90,18 +90,9 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         code_arm_required = device_config[CONF_CODE_ARM_REQUIRED]
         unique_id = device_config.get(CONF_UNIQUE_ID)
 
-        template_entity_ids = set()
-
-        if state_template is not None:
-            temp_ids = state_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-        else:
+        if state_template is None:
             _LOGGER.warning("No value template - will use optimistic state")
 
-        if not template_entity_ids:
-            template_entity_ids = MATCH_ALL
-
         alarm_control_panels.append(
             AlarmControlPanelTemplate(
                 hass,
@@ -113,7 +104,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 arm_home_action,
                 arm_night_action,
                 code_arm_required,
-                template_entity_ids,
                 unique_id,
             )
         )
@@ -135,7 +125,6 @@ class AlarmControlPanelTemplate(AlarmControlPanelEntity):
         arm_home_action,
         arm_night_action,
         code_arm_required,
-        template_entity_ids,
         unique_id,
     ):
         """Initialize the panel."""
@@ -160,7 +149,6 @@ class AlarmControlPanelTemplate(AlarmControlPanelEntity):
             self._arm_night_script = Script(hass, arm_night_action)
 
         self._state = None
-        self._entities = template_entity_ids
         self._unique_id = unique_id
 
         if self._template is not None:
@@ -215,18 +203,16 @@ class AlarmControlPanelTemplate(AlarmControlPanelEntity):
         """Register callbacks."""
 
         @callback
-        def template_alarm_state_listener(event):
-            """Handle target device state changes."""
+        def template_alarm_state_listener():
+            """Handle changes of the template result."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_alarm_control_panel_startup(event):
             """Update template on startup."""
-            if self._template is not None and self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change_event(
-                    self.hass, self._entities, template_alarm_state_listener
-                )
+            async_track_templates(
+                self, None, (self._template,), template_alarm_state_listener
+            )
 
             self.async_schedule_update_ha_state(True)
 
@@ -19,18 +19,15 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_point_in_utc_time
+import homeassistant.util.dt as dt_util
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,13 +82,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates, attribute_templates)
-        entity_ids = extract_entities(
-            device,
-            "binary sensor",
-            device_config.get(ATTR_ENTITY_ID),
-            templates,
-            attribute_templates,
-        )
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
 
         sensors.append(
             BinarySensorTemplate(
@@ -148,6 +139,8 @@ class BinarySensorTemplate(BinarySensorEntity):
         self._entities = entity_ids
         self._delay_on = delay_on
         self._delay_off = delay_off
+        self._delay_state = None
+        self._delay_cancel = None
         self._available = True
         self._attribute_templates = attribute_templates
         self._attributes = {}
@@ -156,19 +149,21 @@ class BinarySensorTemplate(BinarySensorEntity):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_bsensor_state_listener(event):
-            """Handle the target device state changes."""
-            self.async_check_state()
-
         @callback
         def template_bsensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change_event(
-                    self.hass, self._entities, template_bsensor_state_listener
-                )
+            async_track_templates(
+                self,
+                self._entities,
+                (
+                    self._template,
+                    self._icon_template,
+                    self._entity_picture_template,
+                    self._availability_template,
+                    *(self._attribute_templates or {}).values(),
+                ),
+                self.async_check_state,
+            )
 
             self.async_check_state()
 
@@ -289,13 +284,25 @@ class BinarySensorTemplate(BinarySensorEntity):
         """Update the state from the template."""
         state = self._async_render()
 
-        # return if the state don't change or is invalid
-        if state is None or state == self.state:
+        # return if the state is invalid or already waiting for its delay
+        if state is None or (
+            self._delay_cancel is not None and state == self._delay_state
+        ):
+            return
+
+        # the template changed before the delay of the last state passed
+        if self._delay_cancel is not None:
+            self._delay_cancel()
+            self._delay_cancel = None
+
+        # return if the state don't change
+        if state == self.state:
             return
 
         @callback
-        def set_state():
+        def set_state(now=None):
             """Set state of template binary sensor."""
+            self._delay_cancel = None
             self._state = state
             self.async_write_ha_state()
 
@@ -305,12 +312,9 @@ class BinarySensorTemplate(BinarySensorEntity):
             return
 
         period = self._delay_on if state else self._delay_off
-        async_track_same_state(
-            self.hass,
-            period,
-            set_state,
-            entity_ids=self._entities,
-            async_check_same_func=lambda *args: self._async_render() == state,
+        self._delay_state = state
+        self._delay_cancel = async_track_point_in_utc_time(
+            self.hass, set_state, dt_util.utcnow() + period
         )
 
     async def async_update(self):
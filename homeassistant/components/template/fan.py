@@ -24,7 +24,6 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
@@ -36,7 +35,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.script import Script
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -113,7 +112,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates)
-        entity_ids = extract_entities(device, "fan", None, templates)
 
         fans.append(
             TemplateFan(
@@ -131,7 +129,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 set_oscillating_action,
                 set_direction_action,
                 speed_list,
-                entity_ids,
                 unique_id,
             )
         )
@@ -158,7 +155,6 @@ class TemplateFan(FanEntity):
         set_oscillating_action,
         set_direction_action,
         speed_list,
-        entity_ids,
         unique_id,
     ):
         """Initialize the fan."""
@@ -203,7 +199,6 @@ class TemplateFan(FanEntity):
         if self._direction_template:
             self._supported_features |= SUPPORT_DIRECTION
 
-        self._entities = entity_ids
         self._unique_id = unique_id
 
         # List of valid speeds
@@ -327,18 +322,25 @@ class TemplateFan(FanEntity):
         """Register callbacks."""
 
         @callback
-        def template_fan_state_listener(event):
-            """Handle target device state changes."""
+        def template_fan_state_listener():
+            """Handle changes of the template results."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_fan_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                self.hass.helpers.event.async_track_state_change_event(
-                    self._entities, template_fan_state_listener
-                )
+            async_track_templates(
+                self,
+                None,
+                (
+                    self._template,
+                    self._speed_template,
+                    self._oscillating_template,
+                    self._direction_template,
+                    self._availability_template,
+                ),
+                template_fan_state_listener,
+            )
 
             self.async_schedule_update_ha_state(True)
 
@@ -24,7 +24,6 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     STATE_OFF,
     STATE_ON,
 )
@@ -33,10 +32,9 @@ from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import PLATFORM_SCHEMA
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import Script
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -120,9 +118,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates)
-        entity_ids = extract_entities(
-            device, "light", device_config.get(CONF_ENTITY_ID), templates
-        )
+        entity_ids = device_config.get(CONF_ENTITY_ID)
 
         lights.append(
             LightTemplate(
@@ -289,26 +285,28 @@ class LightTemplate(LightEntity):
         """Register callbacks."""
 
         @callback
-        def template_light_state_listener(event):
-            """Handle target device state changes."""
+        def template_light_state_listener():
+            """Handle changes of the template results."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_light_startup(event):
             """Update template on startup."""
-            if (
-                self._template is not None
-                or self._level_template is not None
-                or self._temperature_template is not None
-                or self._color_template is not None
-                or self._white_value_template is not None
-                or self._availability_template is not None
-            ):
-                if self._entities != MATCH_ALL:
-                    # Track state change only for valid templates
-                    async_track_state_change_event(
-                        self.hass, self._entities, template_light_state_listener
-                    )
+            async_track_templates(
+                self,
+                self._entities,
+                (
+                    self._template,
+                    self._icon_template,
+                    self._entity_picture_template,
+                    self._availability_template,
+                    self._level_template,
+                    self._temperature_template,
+                    self._color_template,
+                    self._white_value_template,
+                ),
+                template_light_state_listener,
+            )
 
             self.async_schedule_update_ha_state(True)
 
@@ -10,17 +10,15 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     STATE_LOCKED,
     STATE_ON,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import Script
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,7 +54,6 @@ async def async_setup_platform(hass, config, async_add_devices, discovery_info=N
     }
 
     initialise_templates(hass, templates)
-    entity_ids = extract_entities(device, "lock", None, templates)
 
     async_add_devices(
         [
@@ -65,7 +62,6 @@ async def async_setup_platform(hass, config, async_add_devices, discovery_info=N
                 device,
                 value_template,
                 availability_template,
-                entity_ids,
                 config.get(CONF_LOCK),
                 config.get(CONF_UNLOCK),
                 config.get(CONF_OPTIMISTIC),
@@ -84,7 +80,6 @@ class TemplateLock(LockEntity):
         name,
         value_template,
         availability_template,
-        entity_ids,
         command_lock,
         command_unlock,
         optimistic,
@@ -96,7 +91,6 @@ class TemplateLock(LockEntity):
         self._name = name
         self._state_template = value_template
         self._availability_template = availability_template
-        self._state_entities = entity_ids
         self._command_lock = Script(hass, command_lock)
         self._command_unlock = Script(hass, command_unlock)
         self._optimistic = optimistic
@@ -107,18 +101,19 @@ class TemplateLock(LockEntity):
         """Register callbacks."""
 
         @callback
-        def template_lock_state_listener(event):
-            """Handle target device state changes."""
+        def template_lock_state_listener():
+            """Handle changes of the template results."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_lock_startup(event):
             """Update template on startup."""
-            if self._state_entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change_event(
-                    self._hass, self._state_entities, template_lock_state_listener
-                )
+            async_track_templates(
+                self,
+                None,
+                (self._state_template, self._availability_template),
+                template_lock_state_listener,
+            )
             self.async_schedule_update_ha_state(True)
 
         self._hass.bus.async_listen_once(
@@ -21,15 +21,13 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change_event
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 CONF_ATTRIBUTE_TEMPLATES = "attribute_templates"
@@ -84,13 +82,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates, attribute_templates)
-        entity_ids = extract_entities(
-            device,
-            "sensor",
-            device_config.get(ATTR_ENTITY_ID),
-            templates,
-            attribute_templates,
-        )
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
 
         sensors.append(
             SensorTemplate(
@@ -160,18 +152,26 @@ class SensorTemplate(Entity):
         """Register callbacks."""
 
         @callback
-        def template_sensor_state_listener(event):
-            """Handle device state changes."""
+        def template_sensor_state_listener():
+            """Handle changes of the template results."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change_event(
-                    self.hass, self._entities, template_sensor_state_listener
-                )
+            async_track_templates(
+                self,
+                self._entities,
+                (
+                    self._template,
+                    self._icon_template,
+                    self._entity_picture_template,
+                    self._friendly_name_template,
+                    self._availability_template,
+                    *self._attribute_templates.values(),
+                ),
+                template_sensor_state_listener,
+            )
 
             self.async_schedule_update_ha_state(True)
 
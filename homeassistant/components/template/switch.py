@@ -17,7 +17,6 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     STATE_OFF,
     STATE_ON,
 )
@@ -25,11 +24,10 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import Script
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -79,9 +77,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates)
-        entity_ids = extract_entities(
-            device, "switch", device_config.get(ATTR_ENTITY_ID), templates
-        )
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
 
         switches.append(
             SwitchTemplate(
@@ -154,18 +150,24 @@ class SwitchTemplate(SwitchEntity, RestoreEntity):
 
         # set up event listening
         @callback
-        def template_switch_state_listener(event):
-            """Handle target device state changes."""
+        def template_switch_state_listener():
+            """Handle changes of the template results."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_switch_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change_event(
-                    self.hass, self._entities, template_switch_state_listener
-                )
+            async_track_templates(
+                self,
+                self._entities,
+                (
+                    self._template,
+                    self._icon_template,
+                    self._entity_picture_template,
+                    self._availability_template,
+                ),
+                template_switch_state_listener,
+            )
 
             self.async_schedule_update_ha_state(True)
 
@@ -36,7 +36,6 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     STATE_UNKNOWN,
 )
 from homeassistant.core import callback
@@ -45,7 +44,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.script import Script
 
-from . import extract_entities, initialise_templates
+from . import async_track_templates, initialise_templates
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -126,9 +125,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         }
 
         initialise_templates(hass, templates, attribute_templates)
-        entity_ids = extract_entities(
-            device, "vacuum", None, templates, attribute_templates
-        )
 
         vacuums.append(
             TemplateVacuum(
@@ -147,7 +143,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 locate_action,
                 set_fan_speed_action,
                 fan_speed_list,
-                entity_ids,
                 attribute_templates,
                 unique_id,
             )
@@ -176,7 +171,6 @@ class TemplateVacuum(StateVacuumEntity):
         locate_action,
         set_fan_speed_action,
         fan_speed_list,
-        entity_ids,
         attribute_templates,
         unique_id,
     ):
@@ -237,7 +231,6 @@ class TemplateVacuum(StateVacuumEntity):
         if self._battery_level_template:
             self._supported_features |= SUPPORT_BATTERY
 
-        self._entities = entity_ids
         self._unique_id = unique_id
 
         # List of valid fan speeds
@@ -353,18 +346,25 @@ class TemplateVacuum(StateVacuumEntity):
         """Register callbacks."""
 
         @callback
-        def template_vacuum_state_listener(event):
-            """Handle target device state changes."""
+        def template_vacuum_state_listener():
+            """Handle changes of the template results."""
             self.async_schedule_update_ha_state(True)
 
         @callback
         def template_vacuum_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state changes only for valid templates
-                self.hass.helpers.event.async_track_state_change_event(
-                    self._entities, template_vacuum_state_listener
-                )
+            async_track_templates(
+                self,
+                None,
+                (
+                    self._template,
+                    self._battery_level_template,
+                    self._fan_speed_template,
+                    self._availability_template,
+                    *(self._attribute_templates or {}).values(),
+                ),
+                template_vacuum_state_listener,
+            )
 
             self.async_schedule_update_ha_state(True)
 
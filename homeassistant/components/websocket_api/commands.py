@@ -65,7 +65,7 @@ def handle_subscribe_events(hass, connection, msg):
             ):
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event))
+            connection.send_message(messages.cached_event_message(msg["id"], event))
 
     else:
 
@@ -75,7 +75,7 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+            connection.send_message(messages.cached_event_message(msg["id"], event))
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events
@@ -171,7 +171,15 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        # Reuse the JSON each state caches instead of serializing them again
+        states_json = f"[{','.join(state.as_json() for state in states)}]"
+    except (ValueError, TypeError):
+        # Let the message serialization report the bad data
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(messages.result_message_json(msg["id"], states_json))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
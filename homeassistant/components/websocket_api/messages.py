@@ -1,13 +1,27 @@
 """Message templates for websocket commands."""
 
+from functools import lru_cache
+import logging
+from typing import Any
+
 import voluptuous as vol
 
+from homeassistant.core import Event
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util.json import (
+    find_paths_unserializable_data,
+    format_unserializable_data,
+)
 
 from . import const
 
+_LOGGER = logging.getLogger(__name__)
+
 # mypy: allow-untyped-defs
 
+IDEN_TEMPLATE = "__IDEN__"
+IDEN_JSON_TEMPLATE = '"__IDEN__"'
+
 # Minimal requirements of a message
 MINIMAL_MESSAGE_SCHEMA = vol.Schema(
     {vol.Required("id"): cv.positive_int, vol.Required("type"): cv.string},
@@ -23,6 +37,14 @@ def result_message(iden, result=None):
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def result_message_json(iden: int, result_json: str) -> str:
+    """Return a success result message with a result that is already json."""
+    return (
+        f'{{"id": {iden}, "type": "{const.TYPE_RESULT}", '
+        f'"success": true, "result": {result_json}}}'
+    )
+
+
 def error_message(iden, code, message):
     """Return an error result message."""
     return {
@@ -36,3 +58,43 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def cached_event_message(iden: int, event: Event) -> str:
+    """Return an event message.
+
+    Serialize to json once per message.
+
+    Since we can have many clients connected that are
+    all getting many of the same events (mostly state changed)
+    we can avoid serializing the same data for each connection.
+    """
+    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+@lru_cache(maxsize=128)
+def _cached_event_message(event: Event) -> str:
+    """Cache and serialize the event to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_event_message
+    """
+    return message_to_json(event_message(IDEN_TEMPLATE, event))
+
+
+def message_to_json(message: Any) -> str:
+    """Serialize a websocket message to json."""
+    try:
+        return const.JSON_DUMP(message)
+    except (ValueError, TypeError):
+        _LOGGER.error(
+            "Unable to serialize to JSON. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(message, dump=const.JSON_DUMP)
+            ),
+        )
+        return const.JSON_DUMP(
+            error_message(
+                message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+            )
+        )
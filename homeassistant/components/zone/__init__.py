@@ -16,6 +16,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
 )
@@ -33,6 +34,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .spatial_index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -86,6 +88,8 @@ RELOAD_SERVICE_SCHEMA = vol.Schema({})
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
+DATA_ZONE_INDEX = "zone_index"
+
 
 @bind_hass
 def async_active_zone(
@@ -95,19 +99,14 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    # Candidates are sorted by entity ID so that we are deterministic if
+    # equal distance to 2 zones
+    zones = _async_get_zone_index(hass).candidates(latitude, longitude, radius)
 
     min_dist = None
     closest = None
 
     for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
-            continue
-
         zone_dist = distance(
             latitude,
             longitude,
@@ -133,6 +132,28 @@ def async_active_zone(
     return closest
 
 
+@callback
+def _async_get_zone_index(hass: HomeAssistant) -> ZoneIndex:
+    """Return the index of active zones, rebuilt after zones change."""
+    index: Optional[ZoneIndex] = hass.data.get(DATA_ZONE_INDEX)
+
+    if index is not None:
+        return index
+
+    if DATA_ZONE_INDEX not in hass.data:
+
+        @callback
+        def _async_zone_changed(event: Event) -> None:
+            """Drop the index when a zone changes."""
+            if event.data["entity_id"].startswith(f"{DOMAIN}."):
+                hass.data[DATA_ZONE_INDEX] = None
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _async_zone_changed)
+
+    index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(hass.states.async_all(DOMAIN))
+    return index
+
+
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
     """Test if given latitude, longitude is in given zone.
 
@@ -0,0 +1,111 @@
+"""Grid index to find the zones near a location."""
+import math
+from typing import Dict, List, Optional, Tuple
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, STATE_UNAVAILABLE
+from homeassistant.core import State
+
+from .const import ATTR_PASSIVE, ATTR_RADIUS
+
+# Size of a grid cell in degrees, about 1 km at the equator
+CELL_SIZE = 0.01
+LONGITUDE_CELLS = round(360 / CELL_SIZE)
+
+# Areas covering more cells than this are not worth indexing
+MAX_CELLS = 400
+
+# Lower bounds of the meters per degree on the WGS-84 ellipsoid, with a
+# margin, so bounding boxes never miss a point within the distance.
+METERS_PER_DEGREE_LATITUDE = 110000
+METERS_PER_DEGREE_LONGITUDE = 111000
+
+Cell = Tuple[int, int]
+
+
+def _cells(latitude: float, longitude: float, radius: float) -> Optional[List[Cell]]:
+    """Return the cells of the bounding box of a circle.
+
+    Returns None if the box crosses a pole or covers too many cells.
+    """
+    lat_span = radius / METERS_PER_DEGREE_LATITUDE
+    min_lat = latitude - lat_span
+    max_lat = latitude + lat_span
+
+    if min_lat <= -90 or max_lat >= 90:
+        return None
+
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    lon_span = radius / (METERS_PER_DEGREE_LONGITUDE * cos_lat)
+
+    if lon_span >= 180:
+        return None
+
+    lat_first = math.floor(min_lat / CELL_SIZE)
+    lat_last = math.floor(max_lat / CELL_SIZE)
+    lon_first = math.floor((longitude - lon_span) / CELL_SIZE)
+    lon_last = math.floor((longitude + lon_span) / CELL_SIZE)
+
+    if (lat_last - lat_first + 1) * (lon_last - lon_first + 1) > MAX_CELLS:
+        return None
+
+    # Wrap around the antimeridian
+    return [
+        (lat_idx, lon_idx % LONGITUDE_CELLS)
+        for lat_idx in range(lat_first, lat_last + 1)
+        for lon_idx in range(lon_first, lon_last + 1)
+    ]
+
+
+class ZoneIndex:
+    """Index of the active zones in a grid of latitude and longitude cells.
+
+    Each zone is added to the cells overlapping the bounding box of its
+    radius. Zones too large to index are always returned as candidates.
+    """
+
+    def __init__(self, zones: List[State]) -> None:
+        """Build the index from zone states."""
+        self._zones: List[State] = []
+        self._grid: Dict[Cell, List[State]] = {}
+        self._unindexed: List[State] = []
+
+        for zone in sorted(zones, key=lambda state: state.entity_id):
+            if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+                continue
+
+            self._zones.append(zone)
+
+            try:
+                cells = _cells(
+                    float(zone.attributes[ATTR_LATITUDE]),
+                    float(zone.attributes[ATTR_LONGITUDE]),
+                    max(float(zone.attributes[ATTR_RADIUS]), 0),
+                )
+            except (KeyError, TypeError, ValueError):
+                cells = None
+
+            if cells is None:
+                self._unindexed.append(zone)
+                continue
+
+            for cell in cells:
+                self._grid.setdefault(cell, []).append(zone)
+
+    def candidates(
+        self, latitude: Optional[float], longitude: Optional[float], radius: float = 0
+    ) -> List[State]:
+        """Return the zones that may contain a location, sorted by entity_id."""
+        if latitude is None or longitude is None:
+            return self._zones
+
+        cells = _cells(latitude, longitude, max(radius, 0))
+
+        if cells is None:
+            return self._zones
+
+        found = {zone.entity_id: zone for zone in self._unindexed}
+        for cell in cells:
+            for zone in self._grid.get(cell, ()):
+                found[zone.entity_id] = zone
+
+        return [found[entity_id] for entity_id in sorted(found)]
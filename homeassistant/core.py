@@ -9,6 +9,7 @@ import datetime
 import enum
 import functools
 from ipaddress import ip_address
+import json
 import logging
 import os
 import pathlib
@@ -42,6 +43,7 @@ import yarl
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -71,9 +73,12 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
+from homeassistant.util.loop_watchdog import LoopWatchdog
 import homeassistant.util.dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.thread import fix_threading_exception_logging
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -190,6 +195,8 @@ class HomeAssistant:
         self._stopped: Optional[asyncio.Event] = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # If not None, times the jobs run on the event loop
+        self.loop_watchdog: Optional[LoopWatchdog] = None
 
     @property
     def is_running(self) -> bool:
@@ -304,6 +311,7 @@ class HomeAssistant:
         args: parameters for method to call.
         """
         task = None
+        watchdog = self.loop_watchdog
 
         # Check for partials to properly determine if coroutine function
         check_target = target
@@ -311,11 +319,19 @@ class HomeAssistant:
             check_target = check_target.func
 
         if asyncio.iscoroutine(check_target):
+            if watchdog is not None:
+                target = watchdog.wrap_coroutine(target)  # type: ignore
             task = self.loop.create_task(target)  # type: ignore
         elif asyncio.iscoroutinefunction(check_target):
-            task = self.loop.create_task(target(*args))
+            coro = target(*args)
+            if watchdog is not None:
+                coro = watchdog.wrap_coroutine(coro)
+            task = self.loop.create_task(coro)
         elif is_callback(check_target):
-            self.loop.call_soon(target, *args)
+            if watchdog is None:
+                self.loop.call_soon(target, *args)
+            else:
+                self.loop.call_soon(watchdog.run, target, *args)
         else:
             task = self.loop.run_in_executor(  # type: ignore
                 None, target, *args
@@ -381,7 +397,10 @@ class HomeAssistant:
             and not asyncio.iscoroutinefunction(target)
             and is_callback(target)
         ):
-            target(*args)
+            if self.loop_watchdog is None:
+                target(*args)
+            else:
+                self.loop_watchdog.run(target, *args)
         else:
             self.async_add_job(target, *args)
 
@@ -567,6 +586,10 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def __hash__(self) -> int:
+        """Make hashable."""
+        return hash((self.event_type, self.context.id, self.time_fired))
+
     def __repr__(self) -> str:
         """Return the representation."""
         # pylint: disable=maybe-no-member
@@ -593,6 +616,7 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: Dict[str, List[Callable]] = {}
+        self._entity_listeners: Dict[str, List[Callable]] = {}
         self._hass = hass
 
     @callback
@@ -603,6 +627,29 @@ class EventBus:
         """
         return {key: len(self._listeners[key]) for key in self._listeners}
 
+    @callback
+    def async_entity_listeners(self) -> Dict[str, int]:
+        """Return dictionary with entity ids and the number of listeners.
+
+        This method must be run in the event loop.
+        """
+        return {key: len(self._entity_listeners[key]) for key in self._entity_listeners}
+
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if an event of event_type would reach any listener.
+
+        This method must be run in the event loop.
+        """
+        return event_type in self._listeners or MATCH_ALL in self._listeners
+
+    @property
+    def entity_listeners(self) -> Dict[str, int]:
+        """Return dictionary with entity ids and the number of listeners."""
+        return run_callback_threadsafe(
+            self._hass.loop, self.async_entity_listeners
+        ).result()
+
     @property
     def listeners(self) -> Dict[str, int]:
         """Return dictionary with events and the number of listeners."""
@@ -639,17 +686,40 @@ class EventBus:
         if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        entity_id = None
+        if event_type == EVENT_STATE_CHANGED and event_data:
+            entity_id = event_data.get(ATTR_ENTITY_ID)
+            if entity_id not in self._entity_listeners:
+                entity_id = None
+
         event = Event(event_type, event_data, origin, None, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
-
         for func in listeners:
             self._hass.async_add_job(func, event)
 
+        # State changes are also routed to the listeners of that entity_id
+        if entity_id is not None:
+            self._hass.async_add_job(
+                self._async_dispatch_entity_event, entity_id, event
+            )
+
+    @callback
+    def _async_dispatch_entity_event(self, entity_id: str, event: Event) -> None:
+        """Dispatch a state changed event to the listeners of its entity_id.
+
+        This method must be run in the event loop.
+        """
+        for listener in self._entity_listeners.get(entity_id, [])[:]:
+            try:
+                self._hass.async_run_job(listener, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state changed for %s", entity_id
+                )
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -686,6 +756,29 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_entity(
+        self, entity_ids: Iterable[str], listener: Callable
+    ) -> CALLBACK_TYPE:
+        """Listen for state changed events of specific entities.
+
+        Listeners are indexed by entity_id, firing a state change only
+        runs the listeners of the entity that changed.
+
+        This method must be run in the event loop.
+        """
+        entity_ids = tuple(entity_ids)
+
+        for entity_id in entity_ids:
+            self._entity_listeners.setdefault(entity_id, []).append(listener)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            for entity_id in entity_ids:
+                self._async_remove_entity_listener(entity_id, listener)
+
+        return remove_listener
+
     def listen_once(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen once for event of a specific type.
 
@@ -749,6 +842,23 @@ class EventBus:
             # ValueError if listener did not exist within event_type
             _LOGGER.warning("Unable to remove unknown listener %s", listener)
 
+    @callback
+    def _async_remove_entity_listener(self, entity_id: str, listener: Callable) -> None:
+        """Remove a state changed listener of a specific entity_id.
+
+        This method must be run in the event loop.
+        """
+        try:
+            self._entity_listeners[entity_id].remove(listener)
+
+            # delete entity_id list if empty
+            if not self._entity_listeners[entity_id]:
+                self._entity_listeners.pop(entity_id)
+        except (KeyError, ValueError):
+            # KeyError is key entity_id listener did not exist
+            # ValueError if listener did not exist within entity_id
+            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -770,6 +880,8 @@ class State:
         "last_updated",
         "context",
         "domain",
+        "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -804,6 +916,8 @@ class State:
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain = split_entity_id(self.entity_id)[0]
+        self._as_dict: Optional[ReadOnlyDict] = None
+        self._as_json: Optional[str] = None
 
     @property
     def object_id(self) -> str:
@@ -824,15 +938,33 @@ class State:
 
         To be used for JSON serialization.
         Ensures: state == State.from_dict(state.as_dict())
+
+        The dict is built once and shared by all callers, so it is read only.
         """
-        return {
-            "entity_id": self.entity_id,
-            "state": self.state,
-            "attributes": dict(self.attributes),
-            "last_changed": self.last_changed,
-            "last_updated": self.last_updated,
-            "context": self.context.as_dict(),
-        }
+        if self._as_dict is None:
+            self._as_dict = ReadOnlyDict(
+                {
+                    "entity_id": self.entity_id,
+                    "state": self.state,
+                    "attributes": ReadOnlyDict(self.attributes),
+                    "last_changed": self.last_changed,
+                    "last_updated": self.last_updated,
+                    "context": ReadOnlyDict(self.context.as_dict()),
+                }
+            )
+        return self._as_dict
+
+    def as_json(self) -> str:
+        """Return the JSON representation of the State.
+
+        Async friendly.
+
+        Encoded once and shared by all callers. Raises ValueError or
+        TypeError if the attributes can not be serialized.
+        """
+        if self._as_json is None:
+            self._as_json = json.dumps(self.as_dict(), cls=JSONEncoder, allow_nan=False)
+        return self._as_json
 
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
@@ -894,6 +1026,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        self._domain_index: Dict[str, Dict[str, State]] = {}
         self._bus = bus
         self._loop = loop
 
@@ -913,25 +1046,35 @@ class StateMachine:
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
+        return list(self._domain_index.get(domain_filter.lower(), ()))
+
+    @callback
+    def async_entity_ids_count(self, domain_filter: Optional[str] = None) -> int:
+        """Count the entity ids that are being tracked.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is None:
+            return len(self._states)
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain == domain_filter
-        ]
+        return len(self._domain_index.get(domain_filter.lower(), ()))
 
-    def all(self) -> List[State]:
+    def all(self, domain_filter: Optional[str] = None) -> List[State]:
         """Create a list of all states."""
-        return run_callback_threadsafe(self._loop, self.async_all).result()
+        return run_callback_threadsafe(
+            self._loop, self.async_all, domain_filter
+        ).result()
 
     @callback
-    def async_all(self) -> List[State]:
+    def async_all(self, domain_filter: Optional[str] = None) -> List[State]:
         """Create a list of all states.
 
         This method must be run in the event loop.
         """
-        return list(self._states.values())
+        if domain_filter is None:
+            return list(self._states.values())
+
+        return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
@@ -971,6 +1114,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1043,6 +1191,7 @@ class StateMachine:
 
         state = State(entity_id, new_state, attributes, last_changed, None, context)
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1610,7 +1759,12 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context)
+        # Time based helpers are scheduled on their own, the event is only
+        # kept for listeners that still rely on it.
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context
+            )
 
         # If we are more than a second late, a tick was missed
         late = monotonic() - target
@@ -0,0 +1,4552 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+INTEGRATIONS = {
+    "abode": {
+        "requirements": [
+            "abodepy==1.1.0"
+        ]
+    },
+    "accuweather": {
+        "requirements": [
+            "accuweather==0.0.9"
+        ]
+    },
+    "acer_projector": {
+        "requirements": [
+            "pyserial==3.4"
+        ]
+    },
+    "acmeda": {
+        "requirements": [
+            "aiopulse==0.4.0"
+        ]
+    },
+    "actiontec": {},
+    "adguard": {
+        "requirements": [
+            "adguardhome==0.4.2"
+        ]
+    },
+    "ads": {
+        "requirements": [
+            "pyads==3.2.1"
+        ]
+    },
+    "aftership": {
+        "requirements": [
+            "pyaftership==0.1.2"
+        ]
+    },
+    "agent_dvr": {
+        "requirements": [
+            "agent-py==0.0.23"
+        ]
+    },
+    "air_quality": {},
+    "airly": {
+        "requirements": [
+            "airly==0.0.2"
+        ]
+    },
+    "airvisual": {
+        "requirements": [
+            "pyairvisual==4.4.0"
+        ]
+    },
+    "aladdin_connect": {
+        "requirements": [
+            "aladdin_connect==0.3"
+        ]
+    },
+    "alarm_control_panel": {},
+    "alarmdecoder": {
+        "requirements": [
+            "adext==0.3"
+        ]
+    },
+    "alert": {
+        "after_dependencies": [
+            "notify"
+        ]
+    },
+    "alexa": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "camera"
+        ]
+    },
+    "almond": {
+        "dependencies": [
+            "http",
+            "conversation"
+        ],
+        "requirements": [
+            "pyalmond==0.0.2"
+        ]
+    },
+    "alpha_vantage": {
+        "requirements": [
+            "alpha_vantage==2.2.0"
+        ]
+    },
+    "amazon_polly": {
+        "requirements": [
+            "boto3==1.9.252"
+        ]
+    },
+    "ambiclimate": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "ambiclimate==0.2.1"
+        ]
+    },
+    "ambient_station": {
+        "requirements": [
+            "aioambient==1.2.1"
+        ]
+    },
+    "amcrest": {
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "amcrest==1.7.0"
+        ]
+    },
+    "ampio": {
+        "requirements": [
+            "asmog==0.0.6"
+        ]
+    },
+    "android_ip_webcam": {
+        "requirements": [
+            "pydroid-ipcam==0.8"
+        ]
+    },
+    "androidtv": {
+        "requirements": [
+            "adb-shell[async]==0.2.1",
+            "androidtv[async]==0.0.49",
+            "pure-python-adb[async]==0.3.0.dev0"
+        ]
+    },
+    "anel_pwrctrl": {
+        "requirements": [
+            "anel_pwrctrl-homeassistant==0.0.1.dev2"
+        ]
+    },
+    "anthemav": {
+        "requirements": [
+            "anthemav==1.1.10"
+        ]
+    },
+    "apache_kafka": {
+        "requirements": [
+            "aiokafka==0.6.0"
+        ]
+    },
+    "apcupsd": {
+        "requirements": [
+            "apcaccess==0.0.13"
+        ]
+    },
+    "api": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "apns": {
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "requirements": [
+            "apns2==0.3.0"
+        ]
+    },
+    "apple_tv": {
+        "dependencies": [
+            "configurator"
+        ],
+        "after_dependencies": [
+            "discovery"
+        ],
+        "requirements": [
+            "pyatv==0.3.13"
+        ]
+    },
+    "apprise": {
+        "requirements": [
+            "apprise==0.8.5"
+        ]
+    },
+    "aprs": {
+        "requirements": [
+            "aprslib==0.6.46",
+            "geopy==1.21.0"
+        ]
+    },
+    "aqualogic": {
+        "requirements": [
+            "aqualogic==1.0"
+        ]
+    },
+    "aquostv": {
+        "requirements": [
+            "sharp_aquos_rc==0.3.2"
+        ]
+    },
+    "arcam_fmj": {
+        "requirements": [
+            "arcam-fmj==0.5.1"
+        ]
+    },
+    "arduino": {
+        "requirements": [
+            "PyMata==2.20"
+        ]
+    },
+    "arest": {},
+    "arlo": {
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "pyarlo==0.2.3"
+        ]
+    },
+    "arris_tg2492lg": {
+        "requirements": [
+            "arris-tg2492lg==1.0.0"
+        ]
+    },
+    "aruba": {
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "arwn": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "asterisk_cdr": {
+        "dependencies": [
+            "asterisk_mbox"
+        ]
+    },
+    "asterisk_mbox": {
+        "requirements": [
+            "asterisk_mbox==0.5.0"
+        ]
+    },
+    "asuswrt": {
+        "requirements": [
+            "aioasuswrt==1.2.7"
+        ]
+    },
+    "atag": {
+        "requirements": [
+            "pyatag==0.3.3.4"
+        ]
+    },
+    "aten_pe": {
+        "requirements": [
+            "atenpdu==0.3.0"
+        ]
+    },
+    "atome": {
+        "requirements": [
+            "pyatome==0.1.1"
+        ]
+    },
+    "august": {
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "py-august==0.25.0"
+        ]
+    },
+    "aurora": {},
+    "aurora_abb_powerone": {
+        "requirements": [
+            "aurorapy==0.2.6"
+        ]
+    },
+    "auth": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "automation": {
+        "after_dependencies": [
+            "device_automation",
+            "webhook"
+        ]
+    },
+    "avea": {
+        "requirements": [
+            "avea==1.4"
+        ]
+    },
+    "avion": {
+        "requirements": [
+            "avion==0.10"
+        ]
+    },
+    "avri": {
+        "requirements": [
+            "avri-api==0.1.7",
+            "pycountry==19.8.18"
+        ]
+    },
+    "awair": {
+        "requirements": [
+            "python_awair==0.1.1"
+        ]
+    },
+    "aws": {
+        "requirements": [
+            "aiobotocore==0.11.1"
+        ]
+    },
+    "axis": {
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "requirements": [
+            "axis==33"
+        ]
+    },
+    "azure_devops": {
+        "requirements": [
+            "aioazuredevops==1.3.5"
+        ]
+    },
+    "azure_event_hub": {
+        "requirements": [
+            "azure-eventhub==5.1.0"
+        ]
+    },
+    "azure_service_bus": {
+        "requirements": [
+            "azure-servicebus==0.50.1"
+        ]
+    },
+    "baidu": {
+        "requirements": [
+            "baidu-aip==1.6.6"
+        ]
+    },
+    "bayesian": {},
+    "bbb_gpio": {
+        "requirements": [
+            "Adafruit_BBIO==1.1.1"
+        ]
+    },
+    "bbox": {
+        "requirements": [
+            "pybbox==0.0.5-alpha"
+        ]
+    },
+    "beewi_smartclim": {
+        "requirements": [
+            "beewi_smartclim==0.0.7"
+        ]
+    },
+    "bh1750": {
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "binary_sensor": {},
+    "bitcoin": {
+        "requirements": [
+            "blockchain==1.4.4"
+        ]
+    },
+    "bizkaibus": {
+        "requirements": [
+            "bizkaibus==0.1.1"
+        ]
+    },
+    "blackbird": {
+        "requirements": [
+            "pyblackbird==0.5"
+        ]
+    },
+    "blebox": {
+        "requirements": [
+            "blebox_uniapi==1.3.2"
+        ]
+    },
+    "blink": {
+        "requirements": [
+            "blinkpy==0.16.3"
+        ]
+    },
+    "blinksticklight": {
+        "requirements": [
+            "blinkstick==1.1.8"
+        ]
+    },
+    "blinkt": {
+        "requirements": [
+            "blinkt==0.1.0"
+        ]
+    },
+    "blockchain": {
+        "requirements": [
+            "python-blockchain-api==0.0.2"
+        ]
+    },
+    "bloomsky": {},
+    "bluesound": {
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "bluetooth_le_tracker": {
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ]
+    },
+    "bluetooth_tracker": {
+        "requirements": [
+            "bt_proximity==0.2",
+            "pybluez==0.22"
+        ]
+    },
+    "bme280": {
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "bme680": {
+        "requirements": [
+            "bme680==1.0.5",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "bmp280": {
+        "requirements": [
+            "adafruit-circuitpython-bmp280==3.1.1",
+            "RPi.GPIO==0.7.0"
+        ]
+    },
+    "bmw_connected_drive": {
+        "requirements": [
+            "bimmer_connected==0.7.7"
+        ]
+    },
+    "bom": {
+        "requirements": [
+            "bomradarloop==0.1.4"
+        ]
+    },
+    "bond": {
+        "requirements": [
+            "bond-api==0.1.8"
+        ]
+    },
+    "braviatv": {
+        "requirements": [
+            "bravia-tv==1.0.6"
+        ]
+    },
+    "broadlink": {
+        "requirements": [
+            "broadlink==0.14.0"
+        ]
+    },
+    "brother": {
+        "requirements": [
+            "brother==0.1.14"
+        ]
+    },
+    "brottsplatskartan": {
+        "requirements": [
+            "brottsplatskartan==0.0.1"
+        ]
+    },
+    "browser": {},
+    "brunt": {
+        "requirements": [
+            "brunt==0.1.3"
+        ]
+    },
+    "bsblan": {
+        "requirements": [
+            "bsblan==0.3.7"
+        ]
+    },
+    "bt_home_hub_5": {
+        "requirements": [
+            "bthomehub5-devicelist==0.1.1"
+        ]
+    },
+    "bt_smarthub": {
+        "requirements": [
+            "btsmarthub_devicelist==0.2.0"
+        ]
+    },
+    "buienradar": {
+        "requirements": [
+            "buienradar==1.0.4"
+        ]
+    },
+    "caldav": {
+        "requirements": [
+            "caldav==0.6.1"
+        ]
+    },
+    "calendar": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "camera": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "media_player"
+        ]
+    },
+    "canary": {
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "py-canary==0.5.0"
+        ]
+    },
+    "cast": {
+        "after_dependencies": [
+            "cloud",
+            "zeroconf"
+        ],
+        "requirements": [
+            "pychromecast==7.2.0"
+        ]
+    },
+    "cert_expiry": {},
+    "channels": {
+        "requirements": [
+            "pychannels==1.0.0"
+        ]
+    },
+    "circuit": {
+        "requirements": [
+            "circuit-webhook==1.0.1"
+        ]
+    },
+    "cisco_ios": {
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "cisco_mobility_express": {
+        "requirements": [
+            "ciscomobilityexpress==0.3.3"
+        ]
+    },
+    "cisco_webex_teams": {
+        "requirements": [
+            "webexteamssdk==1.1.1"
+        ]
+    },
+    "citybikes": {},
+    "clementine": {
+        "requirements": [
+            "python-clementine-remote==1.0.1"
+        ]
+    },
+    "clickatell": {},
+    "clicksend": {},
+    "clicksend_tts": {},
+    "climate": {},
+    "cloud": {
+        "dependencies": [
+            "http",
+            "webhook",
+            "alexa"
+        ],
+        "after_dependencies": [
+            "google_assistant"
+        ],
+        "requirements": [
+            "hass-nabucasa==0.35.0"
+        ]
+    },
+    "cloudflare": {
+        "requirements": [
+            "pycfdns==0.0.1"
+        ]
+    },
+    "cmus": {
+        "requirements": [
+            "pycmus==0.1.1"
+        ]
+    },
+    "co2signal": {
+        "requirements": [
+            "co2signal==0.4.2"
+        ]
+    },
+    "coinbase": {
+        "requirements": [
+            "coinbase==2.1.0"
+        ]
+    },
+    "coinmarketcap": {
+        "requirements": [
+            "coinmarketcap==5.0.3"
+        ]
+    },
+    "comed_hourly_pricing": {},
+    "comfoconnect": {
+        "requirements": [
+            "pycomfoconnect==0.3"
+        ]
+    },
+    "command_line": {},
+    "concord232": {
+        "requirements": [
+            "concord232==0.15"
+        ]
+    },
+    "config": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "configurator": {},
+    "control4": {
+        "requirements": [
+            "pyControl4==0.0.6"
+        ]
+    },
+    "conversation": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "coolmaster": {
+        "requirements": [
+            "pycoolmasternet-async==0.1.0"
+        ]
+    },
+    "coronavirus": {
+        "requirements": [
+            "coronavirus==1.1.1"
+        ]
+    },
+    "counter": {},
+    "cover": {},
+    "cppm_tracker": {
+        "requirements": [
+            "clearpasspy==1.0.2"
+        ]
+    },
+    "cpuspeed": {
+        "requirements": [
+            "py-cpuinfo==5.0.0"
+        ]
+    },
+    "crimereports": {
+        "requirements": [
+            "crimereports==1.0.1"
+        ]
+    },
+    "cups": {
+        "requirements": [
+            "pycups==1.9.73"
+        ]
+    },
+    "currencylayer": {},
+    "daikin": {
+        "requirements": [
+            "pydaikin==2.3.1"
+        ]
+    },
+    "danfoss_air": {
+        "requirements": [
+            "pydanfossair==0.1.0"
+        ]
+    },
+    "darksky": {
+        "requirements": [
+            "python-forecastio==1.4.0"
+        ]
+    },
+    "datadog": {
+        "requirements": [
+            "datadog==0.15.0"
+        ]
+    },
+    "ddwrt": {},
+    "debugpy": {
+        "requirements": [
+            "debugpy==1.0.0b12"
+        ]
+    },
+    "deconz": {
+        "requirements": [
+            "pydeconz==72"
+        ]
+    },
+    "decora": {
+        "requirements": [
+            "bluepy==1.3.0",
+            "decora==0.6"
+        ]
+    },
+    "decora_wifi": {
+        "requirements": [
+            "decora_wifi==1.4"
+        ]
+    },
+    "default_config": {
+        "dependencies": [
+            "automation",
+            "cloud",
+            "frontend",
+            "history",
+            "logbook",
+            "map",
+            "mobile_app",
+            "person",
+            "scene",
+            "script",
+            "ssdp",
+            "sun",
+            "system_health",
+            "tag",
+            "updater",
+            "zeroconf",
+            "zone",
+            "input_boolean",
+            "input_datetime",
+            "input_text",
+            "input_number",
+            "input_select"
+        ]
+    },
+    "delijn": {
+        "requirements": [
+            "pydelijn==0.6.0"
+        ]
+    },
+    "deluge": {
+        "requirements": [
+            "deluge-client==1.7.1"
+        ]
+    },
+    "demo": {
+        "dependencies": [
+            "conversation",
+            "zone",
+            "group"
+        ]
+    },
+    "denon": {},
+    "denonavr": {
+        "requirements": [
+            "denonavr==0.9.4",
+            "getmac==0.8.2"
+        ]
+    },
+    "derivative": {},
+    "deutsche_bahn": {
+        "requirements": [
+            "schiene==0.23"
+        ]
+    },
+    "device_automation": {},
+    "device_sun_light_trigger": {
+        "after_dependencies": [
+            "device_tracker",
+            "group",
+            "light",
+            "person"
+        ]
+    },
+    "device_tracker": {
+        "dependencies": [
+            "zone"
+        ]
+    },
+    "devolo_home_control": {
+        "requirements": [
+            "devolo-home-control-api==0.13.0"
+        ]
+    },
+    "dexcom": {
+        "requirements": [
+            "pydexcom==0.2.0"
+        ]
+    },
+    "dht": {
+        "requirements": [
+            "Adafruit-DHT==1.4.0"
+        ]
+    },
+    "dialogflow": {
+        "dependencies": [
+            "webhook"
+        ]
+    },
+    "digital_ocean": {
+        "requirements": [
+            "python-digitalocean==1.13.2"
+        ]
+    },
+    "digitalloggers": {
+        "requirements": [
+            "dlipower==0.7.165"
+        ]
+    },
+    "directv": {
+        "requirements": [
+            "directv==0.3.0"
+        ]
+    },
+    "discogs": {
+        "requirements": [
+            "discogs_client==2.2.2"
+        ]
+    },
+    "discord": {
+        "requirements": [
+            "discord.py==1.3.4"
+        ]
+    },
+    "discovery": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "requirements": [
+            "netdisco==2.8.1"
+        ]
+    },
+    "dlib_face_detect": {
+        "requirements": [
+            "face_recognition==1.2.3"
+        ]
+    },
+    "dlib_face_identify": {
+        "requirements": [
+            "face_recognition==1.2.3"
+        ]
+    },
+    "dlink": {
+        "requirements": [
+            "pyW215==0.7.0"
+        ]
+    },
+    "dlna_dmr": {
+        "requirements": [
+            "async-upnp-client==0.14.13"
+        ]
+    },
+    "dnsip": {
+        "requirements": [
+            "aiodns==2.0.0"
+        ]
+    },
+    "dominos": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pizzapi==0.0.3"
+        ]
+    },
+    "doods": {
+        "requirements": [
+            "pydoods==1.0.2",
+            "pillow==7.1.2"
+        ]
+    },
+    "doorbird": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "doorbirdpy==2.1.0"
+        ]
+    },
+    "dovado": {
+        "requirements": [
+            "dovado==0.4.1"
+        ]
+    },
+    "downloader": {},
+    "dsmr": {
+        "requirements": [
+            "dsmr_parser==0.18"
+        ]
+    },
+    "dsmr_reader": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "dte_energy_bridge": {},
+    "dublin_bus_transport": {},
+    "duckdns": {},
+    "dunehd": {
+        "requirements": [
+            "pdunehd==1.3.2"
+        ]
+    },
+    "dwd_weather_warnings": {
+        "requirements": [
+            "dwdwfsapi==1.0.2"
+        ]
+    },
+    "dweet": {
+        "requirements": [
+            "dweepy==0.3.0"
+        ]
+    },
+    "dynalite": {
+        "requirements": [
+            "dynalite_devices==0.1.45"
+        ]
+    },
+    "dyson": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "requirements": [
+            "libpurecool==0.6.3"
+        ]
+    },
+    "eafm": {
+        "requirements": [
+            "aioeafm==0.1.2"
+        ]
+    },
+    "ebox": {
+        "requirements": [
+            "pyebox==1.1.4"
+        ]
+    },
+    "ebusd": {
+        "requirements": [
+            "ebusdpy==0.0.16"
+        ]
+    },
+    "ecoal_boiler": {
+        "requirements": [
+            "ecoaliface==0.4.0"
+        ]
+    },
+    "ecobee": {
+        "requirements": [
+            "python-ecobee-api==0.2.7"
+        ]
+    },
+    "econet": {
+        "requirements": [
+            "pyeconet==0.0.11"
+        ]
+    },
+    "ecovacs": {
+        "requirements": [
+            "sucks==0.9.4"
+        ]
+    },
+    "eddystone_temperature": {
+        "requirements": [
+            "beacontools[scan]==1.2.3",
+            "construct==2.9.45"
+        ]
+    },
+    "edimax": {
+        "requirements": [
+            "pyedimax==0.2.1"
+        ]
+    },
+    "edl21": {
+        "requirements": [
+            "pysml==0.0.2"
+        ]
+    },
+    "ee_brightbox": {
+        "requirements": [
+            "eebrightbox==0.0.4"
+        ]
+    },
+    "efergy": {},
+    "egardia": {
+        "requirements": [
+            "pythonegardia==1.0.40"
+        ]
+    },
+    "eight_sleep": {
+        "requirements": [
+            "pyeight==0.1.4"
+        ]
+    },
+    "elgato": {
+        "requirements": [
+            "elgato==0.2.0"
+        ]
+    },
+    "eliqonline": {
+        "requirements": [
+            "eliqonline==1.2.2"
+        ]
+    },
+    "elkm1": {
+        "requirements": [
+            "elkm1-lib==0.7.19"
+        ]
+    },
+    "elv": {
+        "requirements": [
+            "pypca==0.0.7"
+        ]
+    },
+    "emby": {
+        "requirements": [
+            "pyemby==1.6"
+        ]
+    },
+    "emoncms": {},
+    "emoncms_history": {},
+    "emulated_hue": {
+        "after_dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ]
+    },
+    "emulated_roku": {
+        "requirements": [
+            "emulated_roku==0.2.1"
+        ]
+    },
+    "enigma2": {
+        "requirements": [
+            "openwebifpy==3.1.1"
+        ]
+    },
+    "enocean": {
+        "requirements": [
+            "enocean==0.50"
+        ]
+    },
+    "enphase_envoy": {
+        "requirements": [
+            "envoy_reader==0.16.1"
+        ]
+    },
+    "entur_public_transport": {
+        "requirements": [
+            "enturclient==0.2.1"
+        ]
+    },
+    "environment_canada": {
+        "requirements": [
+            "env_canada==0.2.0"
+        ]
+    },
+    "envirophat": {
+        "requirements": [
+            "envirophat==0.0.6",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "envisalink": {
+        "requirements": [
+            "pyenvisalink==4.0"
+        ]
+    },
+    "ephember": {
+        "requirements": [
+            "pyephember==0.3.1"
+        ]
+    },
+    "epson": {
+        "requirements": [
+            "epson-projector==0.1.3"
+        ]
+    },
+    "epsonworkforce": {
+        "requirements": [
+            "epsonprinter==0.0.9"
+        ]
+    },
+    "eq3btsmart": {
+        "requirements": [
+            "construct==2.9.45",
+            "python-eq3bt==0.1.11"
+        ]
+    },
+    "esphome": {
+        "requirements": [
+            "aioesphomeapi==2.6.1"
+        ]
+    },
+    "essent": {
+        "requirements": [
+            "PyEssent==0.13"
+        ]
+    },
+    "etherscan": {
+        "requirements": [
+            "python-etherscan-api==0.0.3"
+        ]
+    },
+    "eufy": {
+        "requirements": [
+            "lakeside==0.12"
+        ]
+    },
+    "everlights": {
+        "requirements": [
+            "pyeverlights==0.1.0"
+        ]
+    },
+    "evohome": {
+        "requirements": [
+            "evohome-async==0.3.5.post1"
+        ]
+    },
+    "ezviz": {
+        "requirements": [
+            "pyezviz==0.1.5"
+        ]
+    },
+    "facebook": {},
+    "facebox": {},
+    "fail2ban": {},
+    "familyhub": {
+        "requirements": [
+            "python-family-hub-local==0.0.2"
+        ]
+    },
+    "fan": {},
+    "fastdotcom": {
+        "requirements": [
+            "fastdotcom==0.0.3"
+        ]
+    },
+    "feedreader": {
+        "requirements": [
+            "feedparser-homeassistant==5.2.2.dev1"
+        ]
+    },
+    "ffmpeg": {
+        "requirements": [
+            "ha-ffmpeg==2.0"
+        ]
+    },
+    "ffmpeg_motion": {
+        "dependencies": [
+            "ffmpeg"
+        ]
+    },
+    "ffmpeg_noise": {
+        "dependencies": [
+            "ffmpeg"
+        ]
+    },
+    "fibaro": {
+        "requirements": [
+            "fiblary3==0.1.7"
+        ]
+    },
+    "fido": {
+        "requirements": [
+            "pyfido==2.1.1"
+        ]
+    },
+    "file": {},
+    "filesize": {},
+    "filter": {
+        "dependencies": [
+            "history"
+        ]
+    },
+    "fints": {
+        "requirements": [
+            "fints==1.0.1"
+        ]
+    },
+    "firmata": {
+        "requirements": [
+            "pymata-express==1.13"
+        ]
+    },
+    "fitbit": {
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "requirements": [
+            "fitbit==0.3.1"
+        ]
+    },
+    "fixer": {
+        "requirements": [
+            "fixerio==1.0.0a0"
+        ]
+    },
+    "fleetgo": {
+        "requirements": [
+            "ritassist==0.9.2"
+        ]
+    },
+    "flexit": {
+        "dependencies": [
+            "modbus"
+        ],
+        "requirements": [
+            "pyflexit==0.3"
+        ]
+    },
+    "flic": {
+        "requirements": [
+            "pyflic-homeassistant==0.4.dev0"
+        ]
+    },
+    "flick_electric": {
+        "requirements": [
+            "PyFlick==0.0.2"
+        ]
+    },
+    "flo": {
+        "requirements": [
+            "aioflo==0.4.0"
+        ]
+    },
+    "flock": {},
+    "flume": {
+        "requirements": [
+            "pyflume==0.5.5"
+        ]
+    },
+    "flunearyou": {
+        "requirements": [
+            "pyflunearyou==1.0.7"
+        ]
+    },
+    "flux": {
+        "after_dependencies": [
+            "light"
+        ]
+    },
+    "flux_led": {
+        "requirements": [
+            "flux_led==0.22"
+        ]
+    },
+    "folder": {},
+    "folder_watcher": {
+        "requirements": [
+            "watchdog==0.8.3"
+        ]
+    },
+    "foobot": {
+        "requirements": [
+            "foobot_async==0.3.2"
+        ]
+    },
+    "forked_daapd": {
+        "requirements": [
+            "pyforked-daapd==0.1.10",
+            "pylibrespot-java==0.1.0"
+        ]
+    },
+    "fortios": {
+        "requirements": [
+            "fortiosapi==0.10.8"
+        ]
+    },
+    "foscam": {
+        "requirements": [
+            "libpyfoscam==1.0"
+        ]
+    },
+    "foursquare": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "free_mobile": {
+        "requirements": [
+            "freesms==0.1.2"
+        ]
+    },
+    "freebox": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "requirements": [
+            "aiofreepybox==0.0.8"
+        ]
+    },
+    "freedns": {},
+    "fritz": {
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ]
+    },
+    "fritzbox": {
+        "requirements": [
+            "pyfritzhome==0.4.2"
+        ]
+    },
+    "fritzbox_callmonitor": {
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ]
+    },
+    "fritzbox_netmonitor": {
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ]
+    },
+    "fronius": {
+        "requirements": [
+            "pyfronius==0.4.6"
+        ]
+    },
+    "frontend": {
+        "dependencies": [
+            "api",
+            "auth",
+            "config",
+            "device_automation",
+            "http",
+            "lovelace",
+            "onboarding",
+            "search",
+            "system_log",
+            "websocket_api"
+        ],
+        "requirements": [
+            "home-assistant-frontend==20200811.0"
+        ]
+    },
+    "frontier_silicon": {
+        "requirements": [
+            "afsapi==0.0.4"
+        ]
+    },
+    "futurenow": {
+        "requirements": [
+            "pyfnip==0.2"
+        ]
+    },
+    "garadget": {},
+    "garmin_connect": {
+        "requirements": [
+            "garminconnect==0.1.13"
+        ]
+    },
+    "gc100": {
+        "requirements": [
+            "python-gc100==1.0.3a"
+        ]
+    },
+    "gdacs": {
+        "requirements": [
+            "aio_georss_gdacs==0.3"
+        ]
+    },
+    "geizhals": {
+        "requirements": [
+            "geizhals==0.0.9"
+        ]
+    },
+    "generic": {},
+    "generic_thermostat": {
+        "dependencies": [
+            "sensor",
+            "switch"
+        ]
+    },
+    "geniushub": {
+        "requirements": [
+            "geniushub-client==0.6.30"
+        ]
+    },
+    "geo_json_events": {
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "geo_location": {},
+    "geo_rss_events": {
+        "requirements": [
+            "georss_generic_client==0.3"
+        ]
+    },
+    "geofency": {
+        "dependencies": [
+            "webhook"
+        ]
+    },
+    "geonetnz_quakes": {
+        "requirements": [
+            "aio_geojson_geonetnz_quakes==0.12"
+        ]
+    },
+    "geonetnz_volcano": {
+        "requirements": [
+            "aio_geojson_geonetnz_volcano==0.5"
+        ]
+    },
+    "gios": {
+        "requirements": [
+            "gios==0.1.1"
+        ]
+    },
+    "github": {
+        "requirements": [
+            "PyGithub==1.43.8"
+        ]
+    },
+    "gitlab_ci": {
+        "requirements": [
+            "python-gitlab==1.6.0"
+        ]
+    },
+    "gitter": {
+        "requirements": [
+            "gitterpy==0.1.7"
+        ]
+    },
+    "glances": {
+        "requirements": [
+            "glances_api==0.2.0"
+        ]
+    },
+    "gntp": {
+        "requirements": [
+            "gntp==1.0.3"
+        ]
+    },
+    "goalfeed": {
+        "requirements": [
+            "pysher==1.0.1"
+        ]
+    },
+    "gogogate2": {
+        "requirements": [
+            "gogogate2-api==1.0.4"
+        ]
+    },
+    "google": {
+        "requirements": [
+            "google-api-python-client==1.6.4",
+            "httplib2==0.10.3",
+            "oauth2client==4.0.0"
+        ]
+    },
+    "google_assistant": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "camera"
+        ]
+    },
+    "google_cloud": {
+        "requirements": [
+            "google-cloud-texttospeech==0.4.0"
+        ]
+    },
+    "google_domains": {},
+    "google_maps": {
+        "requirements": [
+            "locationsharinglib==4.1.0"
+        ]
+    },
+    "google_pubsub": {
+        "requirements": [
+            "google-cloud-pubsub==0.39.1"
+        ]
+    },
+    "google_translate": {
+        "requirements": [
+            "gTTS-token==1.1.3"
+        ]
+    },
+    "google_travel_time": {
+        "requirements": [
+            "googlemaps==2.5.1"
+        ]
+    },
+    "google_wifi": {},
+    "gpmdp": {
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "websocket-client==0.54.0"
+        ]
+    },
+    "gpsd": {
+        "requirements": [
+            "gps3==0.33.3"
+        ]
+    },
+    "gpslogger": {
+        "dependencies": [
+            "webhook"
+        ]
+    },
+    "graphite": {},
+    "greeneye_monitor": {
+        "requirements": [
+            "greeneye_monitor==2.0"
+        ]
+    },
+    "greenwave": {
+        "requirements": [
+            "greenwavereality==0.5.1"
+        ]
+    },
+    "griddy": {
+        "requirements": [
+            "griddypower==0.1.0"
+        ]
+    },
+    "group": {},
+    "growatt_server": {
+        "requirements": [
+            "growattServer==0.0.4"
+        ]
+    },
+    "gstreamer": {
+        "requirements": [
+            "gstreamer-player==1.1.2"
+        ]
+    },
+    "gtfs": {
+        "requirements": [
+            "pygtfs==0.1.5"
+        ]
+    },
+    "guardian": {
+        "requirements": [
+            "aioguardian==1.0.1"
+        ]
+    },
+    "habitica": {
+        "requirements": [
+            "habitipy==0.2.0"
+        ]
+    },
+    "hangouts": {
+        "requirements": [
+            "hangups==0.4.9"
+        ]
+    },
+    "harman_kardon_avr": {
+        "requirements": [
+            "hkavr==0.0.5"
+        ]
+    },
+    "harmony": {
+        "requirements": [
+            "aioharmony==0.2.6"
+        ]
+    },
+    "hassio": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "panel_custom"
+        ]
+    },
+    "haveibeenpwned": {},
+    "hddtemp": {},
+    "hdmi_cec": {
+        "requirements": [
+            "pyCEC==0.4.13"
+        ]
+    },
+    "heatmiser": {
+        "requirements": [
+            "heatmiserV3==1.1.18"
+        ]
+    },
+    "heos": {
+        "requirements": [
+            "pyheos==0.6.0"
+        ]
+    },
+    "here_travel_time": {
+        "requirements": [
+            "herepy==2.0.0"
+        ]
+    },
+    "hikvision": {
+        "requirements": [
+            "pyhik==0.2.7"
+        ]
+    },
+    "hikvisioncam": {
+        "requirements": [
+            "hikvision==0.4"
+        ]
+    },
+    "hisense_aehw4a1": {
+        "requirements": [
+            "pyaehw4a1==0.3.9"
+        ]
+    },
+    "history": {
+        "dependencies": [
+            "http",
+            "recorder"
+        ]
+    },
+    "history_stats": {
+        "dependencies": [
+            "history"
+        ]
+    },
+    "hitron_coda": {},
+    "hive": {
+        "requirements": [
+            "pyhiveapi==0.2.20.1"
+        ]
+    },
+    "hlk_sw16": {
+        "requirements": [
+            "hlk-sw16==0.0.8"
+        ]
+    },
+    "home_connect": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "homeconnect==0.5"
+        ]
+    },
+    "homeassistant": {},
+    "homekit": {
+        "dependencies": [
+            "http",
+            "camera",
+            "ffmpeg"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "requirements": [
+            "HAP-python==3.0.0",
+            "fnvhash==0.1.0",
+            "PyQRCode==1.2.1",
+            "base36==0.1.1",
+            "PyTurboJPEG==1.4.0"
+        ]
+    },
+    "homekit_controller": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "requirements": [
+            "aiohomekit[IP]==0.2.46"
+        ]
+    },
+    "homematic": {
+        "requirements": [
+            "pyhomematic==0.1.68"
+        ]
+    },
+    "homematicip_cloud": {
+        "requirements": [
+            "homematicip==0.10.19"
+        ]
+    },
+    "homeworks": {
+        "requirements": [
+            "pyhomeworks==0.0.6"
+        ]
+    },
+    "honeywell": {
+        "requirements": [
+            "somecomfort==0.5.2"
+        ]
+    },
+    "horizon": {
+        "requirements": [
+            "horimote==0.4.1"
+        ]
+    },
+    "hp_ilo": {
+        "requirements": [
+            "python-hpilo==4.3"
+        ]
+    },
+    "html5": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pywebpush==1.9.2"
+        ]
+    },
+    "http": {
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ]
+    },
+    "htu21d": {
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "huawei_lte": {
+        "requirements": [
+            "getmac==0.8.2",
+            "huawei-lte-api==1.4.12",
+            "stringcase==1.2.0",
+            "url-normalize==1.4.1"
+        ]
+    },
+    "huawei_router": {},
+    "hue": {
+        "requirements": [
+            "aiohue==2.1.0"
+        ]
+    },
+    "humidifier": {},
+    "hunterdouglas_powerview": {
+        "requirements": [
+            "aiopvapi==1.6.14"
+        ]
+    },
+    "hvv_departures": {
+        "requirements": [
+            "pygti==0.6.0"
+        ]
+    },
+    "hydrawise": {
+        "requirements": [
+            "hydrawiser==0.2"
+        ]
+    },
+    "hyperion": {},
+    "ialarm": {
+        "requirements": [
+            "pyialarm==0.3"
+        ]
+    },
+    "iammeter": {
+        "requirements": [
+            "iammeter==0.1.7"
+        ]
+    },
+    "iaqualink": {
+        "requirements": [
+            "iaqualink==0.3.4"
+        ]
+    },
+    "icloud": {
+        "requirements": [
+            "pyicloud==0.9.7"
+        ]
+    },
+    "idteck_prox": {
+        "requirements": [
+            "rfk101py==0.0.1"
+        ]
+    },
+    "ifttt": {
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pyfttt==0.3"
+        ]
+    },
+    "iglo": {
+        "requirements": [
+            "iglo==1.2.7"
+        ]
+    },
+    "ign_sismologia": {
+        "requirements": [
+            "georss_ign_sismologia_client==0.2"
+        ]
+    },
+    "ihc": {
+        "requirements": [
+            "defusedxml==0.6.0",
+            "ihcsdk==2.7.0"
+        ]
+    },
+    "image_processing": {
+        "dependencies": [
+            "camera"
+        ]
+    },
+    "imap": {
+        "requirements": [
+            "aioimaplib==0.7.15"
+        ]
+    },
+    "imap_email_content": {},
+    "incomfort": {
+        "requirements": [
+            "incomfort-client==0.4.0"
+        ]
+    },
+    "influxdb": {
+        "requirements": [
+            "influxdb==5.2.3",
+            "influxdb-client==1.8.0"
+        ]
+    },
+    "input_boolean": {},
+    "input_datetime": {},
+    "input_number": {},
+    "input_select": {},
+    "input_text": {},
+    "insteon": {
+        "requirements": [
+            "pyinsteon==1.0.7"
+        ]
+    },
+    "integration": {},
+    "intent": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "intent_script": {},
+    "intesishome": {
+        "requirements": [
+            "pyintesishome==1.7.5"
+        ]
+    },
+    "ios": {
+        "dependencies": [
+            "device_tracker",
+            "http",
+            "zeroconf"
+        ]
+    },
+    "iota": {
+        "requirements": [
+            "pyota==2.0.5"
+        ]
+    },
+    "iperf3": {
+        "requirements": [
+            "iperf3==0.1.11"
+        ]
+    },
+    "ipma": {
+        "requirements": [
+            "pyipma==2.0.5"
+        ]
+    },
+    "ipp": {
+        "requirements": [
+            "pyipp==0.10.1"
+        ]
+    },
+    "iqvia": {
+        "requirements": [
+            "numpy==1.19.1",
+            "pyiqvia==0.2.1"
+        ]
+    },
+    "irish_rail_transport": {
+        "requirements": [
+            "pyirishrail==0.0.2"
+        ]
+    },
+    "islamic_prayer_times": {
+        "requirements": [
+            "prayer_times_calculator==0.0.3"
+        ]
+    },
+    "iss": {
+        "requirements": [
+            "pyiss==1.0.1"
+        ]
+    },
+    "isy994": {
+        "requirements": [
+            "pyisy==2.0.2"
+        ]
+    },
+    "itach": {
+        "requirements": [
+            "pyitachip2ir==0.0.7"
+        ]
+    },
+    "itunes": {},
+    "izone": {
+        "requirements": [
+            "python-izone==1.1.2"
+        ]
+    },
+    "jewish_calendar": {
+        "requirements": [
+            "hdate==0.9.5"
+        ]
+    },
+    "joaoapps_join": {
+        "requirements": [
+            "python-join-api==0.0.6"
+        ]
+    },
+    "juicenet": {
+        "requirements": [
+            "python-juicenet==1.0.1"
+        ]
+    },
+    "kaiterra": {
+        "requirements": [
+            "kaiterra-async-client==0.0.2"
+        ]
+    },
+    "kankun": {},
+    "keba": {
+        "requirements": [
+            "keba-kecontact==1.1.0"
+        ]
+    },
+    "keenetic_ndms2": {
+        "requirements": [
+            "ndms2_client==0.0.11"
+        ]
+    },
+    "kef": {
+        "requirements": [
+            "aiokef==0.2.13",
+            "getmac==0.8.2"
+        ]
+    },
+    "keyboard": {
+        "requirements": [
+            "pyuserinput==0.1.11"
+        ]
+    },
+    "keyboard_remote": {
+        "requirements": [
+            "evdev==1.1.2",
+            "aionotify==0.2.0"
+        ]
+    },
+    "kira": {
+        "requirements": [
+            "pykira==0.1.1"
+        ]
+    },
+    "kiwi": {
+        "requirements": [
+            "kiwiki-client==0.1.1"
+        ]
+    },
+    "knx": {
+        "requirements": [
+            "xknx==0.11.3"
+        ]
+    },
+    "kodi": {
+        "requirements": [
+            "jsonrpc-async==0.6",
+            "jsonrpc-websocket==0.6"
+        ]
+    },
+    "konnected": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "konnected==1.1.0"
+        ]
+    },
+    "kwb": {
+        "requirements": [
+            "pykwb==0.0.8"
+        ]
+    },
+    "lacrosse": {
+        "requirements": [
+            "pylacrosse==0.4.0"
+        ]
+    },
+    "lametric": {
+        "requirements": [
+            "lmnotify==0.0.4"
+        ]
+    },
+    "lannouncer": {},
+    "lastfm": {
+        "requirements": [
+            "pylast==3.2.1"
+        ]
+    },
+    "launch_library": {
+        "requirements": [
+            "pylaunches==0.2.0"
+        ]
+    },
+    "lcn": {
+        "requirements": [
+            "pypck==0.6.4"
+        ]
+    },
+    "lg_netcast": {
+        "requirements": [
+            "pylgnetcast-homeassistant==0.2.0.dev0"
+        ]
+    },
+    "lg_soundbar": {
+        "requirements": [
+            "temescal==0.1"
+        ]
+    },
+    "life360": {
+        "requirements": [
+            "life360==4.1.1"
+        ]
+    },
+    "lifx": {
+        "requirements": [
+            "aiolifx==0.6.7",
+            "aiolifx_effects==0.2.2"
+        ]
+    },
+    "lifx_cloud": {},
+    "lifx_legacy": {
+        "requirements": [
+            "liffylights==0.9.4"
+        ]
+    },
+    "light": {},
+    "lightwave": {
+        "requirements": [
+            "lightwave==0.18"
+        ]
+    },
+    "limitlessled": {
+        "requirements": [
+            "limitlessled==1.1.3"
+        ]
+    },
+    "linksys_smart": {},
+    "linode": {
+        "requirements": [
+            "linode-api==4.1.9b1"
+        ]
+    },
+    "linux_battery": {
+        "requirements": [
+            "batinfo==0.4.2"
+        ]
+    },
+    "lirc": {
+        "requirements": [
+            "python-lirc==1.2.3"
+        ]
+    },
+    "litejet": {
+        "requirements": [
+            "pylitejet==0.1"
+        ]
+    },
+    "llamalab_automate": {},
+    "local_file": {},
+    "local_ip": {},
+    "locative": {
+        "dependencies": [
+            "webhook"
+        ]
+    },
+    "lock": {},
+    "logbook": {
+        "dependencies": [
+            "frontend",
+            "http",
+            "recorder"
+        ]
+    },
+    "logentries": {},
+    "logger": {},
+    "logi_circle": {
+        "dependencies": [
+            "ffmpeg",
+            "http"
+        ],
+        "requirements": [
+            "logi_circle==0.2.2"
+        ]
+    },
+    "london_air": {},
+    "london_underground": {
+        "requirements": [
+            "london-tube-status==0.2"
+        ]
+    },
+    "loop_watchdog": {
+        "dependencies": [
+            "websocket_api"
+        ]
+    },
+    "loopenergy": {
+        "requirements": [
+            "pyloopenergy==0.1.3"
+        ]
+    },
+    "lovelace": {},
+    "luci": {
+        "requirements": [
+            "openwrt-luci-rpc==1.1.3"
+        ]
+    },
+    "luftdaten": {
+        "requirements": [
+            "luftdaten==0.6.4"
+        ]
+    },
+    "lupusec": {
+        "requirements": [
+            "lupupy==0.0.18"
+        ]
+    },
+    "lutron": {
+        "requirements": [
+            "pylutron==0.2.5"
+        ]
+    },
+    "lutron_caseta": {
+        "requirements": [
+            "pylutron-caseta==0.6.1"
+        ]
+    },
+    "lw12wifi": {
+        "requirements": [
+            "lw12==0.9.2"
+        ]
+    },
+    "lyft": {
+        "requirements": [
+            "lyft_rides==0.2"
+        ]
+    },
+    "magicseaweed": {
+        "requirements": [
+            "magicseaweed==1.0.3"
+        ]
+    },
+    "mailbox": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "mailgun": {
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pymailgunner==1.4"
+        ]
+    },
+    "manual": {},
+    "manual_mqtt": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "map": {
+        "dependencies": [
+            "frontend"
+        ]
+    },
+    "marytts": {
+        "requirements": [
+            "speak2mary==1.4.0"
+        ]
+    },
+    "mastodon": {
+        "requirements": [
+            "Mastodon.py==1.5.1"
+        ]
+    },
+    "matrix": {
+        "requirements": [
+            "matrix-client==0.3.2"
+        ]
+    },
+    "maxcube": {
+        "requirements": [
+            "maxcube-api==0.1.0"
+        ]
+    },
+    "mcp23017": {
+        "requirements": [
+            "RPi.GPIO==0.7.0",
+            "adafruit-blinka==3.9.0",
+            "adafruit-circuitpython-mcp230xx==2.2.2"
+        ]
+    },
+    "media_extractor": {
+        "dependencies": [
+            "media_player"
+        ],
+        "requirements": [
+            "youtube_dl==2020.07.28"
+        ]
+    },
+    "media_player": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "mediaroom": {
+        "requirements": [
+            "pymediaroom==0.6.4"
+        ]
+    },
+    "melcloud": {
+        "requirements": [
+            "pymelcloud==2.5.2"
+        ]
+    },
+    "melissa": {
+        "requirements": [
+            "py-melissa-climate==2.0.0"
+        ]
+    },
+    "meraki": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "message_bird": {
+        "requirements": [
+            "messagebird==1.2.0"
+        ]
+    },
+    "met": {
+        "requirements": [
+            "pyMetno==0.7.0"
+        ]
+    },
+    "meteo_france": {
+        "requirements": [
+            "meteofrance-api==0.1.0"
+        ]
+    },
+    "meteoalarm": {
+        "requirements": [
+            "meteoalertapi==0.1.6"
+        ]
+    },
+    "metoffice": {
+        "requirements": [
+            "datapoint==0.9.5"
+        ]
+    },
+    "mfi": {
+        "requirements": [
+            "mficlient==0.3.0"
+        ]
+    },
+    "mhz19": {
+        "requirements": [
+            "pmsensor==0.4"
+        ]
+    },
+    "microsoft": {
+        "requirements": [
+            "pycsspeechtts==1.0.3"
+        ]
+    },
+    "microsoft_face": {
+        "dependencies": [
+            "camera"
+        ]
+    },
+    "microsoft_face_detect": {
+        "dependencies": [
+            "microsoft_face"
+        ]
+    },
+    "microsoft_face_identify": {
+        "dependencies": [
+            "microsoft_face"
+        ]
+    },
+    "miflora": {
+        "requirements": [
+            "bluepy==1.3.0",
+            "miflora==0.6.0"
+        ]
+    },
+    "mikrotik": {
+        "requirements": [
+            "librouteros==3.0.0"
+        ]
+    },
+    "mill": {
+        "requirements": [
+            "millheater==0.3.4"
+        ]
+    },
+    "min_max": {},
+    "minecraft_server": {
+        "requirements": [
+            "aiodns==2.0.0",
+            "getmac==0.8.2",
+            "mcstatus==2.3.0"
+        ]
+    },
+    "minio": {
+        "requirements": [
+            "minio==4.0.9"
+        ]
+    },
+    "mitemp_bt": {
+        "requirements": [
+            "mitemp_bt==0.0.3"
+        ]
+    },
+    "mjpeg": {},
+    "mobile_app": {
+        "dependencies": [
+            "http",
+            "webhook",
+            "person",
+            "tag"
+        ],
+        "after_dependencies": [
+            "cloud",
+            "camera"
+        ],
+        "requirements": [
+            "PyNaCl==1.3.0",
+            "emoji==0.5.4"
+        ]
+    },
+    "mochad": {
+        "requirements": [
+            "pymochad==0.2.0"
+        ]
+    },
+    "modbus": {
+        "requirements": [
+            "pymodbus==2.3.0"
+        ]
+    },
+    "modem_callerid": {
+        "requirements": [
+            "basicmodem==0.7"
+        ]
+    },
+    "mold_indicator": {},
+    "monoprice": {
+        "requirements": [
+            "pymonoprice==0.3"
+        ]
+    },
+    "moon": {},
+    "mpchc": {},
+    "mpd": {
+        "requirements": [
+            "python-mpd2==1.0.0"
+        ]
+    },
+    "mqtt": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "paho-mqtt==1.5.0"
+        ]
+    },
+    "mqtt_eventstream": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "mqtt_json": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "mqtt_room": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "mqtt_statestream": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "msteams": {
+        "requirements": [
+            "pymsteams==0.1.12"
+        ]
+    },
+    "mvglive": {
+        "requirements": [
+            "PyMVGLive==1.1.4"
+        ]
+    },
+    "mychevy": {
+        "requirements": [
+            "mychevy==2.0.1"
+        ]
+    },
+    "mycroft": {
+        "requirements": [
+            "mycroftapi==2.0"
+        ]
+    },
+    "myq": {
+        "requirements": [
+            "pymyq==2.0.5"
+        ]
+    },
+    "mysensors": {
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "requirements": [
+            "pymysensors==0.18.0"
+        ]
+    },
+    "mystrom": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "python-mystrom==1.1.2"
+        ]
+    },
+    "mythicbeastsdns": {
+        "requirements": [
+            "mbddns==0.1.2"
+        ]
+    },
+    "n26": {
+        "requirements": [
+            "n26==0.2.7"
+        ]
+    },
+    "nad": {
+        "requirements": [
+            "nad_receiver==0.0.12"
+        ]
+    },
+    "namecheapdns": {
+        "requirements": [
+            "defusedxml==0.6.0"
+        ]
+    },
+    "nanoleaf": {
+        "requirements": [
+            "pynanoleaf==0.0.5"
+        ]
+    },
+    "neato": {
+        "requirements": [
+            "pybotvac==0.0.17"
+        ]
+    },
+    "nederlandse_spoorwegen": {
+        "requirements": [
+            "nsapi==3.0.4"
+        ]
+    },
+    "nello": {
+        "requirements": [
+            "pynello==2.0.2"
+        ]
+    },
+    "ness_alarm": {
+        "requirements": [
+            "nessclient==0.9.15"
+        ]
+    },
+    "nest": {
+        "requirements": [
+            "python-nest==4.1.0"
+        ]
+    },
+    "netatmo": {
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "requirements": [
+            "pyatmo==4.0.0"
+        ]
+    },
+    "netdata": {
+        "requirements": [
+            "netdata==0.2.0"
+        ]
+    },
+    "netgear": {
+        "requirements": [
+            "pynetgear==0.6.1"
+        ]
+    },
+    "netgear_lte": {
+        "requirements": [
+            "eternalegypt==0.0.11"
+        ]
+    },
+    "netio": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pynetio==0.1.9.1"
+        ]
+    },
+    "neurio_energy": {
+        "requirements": [
+            "neurio==0.3.1"
+        ]
+    },
+    "nexia": {
+        "requirements": [
+            "nexia==0.9.3"
+        ]
+    },
+    "nextbus": {
+        "requirements": [
+            "py_nextbusnext==0.1.4"
+        ]
+    },
+    "nextcloud": {
+        "requirements": [
+            "nextcloudmonitor==1.1.0"
+        ]
+    },
+    "nfandroidtv": {},
+    "nightscout": {
+        "requirements": [
+            "py-nightscout==1.2.1"
+        ]
+    },
+    "niko_home_control": {
+        "requirements": [
+            "niko-home-control==0.2.1"
+        ]
+    },
+    "nilu": {
+        "requirements": [
+            "niluclient==0.1.2"
+        ]
+    },
+    "nissan_leaf": {
+        "requirements": [
+            "pycarwings2==2.9"
+        ]
+    },
+    "nmap_tracker": {
+        "requirements": [
+            "python-nmap==0.6.1",
+            "getmac==0.8.2"
+        ]
+    },
+    "nmbs": {
+        "requirements": [
+            "pyrail==0.0.3"
+        ]
+    },
+    "no_ip": {},
+    "noaa_tides": {
+        "requirements": [
+            "py_noaa==0.3.0"
+        ]
+    },
+    "norway_air": {
+        "requirements": [
+            "pyMetno==0.7.0"
+        ]
+    },
+    "notify": {},
+    "notify_events": {
+        "requirements": [
+            "notify-events==1.0.4"
+        ]
+    },
+    "notion": {
+        "requirements": [
+            "aionotion==1.1.0"
+        ]
+    },
+    "nsw_fuel_station": {
+        "requirements": [
+            "nsw-fuel-api-client==1.0.10"
+        ]
+    },
+    "nsw_rural_fire_service_feed": {
+        "requirements": [
+            "aio_geojson_nsw_rfs_incidents==0.3"
+        ]
+    },
+    "nuheat": {
+        "requirements": [
+            "nuheat==0.3.0"
+        ]
+    },
+    "nuimo_controller": {
+        "requirements": [
+            "--only-binary=all nuimo==0.1.0"
+        ]
+    },
+    "nuki": {
+        "requirements": [
+            "pynuki==1.3.8"
+        ]
+    },
+    "numato": {
+        "requirements": [
+            "numato-gpio==0.8.0"
+        ]
+    },
+    "nut": {
+        "requirements": [
+            "pynut2==2.1.2"
+        ]
+    },
+    "nws": {
+        "requirements": [
+            "pynws==1.2.1"
+        ]
+    },
+    "nx584": {
+        "requirements": [
+            "pynx584==0.5"
+        ]
+    },
+    "nzbget": {
+        "requirements": [
+            "pynzbgetapi==0.2.0"
+        ]
+    },
+    "oasa_telematics": {
+        "requirements": [
+            "oasatelematics==0.3"
+        ]
+    },
+    "obihai": {
+        "requirements": [
+            "pyobihai==1.2.3"
+        ]
+    },
+    "octoprint": {
+        "after_dependencies": [
+            "discovery"
+        ]
+    },
+    "oem": {
+        "requirements": [
+            "oemthermostat==1.1"
+        ]
+    },
+    "ohmconnect": {
+        "requirements": [
+            "defusedxml==0.6.0"
+        ]
+    },
+    "ombi": {
+        "requirements": [
+            "pyombi==0.1.10"
+        ]
+    },
+    "onboarding": {
+        "dependencies": [
+            "auth",
+            "http",
+            "person"
+        ]
+    },
+    "onewire": {
+        "requirements": [
+            "pyownet==0.10.0.post1"
+        ]
+    },
+    "onkyo": {
+        "requirements": [
+            "onkyo-eiscp==1.2.7"
+        ]
+    },
+    "onvif": {
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "onvif-zeep-async==0.5.0",
+            "WSDiscovery==2.0.0"
+        ]
+    },
+    "openalpr_cloud": {},
+    "openalpr_local": {},
+    "opencv": {
+        "requirements": [
+            "numpy==1.19.1",
+            "opencv-python-headless==4.3.0.36"
+        ]
+    },
+    "openerz": {
+        "requirements": [
+            "openerz-api==0.1.0"
+        ]
+    },
+    "openevse": {
+        "requirements": [
+            "openevsewifi==0.4"
+        ]
+    },
+    "openexchangerates": {},
+    "opengarage": {
+        "requirements": [
+            "open-garage==0.1.4"
+        ]
+    },
+    "openhardwaremonitor": {},
+    "openhome": {
+        "requirements": [
+            "openhomedevice==0.7.2"
+        ]
+    },
+    "opensensemap": {
+        "requirements": [
+            "opensensemap-api==0.1.5"
+        ]
+    },
+    "opensky": {},
+    "opentherm_gw": {
+        "requirements": [
+            "pyotgw==0.6b1"
+        ]
+    },
+    "openuv": {
+        "requirements": [
+            "pyopenuv==1.0.9"
+        ]
+    },
+    "openweathermap": {
+        "requirements": [
+            "pyowm==2.10.0"
+        ]
+    },
+    "opnsense": {
+        "requirements": [
+            "pyopnsense==0.2.0"
+        ]
+    },
+    "opple": {
+        "requirements": [
+            "pyoppleio==1.0.5"
+        ]
+    },
+    "orangepi_gpio": {
+        "requirements": [
+            "OPi.GPIO==0.4.0"
+        ]
+    },
+    "oru": {
+        "requirements": [
+            "oru==0.1.11"
+        ]
+    },
+    "orvibo": {
+        "requirements": [
+            "orvibo==1.1.1"
+        ]
+    },
+    "osramlightify": {
+        "requirements": [
+            "lightify==1.0.7.2"
+        ]
+    },
+    "otp": {
+        "requirements": [
+            "pyotp==2.3.0"
+        ]
+    },
+    "ovo_energy": {
+        "requirements": [
+            "ovoenergy==1.1.6"
+        ]
+    },
+    "owntracks": {
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "mqtt",
+            "cloud"
+        ],
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ]
+    },
+    "ozw": {
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "requirements": [
+            "python-openzwave-mqtt==1.0.4"
+        ]
+    },
+    "panasonic_bluray": {
+        "requirements": [
+            "panacotta==0.1"
+        ]
+    },
+    "panasonic_viera": {
+        "requirements": [
+            "panasonic_viera==0.3.5"
+        ]
+    },
+    "pandora": {
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "panel_custom": {
+        "dependencies": [
+            "frontend"
+        ]
+    },
+    "panel_iframe": {
+        "dependencies": [
+            "frontend"
+        ]
+    },
+    "pcal9535a": {
+        "requirements": [
+            "pcal9535a==0.7"
+        ]
+    },
+    "pencom": {
+        "requirements": [
+            "pencompy==0.0.3"
+        ]
+    },
+    "persistent_notification": {},
+    "person": {
+        "after_dependencies": [
+            "device_tracker"
+        ]
+    },
+    "philips_js": {
+        "requirements": [
+            "ha-philipsjs==0.0.8"
+        ]
+    },
+    "pi4ioe5v9xxxx": {
+        "requirements": [
+            "pi4ioe5v9xxxx==0.0.2"
+        ]
+    },
+    "pi_hole": {
+        "requirements": [
+            "hole==0.5.1"
+        ]
+    },
+    "picotts": {},
+    "piglow": {
+        "requirements": [
+            "piglow==1.2.4"
+        ]
+    },
+    "pilight": {
+        "requirements": [
+            "pilight==0.1.1"
+        ]
+    },
+    "ping": {},
+    "pioneer": {},
+    "pjlink": {
+        "requirements": [
+            "pypjlink2==1.2.1"
+        ]
+    },
+    "plaato": {
+        "dependencies": [
+            "webhook"
+        ]
+    },
+    "plant": {
+        "after_dependencies": [
+            "recorder"
+        ]
+    },
+    "plex": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "sonos"
+        ],
+        "requirements": [
+            "plexapi==4.0.0",
+            "plexauth==0.0.5",
+            "plexwebsocket==0.0.11"
+        ]
+    },
+    "plugwise": {
+        "requirements": [
+            "Plugwise_Smile==1.1.0"
+        ]
+    },
+    "plum_lightpad": {
+        "requirements": [
+            "plumlightpad==0.0.11"
+        ]
+    },
+    "pocketcasts": {
+        "requirements": [
+            "pocketcasts==0.1"
+        ]
+    },
+    "point": {
+        "dependencies": [
+            "webhook",
+            "http"
+        ],
+        "requirements": [
+            "pypoint==1.1.2"
+        ]
+    },
+    "poolsense": {
+        "requirements": [
+            "poolsense==0.0.8"
+        ]
+    },
+    "powerwall": {
+        "requirements": [
+            "tesla-powerwall==0.2.12"
+        ]
+    },
+    "proliphix": {
+        "requirements": [
+            "proliphix==0.4.1"
+        ]
+    },
+    "prometheus": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "prometheus_client==0.7.1"
+        ]
+    },
+    "prowl": {},
+    "proximity": {
+        "dependencies": [
+            "device_tracker",
+            "zone"
+        ]
+    },
+    "proxmoxve": {
+        "requirements": [
+            "proxmoxer==1.1.1"
+        ]
+    },
+    "proxy": {
+        "requirements": [
+            "pillow==7.1.2"
+        ]
+    },
+    "ps4": {
+        "requirements": [
+            "pyps4-2ndscreen==1.1.1"
+        ]
+    },
+    "ptvsd": {
+        "requirements": [
+            "ptvsd==4.3.2"
+        ]
+    },
+    "pulseaudio_loopback": {
+        "requirements": [
+            "pulsectl==20.2.4"
+        ]
+    },
+    "push": {
+        "dependencies": [
+            "webhook"
+        ]
+    },
+    "pushbullet": {
+        "requirements": [
+            "pushbullet.py==0.11.0"
+        ]
+    },
+    "pushover": {
+        "requirements": [
+            "pushover_complete==1.1.1"
+        ]
+    },
+    "pushsafer": {},
+    "pvoutput": {
+        "after_dependencies": [
+            "rest"
+        ]
+    },
+    "pvpc_hourly_pricing": {
+        "requirements": [
+            "aiopvpc==2.0.2"
+        ]
+    },
+    "pyload": {},
+    "python_script": {
+        "requirements": [
+            "restrictedpython==5.0"
+        ]
+    },
+    "qbittorrent": {
+        "requirements": [
+            "python-qbittorrent==0.4.1"
+        ]
+    },
+    "qld_bushfire": {
+        "requirements": [
+            "georss_qld_bushfire_alert_client==0.3"
+        ]
+    },
+    "qnap": {
+        "requirements": [
+            "qnapstats==0.3.0"
+        ]
+    },
+    "qrcode": {
+        "requirements": [
+            "pillow==7.1.2",
+            "pyzbar==0.1.7"
+        ]
+    },
+    "quantum_gateway": {
+        "requirements": [
+            "quantum-gateway==0.0.5"
+        ]
+    },
+    "qvr_pro": {
+        "requirements": [
+            "pyqvrpro==0.52"
+        ]
+    },
+    "qwikswitch": {
+        "requirements": [
+            "pyqwikswitch==0.93"
+        ]
+    },
+    "rachio": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "requirements": [
+            "rachiopy==0.1.4"
+        ]
+    },
+    "radarr": {},
+    "radiotherm": {
+        "requirements": [
+            "radiotherm==2.0.0"
+        ]
+    },
+    "rainbird": {
+        "requirements": [
+            "pyrainbird==0.4.2"
+        ]
+    },
+    "raincloud": {
+        "requirements": [
+            "raincloudy==0.0.7"
+        ]
+    },
+    "rainforest_eagle": {
+        "requirements": [
+            "eagle200_reader==0.2.4",
+            "uEagle==0.0.1"
+        ]
+    },
+    "rainmachine": {
+        "requirements": [
+            "regenmaschine==2.1.0"
+        ]
+    },
+    "random": {},
+    "raspihats": {
+        "requirements": [
+            "raspihats==2.2.3",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "raspyrfm": {
+        "requirements": [
+            "raspyrfm-client==1.2.8"
+        ]
+    },
+    "recollect_waste": {
+        "requirements": [
+            "recollect-waste==1.0.1"
+        ]
+    },
+    "recorder": {
+        "requirements": [
+            "sqlalchemy==1.3.18"
+        ]
+    },
+    "recswitch": {
+        "requirements": [
+            "pyrecswitch==1.0.2"
+        ]
+    },
+    "reddit": {
+        "requirements": [
+            "praw==6.5.1"
+        ]
+    },
+    "rejseplanen": {
+        "requirements": [
+            "rjpl==0.3.6"
+        ]
+    },
+    "remember_the_milk": {
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "RtmAPI==0.7.2",
+            "httplib2==0.10.3"
+        ]
+    },
+    "remote": {},
+    "remote_rpi_gpio": {
+        "requirements": [
+            "gpiozero==1.5.1"
+        ]
+    },
+    "repetier": {
+        "requirements": [
+            "pyrepetier==3.0.5"
+        ]
+    },
+    "rest": {
+        "requirements": [
+            "jsonpath==0.82",
+            "xmltodict==0.12.0"
+        ]
+    },
+    "rest_command": {},
+    "rflink": {
+        "requirements": [
+            "rflink==0.0.52"
+        ]
+    },
+    "rfxtrx": {
+        "requirements": [
+            "pyRFXtrx==0.25"
+        ]
+    },
+    "ring": {
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "ring_doorbell==0.6.0"
+        ]
+    },
+    "ripple": {
+        "requirements": [
+            "python-ripple-api==0.0.3"
+        ]
+    },
+    "rmvtransport": {
+        "requirements": [
+            "PyRMVtransport==0.2.9"
+        ]
+    },
+    "rocketchat": {
+        "requirements": [
+            "rocketchat-API==0.6.1"
+        ]
+    },
+    "roku": {
+        "requirements": [
+            "rokuecp==0.5.0"
+        ]
+    },
+    "roomba": {
+        "requirements": [
+            "roombapy==1.6.1"
+        ]
+    },
+    "route53": {
+        "requirements": [
+            "boto3==1.9.252"
+        ]
+    },
+    "rova": {
+        "requirements": [
+            "rova==0.1.0"
+        ]
+    },
+    "rpi_camera": {},
+    "rpi_gpio": {
+        "requirements": [
+            "RPi.GPIO==0.7.0"
+        ]
+    },
+    "rpi_gpio_pwm": {
+        "requirements": [
+            "pwmled==1.5.0"
+        ]
+    },
+    "rpi_pfio": {
+        "requirements": [
+            "pifacecommon==4.2.2",
+            "pifacedigitalio==3.0.5"
+        ]
+    },
+    "rpi_rf": {
+        "requirements": [
+            "rpi-rf==0.9.7"
+        ]
+    },
+    "rss_feed_template": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "rtorrent": {},
+    "russound_rio": {
+        "requirements": [
+            "russound_rio==0.1.7"
+        ]
+    },
+    "russound_rnet": {
+        "requirements": [
+            "russound==0.1.9"
+        ]
+    },
+    "sabnzbd": {
+        "dependencies": [
+            "configurator"
+        ],
+        "after_dependencies": [
+            "discovery"
+        ],
+        "requirements": [
+            "pysabnzbd==1.1.0"
+        ]
+    },
+    "safe_mode": {
+        "dependencies": [
+            "frontend",
+            "persistent_notification",
+            "cloud"
+        ]
+    },
+    "saj": {
+        "requirements": [
+            "pysaj==0.0.16"
+        ]
+    },
+    "salt": {
+        "requirements": [
+            "saltbox==0.1.3"
+        ]
+    },
+    "samsungtv": {
+        "requirements": [
+            "samsungctl[websocket]==0.7.1",
+            "samsungtvws[websocket]==1.4.0"
+        ]
+    },
+    "satel_integra": {
+        "requirements": [
+            "satel_integra==0.3.4"
+        ]
+    },
+    "scene": {},
+    "schluter": {
+        "requirements": [
+            "py-schluter==0.1.7"
+        ]
+    },
+    "scrape": {
+        "after_dependencies": [
+            "rest"
+        ],
+        "requirements": [
+            "beautifulsoup4==4.9.0"
+        ]
+    },
+    "script": {},
+    "scsgate": {
+        "requirements": [
+            "scsgate==0.1.0"
+        ]
+    },
+    "search": {
+        "dependencies": [
+            "websocket_api"
+        ],
+        "after_dependencies": [
+            "scene",
+            "group",
+            "automation",
+            "script"
+        ]
+    },
+    "season": {
+        "requirements": [
+            "ephem==3.7.7.0"
+        ]
+    },
+    "sendgrid": {
+        "requirements": [
+            "sendgrid==6.2.1"
+        ]
+    },
+    "sense": {
+        "requirements": [
+            "sense_energy==0.7.2"
+        ]
+    },
+    "sensehat": {
+        "requirements": [
+            "sense-hat==2.2.0"
+        ]
+    },
+    "sensibo": {
+        "requirements": [
+            "pysensibo==1.0.3"
+        ]
+    },
+    "sensor": {},
+    "sentry": {
+        "requirements": [
+            "sentry-sdk==0.13.5"
+        ]
+    },
+    "serial": {
+        "requirements": [
+            "pyserial-asyncio==0.4"
+        ]
+    },
+    "serial_pm": {
+        "requirements": [
+            "pmsensor==0.4"
+        ]
+    },
+    "sesame": {
+        "requirements": [
+            "pysesame2==1.0.1"
+        ]
+    },
+    "seven_segments": {
+        "requirements": [
+            "pillow==7.1.2"
+        ]
+    },
+    "seventeentrack": {
+        "requirements": [
+            "py17track==2.2.2"
+        ]
+    },
+    "shell_command": {},
+    "shiftr": {
+        "requirements": [
+            "paho-mqtt==1.5.0"
+        ]
+    },
+    "shodan": {
+        "requirements": [
+            "shodan==1.23.0"
+        ]
+    },
+    "shopping_list": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "sht31": {
+        "requirements": [
+            "Adafruit-GPIO==1.0.3",
+            "Adafruit-SHT31==1.0.2"
+        ]
+    },
+    "sigfox": {},
+    "sighthound": {
+        "requirements": [
+            "pillow==7.1.2",
+            "simplehound==0.3"
+        ]
+    },
+    "signal_messenger": {
+        "requirements": [
+            "pysignalclirestapi==0.3.4"
+        ]
+    },
+    "simplepush": {
+        "requirements": [
+            "simplepush==1.1.4"
+        ]
+    },
+    "simplisafe": {
+        "requirements": [
+            "simplisafe-python==9.2.2"
+        ]
+    },
+    "simulated": {},
+    "sinch": {
+        "requirements": [
+            "clx-sdk-xms==1.0.0"
+        ]
+    },
+    "sisyphus": {
+        "requirements": [
+            "sisyphus-control==2.2.1"
+        ]
+    },
+    "sky_hub": {
+        "requirements": [
+            "pyskyqhub==0.1.1"
+        ]
+    },
+    "skybeacon": {
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ]
+    },
+    "skybell": {
+        "requirements": [
+            "skybellpy==0.6.1"
+        ]
+    },
+    "slack": {
+        "requirements": [
+            "slackclient==2.5.0"
+        ]
+    },
+    "sleepiq": {
+        "requirements": [
+            "sleepyq==0.7"
+        ]
+    },
+    "slide": {
+        "requirements": [
+            "goslide-api==0.5.1"
+        ]
+    },
+    "sma": {
+        "requirements": [
+            "pysma==0.3.5"
+        ]
+    },
+    "smappee": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pysmappee==0.2.9"
+        ]
+    },
+    "smarthab": {
+        "requirements": [
+            "smarthab==0.21"
+        ]
+    },
+    "smartthings": {
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "requirements": [
+            "pysmartapp==0.3.2",
+            "pysmartthings==0.7.3"
+        ]
+    },
+    "smarty": {
+        "requirements": [
+            "pysmarty==0.8"
+        ]
+    },
+    "smhi": {
+        "requirements": [
+            "smhi-pkg==1.0.13"
+        ]
+    },
+    "sms": {
+        "requirements": [
+            "python-gammu==3.0"
+        ]
+    },
+    "smtp": {},
+    "snapcast": {
+        "requirements": [
+            "snapcast==2.0.10"
+        ]
+    },
+    "snips": {
+        "dependencies": [
+            "mqtt"
+        ]
+    },
+    "snmp": {
+        "requirements": [
+            "pysnmp==4.4.12"
+        ]
+    },
+    "sochain": {
+        "requirements": [
+            "python-sochain-api==0.0.2"
+        ]
+    },
+    "socialblade": {
+        "requirements": [
+            "socialbladeclient==0.5"
+        ]
+    },
+    "solaredge": {
+        "requirements": [
+            "solaredge==0.0.2",
+            "stringcase==1.2.0"
+        ]
+    },
+    "solaredge_local": {
+        "requirements": [
+            "solaredge-local==0.2.0"
+        ]
+    },
+    "solarlog": {
+        "requirements": [
+            "sunwatcher==0.2.1"
+        ]
+    },
+    "solax": {
+        "requirements": [
+            "solax==0.2.3"
+        ]
+    },
+    "soma": {
+        "requirements": [
+            "pysoma==0.0.10"
+        ]
+    },
+    "somfy": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pymfy==0.9.0"
+        ]
+    },
+    "somfy_mylink": {
+        "requirements": [
+            "somfy-mylink-synergy==1.0.6"
+        ]
+    },
+    "sonarr": {
+        "requirements": [
+            "sonarr==0.2.3"
+        ]
+    },
+    "songpal": {
+        "requirements": [
+            "python-songpal==0.12"
+        ]
+    },
+    "sonos": {
+        "requirements": [
+            "pysonos==0.0.32"
+        ]
+    },
+    "sony_projector": {
+        "requirements": [
+            "pysdcp==1"
+        ]
+    },
+    "soundtouch": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "requirements": [
+            "libsoundtouch==0.8"
+        ]
+    },
+    "spaceapi": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "spc": {
+        "requirements": [
+            "pyspcwebgw==0.4.0"
+        ]
+    },
+    "speedtestdotnet": {
+        "requirements": [
+            "speedtest-cli==2.1.2"
+        ]
+    },
+    "spider": {
+        "requirements": [
+            "spiderpy==1.3.1"
+        ]
+    },
+    "splunk": {},
+    "spotcrime": {
+        "requirements": [
+            "spotcrime==1.0.4"
+        ]
+    },
+    "spotify": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "spotipy==2.12.0"
+        ]
+    },
+    "sql": {
+        "requirements": [
+            "sqlalchemy==1.3.18"
+        ]
+    },
+    "squeezebox": {
+        "requirements": [
+            "pysqueezebox==0.2.4"
+        ]
+    },
+    "ssdp": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "requirements": [
+            "defusedxml==0.6.0",
+            "netdisco==2.8.1"
+        ]
+    },
+    "starline": {
+        "requirements": [
+            "starline==0.1.3"
+        ]
+    },
+    "starlingbank": {
+        "requirements": [
+            "starlingbank==3.2"
+        ]
+    },
+    "startca": {
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "statistics": {
+        "after_dependencies": [
+            "recorder"
+        ]
+    },
+    "statsd": {
+        "requirements": [
+            "statsd==3.2.1"
+        ]
+    },
+    "steam_online": {
+        "requirements": [
+            "steamodd==4.21"
+        ]
+    },
+    "stiebel_eltron": {
+        "dependencies": [
+            "modbus"
+        ],
+        "requirements": [
+            "pystiebeleltron==0.0.1.dev2"
+        ]
+    },
+    "stookalert": {
+        "requirements": [
+            "stookalert==0.1.4"
+        ]
+    },
+    "stream": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "av==8.0.2"
+        ]
+    },
+    "streamlabswater": {
+        "requirements": [
+            "streamlabswater==1.0.1"
+        ]
+    },
+    "stt": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "suez_water": {
+        "requirements": [
+            "pysuez==0.1.17"
+        ]
+    },
+    "sun": {},
+    "supervisord": {},
+    "supla": {
+        "requirements": [
+            "pysupla==0.0.3"
+        ]
+    },
+    "surepetcare": {
+        "requirements": [
+            "surepy==0.2.5"
+        ]
+    },
+    "swiss_hydrological_data": {
+        "requirements": [
+            "swisshydrodata==0.0.3"
+        ]
+    },
+    "swiss_public_transport": {
+        "requirements": [
+            "python_opendata_transport==0.2.1"
+        ]
+    },
+    "swisscom": {},
+    "switch": {},
+    "switchbot": {
+        "requirements": [
+            "PySwitchbot==0.8.0"
+        ]
+    },
+    "switcher_kis": {
+        "requirements": [
+            "aioswitcher==1.2.0"
+        ]
+    },
+    "switchmate": {
+        "requirements": [
+            "pySwitchmate==0.4.6"
+        ]
+    },
+    "syncthru": {
+        "requirements": [
+            "pysyncthru==0.5.0",
+            "url-normalize==1.4.1"
+        ]
+    },
+    "synology": {
+        "requirements": [
+            "py-synology==0.2.0"
+        ]
+    },
+    "synology_chat": {},
+    "synology_dsm": {
+        "requirements": [
+            "python-synology==0.8.2"
+        ]
+    },
+    "synology_srm": {
+        "requirements": [
+            "synology-srm==0.2.0"
+        ]
+    },
+    "syslog": {},
+    "system_health": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "system_log": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "systemmonitor": {
+        "requirements": [
+            "psutil==5.7.0"
+        ]
+    },
+    "tado": {
+        "requirements": [
+            "python-tado==0.8.1"
+        ]
+    },
+    "tag": {},
+    "tahoma": {
+        "requirements": [
+            "tahoma-api==0.0.16"
+        ]
+    },
+    "tank_utility": {
+        "requirements": [
+            "tank_utility==1.4.0"
+        ]
+    },
+    "tankerkoenig": {
+        "requirements": [
+            "pytankerkoenig==0.0.6"
+        ]
+    },
+    "tapsaff": {
+        "requirements": [
+            "tapsaff==0.2.1"
+        ]
+    },
+    "tautulli": {
+        "requirements": [
+            "pytautulli==0.5.0"
+        ]
+    },
+    "tcp": {},
+    "ted5000": {
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "teksavvy": {},
+    "telegram": {
+        "dependencies": [
+            "telegram_bot"
+        ]
+    },
+    "telegram_bot": {
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "python-telegram-bot==11.1.0",
+            "PySocks==1.7.1"
+        ]
+    },
+    "tellduslive": {
+        "requirements": [
+            "tellduslive==0.10.11"
+        ]
+    },
+    "tellstick": {
+        "requirements": [
+            "tellcore-net==0.4",
+            "tellcore-py==1.1.2"
+        ]
+    },
+    "telnet": {},
+    "temper": {
+        "requirements": [
+            "temperusb==1.5.3"
+        ]
+    },
+    "template": {
+        "after_dependencies": [
+            "group"
+        ]
+    },
+    "tensorflow": {
+        "requirements": [
+            "tensorflow==2.2.0",
+            "tf-slim==1.1.0",
+            "tf-models-official==2.2.1",
+            "pycocotools==2.0.1",
+            "numpy==1.19.1",
+            "protobuf==3.12.2",
+            "pillow==7.1.2"
+        ]
+    },
+    "tesla": {
+        "requirements": [
+            "teslajsonpy==0.10.4"
+        ]
+    },
+    "tfiac": {
+        "requirements": [
+            "pytfiac==0.4"
+        ]
+    },
+    "thermoworks_smoke": {
+        "requirements": [
+            "stringcase==1.2.0",
+            "thermoworks_smoke==0.1.8"
+        ]
+    },
+    "thethingsnetwork": {},
+    "thingspeak": {
+        "requirements": [
+            "thingspeak==1.0.0"
+        ]
+    },
+    "thinkingcleaner": {
+        "requirements": [
+            "pythinkingcleaner==0.0.3"
+        ]
+    },
+    "thomson": {},
+    "threshold": {},
+    "tibber": {
+        "requirements": [
+            "pyTibber==0.14.0"
+        ]
+    },
+    "tikteck": {
+        "requirements": [
+            "tikteck==0.4"
+        ]
+    },
+    "tile": {
+        "requirements": [
+            "pytile==4.0.0"
+        ]
+    },
+    "time_date": {},
+    "timer": {},
+    "tmb": {
+        "requirements": [
+            "tmb==0.0.4"
+        ]
+    },
+    "tod": {},
+    "todoist": {
+        "requirements": [
+            "todoist-python==8.0.0"
+        ]
+    },
+    "tof": {
+        "dependencies": [
+            "rpi_gpio"
+        ],
+        "requirements": [
+            "VL53L1X2==0.1.5"
+        ]
+    },
+    "tomato": {},
+    "toon": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "requirements": [
+            "toonapi==0.2.0"
+        ]
+    },
+    "torque": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "totalconnect": {
+        "requirements": [
+            "total_connect_client==0.55"
+        ]
+    },
+    "touchline": {
+        "requirements": [
+            "pytouchline==0.7"
+        ]
+    },
+    "tplink": {
+        "requirements": [
+            "pyHS100==0.3.5.1"
+        ]
+    },
+    "tplink_lte": {
+        "requirements": [
+            "tp-connected==0.0.4"
+        ]
+    },
+    "traccar": {
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pytraccar==0.9.0",
+            "stringcase==1.2.0"
+        ]
+    },
+    "trackr": {
+        "requirements": [
+            "pytrackr==0.0.5"
+        ]
+    },
+    "tradfri": {
+        "requirements": [
+            "pytradfri[async]==6.4.0"
+        ]
+    },
+    "trafikverket_train": {
+        "requirements": [
+            "pytrafikverket==0.1.6.1"
+        ]
+    },
+    "trafikverket_weatherstation": {
+        "requirements": [
+            "pytrafikverket==0.1.6.1"
+        ]
+    },
+    "transmission": {
+        "requirements": [
+            "transmissionrpc==0.11"
+        ]
+    },
+    "transport_nsw": {
+        "requirements": [
+            "PyTransportNSW==0.1.1"
+        ]
+    },
+    "travisci": {
+        "requirements": [
+            "TravisPy==0.3.5"
+        ]
+    },
+    "trend": {
+        "requirements": [
+            "numpy==1.19.1"
+        ]
+    },
+    "tts": {
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "media_player"
+        ],
+        "requirements": [
+            "mutagen==1.44.0"
+        ]
+    },
+    "tuya": {
+        "requirements": [
+            "tuyaha==0.0.7"
+        ]
+    },
+    "twentemilieu": {
+        "requirements": [
+            "twentemilieu==0.3.0"
+        ]
+    },
+    "twilio": {
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "twilio==6.32.0"
+        ]
+    },
+    "twilio_call": {
+        "dependencies": [
+            "twilio"
+        ]
+    },
+    "twilio_sms": {
+        "dependencies": [
+            "twilio"
+        ]
+    },
+    "twitch": {
+        "requirements": [
+            "python-twitch-client==0.6.0"
+        ]
+    },
+    "twitter": {
+        "requirements": [
+            "TwitterAPI==2.5.11"
+        ]
+    },
+    "ubee": {
+        "requirements": [
+            "pyubee==0.10"
+        ]
+    },
+    "ubus": {},
+    "ue_smart_radio": {},
+    "uk_transport": {},
+    "unifi": {
+        "requirements": [
+            "aiounifi==23"
+        ]
+    },
+    "unifi_direct": {
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "unifiled": {
+        "requirements": [
+            "unifiled==0.11"
+        ]
+    },
+    "universal": {},
+    "upb": {
+        "requirements": [
+            "upb_lib==0.4.11"
+        ]
+    },
+    "upc_connect": {
+        "requirements": [
+            "connect-box==0.2.5"
+        ]
+    },
+    "upcloud": {
+        "requirements": [
+            "upcloud-api==0.4.5"
+        ]
+    },
+    "updater": {
+        "requirements": [
+            "distro==1.5.0"
+        ]
+    },
+    "upnp": {
+        "requirements": [
+            "async-upnp-client==0.14.13"
+        ]
+    },
+    "uptime": {},
+    "uptimerobot": {
+        "requirements": [
+            "pyuptimerobot==0.0.5"
+        ]
+    },
+    "uscis": {
+        "requirements": [
+            "uscisstatus==0.1.1"
+        ]
+    },
+    "usgs_earthquakes_feed": {
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "utility_meter": {},
+    "uvc": {
+        "requirements": [
+            "uvcclient==0.11.0"
+        ]
+    },
+    "vacuum": {},
+    "vallox": {
+        "requirements": [
+            "vallox-websocket-api==2.4.0"
+        ]
+    },
+    "vasttrafik": {
+        "requirements": [
+            "vtjp==0.1.14"
+        ]
+    },
+    "velbus": {
+        "requirements": [
+            "python-velbus==2.0.43"
+        ]
+    },
+    "velux": {
+        "requirements": [
+            "pyvlx==0.2.16"
+        ]
+    },
+    "venstar": {
+        "requirements": [
+            "venstarcolortouch==0.12"
+        ]
+    },
+    "vera": {
+        "requirements": [
+            "pyvera==0.3.9"
+        ]
+    },
+    "verisure": {
+        "requirements": [
+            "jsonpath==0.82",
+            "vsure==1.5.4"
+        ]
+    },
+    "versasense": {
+        "requirements": [
+            "pyversasense==0.0.6"
+        ]
+    },
+    "version": {
+        "requirements": [
+            "pyhaversion==3.3.0"
+        ]
+    },
+    "vesync": {
+        "requirements": [
+            "pyvesync==1.1.0"
+        ]
+    },
+    "viaggiatreno": {},
+    "vicare": {
+        "requirements": [
+            "PyViCare==0.2.0"
+        ]
+    },
+    "vilfo": {
+        "requirements": [
+            "vilfo-api-client==0.3.2"
+        ]
+    },
+    "vivotek": {
+        "requirements": [
+            "libpyvivotek==0.4.0"
+        ]
+    },
+    "vizio": {
+        "requirements": [
+            "pyvizio==0.1.49"
+        ]
+    },
+    "vlc": {
+        "requirements": [
+            "python-vlc==1.1.2"
+        ]
+    },
+    "vlc_telnet": {
+        "requirements": [
+            "python-telnet-vlc==1.0.4"
+        ]
+    },
+    "voicerss": {},
+    "volkszaehler": {
+        "requirements": [
+            "volkszaehler==0.1.2"
+        ]
+    },
+    "volumio": {
+        "requirements": [
+            "pyvolumio==0.1.1"
+        ]
+    },
+    "volvooncall": {
+        "requirements": [
+            "volvooncall==0.8.12"
+        ]
+    },
+    "vultr": {
+        "requirements": [
+            "vultr==0.1.2"
+        ]
+    },
+    "w800rf32": {
+        "requirements": [
+            "pyW800rf32==0.1"
+        ]
+    },
+    "wake_on_lan": {
+        "requirements": [
+            "wakeonlan==1.1.6"
+        ]
+    },
+    "waqi": {
+        "requirements": [
+            "waqiasync==1.0.0"
+        ]
+    },
+    "water_heater": {},
+    "waterfurnace": {
+        "requirements": [
+            "waterfurnace==1.1.0"
+        ]
+    },
+    "watson_iot": {
+        "requirements": [
+            "ibmiotf==0.3.4"
+        ]
+    },
+    "watson_tts": {
+        "requirements": [
+            "ibm-watson==4.0.1"
+        ]
+    },
+    "waze_travel_time": {
+        "requirements": [
+            "WazeRouteCalculator==0.12"
+        ]
+    },
+    "weather": {},
+    "webhook": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "webostv": {
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "aiopylgtv==0.3.3"
+        ]
+    },
+    "websocket_api": {
+        "dependencies": [
+            "http"
+        ]
+    },
+    "wemo": {
+        "requirements": [
+            "pywemo==0.4.45"
+        ]
+    },
+    "whois": {
+        "requirements": [
+            "python-whois==0.7.2"
+        ]
+    },
+    "wiffi": {
+        "requirements": [
+            "wiffi==1.0.1"
+        ]
+    },
+    "wink": {
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "requirements": [
+            "pubnubsub-handler==1.0.8",
+            "python-wink==1.10.5"
+        ]
+    },
+    "wirelesstag": {
+        "requirements": [
+            "wirelesstagpy==0.4.1"
+        ]
+    },
+    "withings": {
+        "dependencies": [
+            "http",
+            "webhook"
+        ],
+        "requirements": [
+            "withings-api==2.1.6"
+        ]
+    },
+    "wled": {
+        "requirements": [
+            "wled==0.4.3"
+        ]
+    },
+    "wolflink": {
+        "requirements": [
+            "wolf_smartset==0.1.4"
+        ]
+    },
+    "workday": {
+        "requirements": [
+            "holidays==0.10.3"
+        ]
+    },
+    "worldclock": {},
+    "worldtidesinfo": {},
+    "worxlandroid": {},
+    "wsdot": {},
+    "wunderground": {},
+    "x10": {},
+    "xbee": {
+        "requirements": [
+            "xbee-helper==0.0.7"
+        ]
+    },
+    "xbox_live": {
+        "requirements": [
+            "xboxapi==2.0.1"
+        ]
+    },
+    "xeoma": {
+        "requirements": [
+            "pyxeoma==1.4.1"
+        ]
+    },
+    "xfinity": {
+        "requirements": [
+            "xfinity-gateway==0.0.4"
+        ]
+    },
+    "xiaomi": {
+        "dependencies": [
+            "ffmpeg"
+        ]
+    },
+    "xiaomi_aqara": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "requirements": [
+            "PyXiaomiGateway==0.13.2"
+        ]
+    },
+    "xiaomi_miio": {
+        "requirements": [
+            "construct==2.9.45",
+            "python-miio==0.5.3"
+        ]
+    },
+    "xiaomi_tv": {
+        "requirements": [
+            "pymitv==1.4.3"
+        ]
+    },
+    "xmpp": {
+        "requirements": [
+            "slixmpp==1.5.1"
+        ]
+    },
+    "xs1": {
+        "requirements": [
+            "xs1-api-client==3.0.0"
+        ]
+    },
+    "yale_smart_alarm": {
+        "requirements": [
+            "yalesmartalarmclient==0.1.6"
+        ]
+    },
+    "yamaha": {
+        "requirements": [
+            "rxv==0.6.0"
+        ]
+    },
+    "yamaha_musiccast": {
+        "requirements": [
+            "pymusiccast==0.1.6"
+        ]
+    },
+    "yandex_transport": {
+        "requirements": [
+            "aioymaps==1.0.0"
+        ]
+    },
+    "yandextts": {},
+    "yeelight": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "requirements": [
+            "yeelight==0.5.2"
+        ]
+    },
+    "yeelightsunflower": {
+        "requirements": [
+            "yeelightsunflower==0.0.10"
+        ]
+    },
+    "yessssms": {
+        "requirements": [
+            "YesssSMS==0.4.1"
+        ]
+    },
+    "yi": {
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "aioftp==0.12.0"
+        ]
+    },
+    "yr": {
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "zabbix": {
+        "requirements": [
+            "pyzabbix==0.7.4"
+        ]
+    },
+    "zamg": {},
+    "zengge": {
+        "requirements": [
+            "zengge==0.2"
+        ]
+    },
+    "zeroconf": {
+        "dependencies": [
+            "api"
+        ],
+        "requirements": [
+            "zeroconf==0.28.0"
+        ]
+    },
+    "zerproc": {
+        "requirements": [
+            "pyzerproc==0.2.5"
+        ]
+    },
+    "zestimate": {
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "zha": {
+        "requirements": [
+            "bellows==0.18.1",
+            "pyserial==3.4",
+            "zha-quirks==0.0.43",
+            "zigpy-cc==0.4.4",
+            "zigpy-deconz==0.9.2",
+            "zigpy==0.22.2",
+            "zigpy-xbee==0.12.1",
+            "zigpy-zigate==0.6.1"
+        ]
+    },
+    "zhong_hong": {
+        "requirements": [
+            "zhong_hong_hvac==1.0.9"
+        ]
+    },
+    "ziggo_mediabox_xl": {
+        "requirements": [
+            "ziggo-mediabox-xl==1.1.0"
+        ]
+    },
+    "zone": {},
+    "zoneminder": {
+        "requirements": [
+            "zm-py==0.4.0"
+        ]
+    },
+    "zwave": {
+        "requirements": [
+            "homeassistant-pyozw==0.1.10",
+            "pydispatcher==2.0.5"
+        ]
+    }
+}
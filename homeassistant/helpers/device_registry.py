@@ -32,6 +32,7 @@ CONNECTION_NETWORK_MAC = "mac"
 CONNECTION_UPNP = "upnp"
 CONNECTION_ZIGBEE = "zigbee"
 
+IDX_CONFIG_ENTRIES = "config_entries"
 IDX_CONNECTIONS = "connections"
 IDX_IDENTIFIERS = "identifiers"
 REGISTERED_DEVICE = "registered"
@@ -103,12 +104,14 @@ class DeviceRegistry:
 
     devices: Dict[str, DeviceEntry]
     deleted_devices: Dict[str, DeletedDeviceEntry]
-    _devices_index: Dict[str, Dict[str, Dict[str, str]]]
+    _devices_index: Dict[str, Dict[str, Dict[Any, Any]]]
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self._clear_index()
 
     @callback
@@ -181,14 +184,24 @@ class DeviceRegistry:
         self.devices[new_device.id] = new_device
 
         devices_index = self._devices_index[REGISTERED_DEVICE]
-        _remove_device_from_index(devices_index, old_device)
+        _remove_device_from_index(
+            devices_index, old_device, keep_config_entries=new_device.config_entries
+        )
         _add_device_to_index(devices_index, new_device)
 
     def _clear_index(self):
         """Clear the index."""
         self._devices_index = {
-            REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
-            DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
+            REGISTERED_DEVICE: {
+                IDX_IDENTIFIERS: {},
+                IDX_CONNECTIONS: {},
+                IDX_CONFIG_ENTRIES: {},
+            },
+            DELETED_DEVICE: {
+                IDX_IDENTIFIERS: {},
+                IDX_CONNECTIONS: {},
+                IDX_CONFIG_ENTRIES: {},
+            },
         }
 
     def _rebuild_index(self):
@@ -482,21 +495,28 @@ class DeviceRegistry:
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for device_id in list(
+            self._devices_index[REGISTERED_DEVICE][IDX_CONFIG_ENTRIES].get(
+                config_entry_id, ()
+            )
+        ):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
+        for device_id in list(
+            self._devices_index[DELETED_DEVICE][IDX_CONFIG_ENTRIES].get(
+                config_entry_id, ()
+            )
+        ):
+            deleted_device = self.deleted_devices[device_id]
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
-            if config_entries == {config_entry_id}:
-                # Permanently remove the device from the device registry.
-                self._remove_device(deleted_device)
-            else:
-                config_entries = config_entries - {config_entry_id}
-                # No need to reindex here since we currently
-                # do not have a lookup by config entry
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, config_entries=config_entries
+            # Permanently remove the device from the device registry if this
+            # was its last config entry.
+            self._remove_device(deleted_device)
+            if config_entries != {config_entry_id}:
+                self._add_device(
+                    attr.evolve(
+                        deleted_device,
+                        config_entries=config_entries - {config_entry_id},
+                    )
                 )
             self.async_schedule_save()
 
@@ -527,10 +547,11 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
+    # pylint: disable=protected-access
+    devices_index = registry._devices_index[REGISTERED_DEVICE]
     return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
+        registry.devices[device_id]
+        for device_id in devices_index[IDX_CONFIG_ENTRIES].get(config_entry_id, ())
     ]
 
 
@@ -543,11 +564,12 @@ def async_cleanup(
     """Clean up device registry."""
     # Find all devices that are referenced by a config_entry.
     config_entry_ids = {entry.entry_id for entry in hass.config_entries.async_entries()}
+    # pylint: disable=protected-access
+    config_entries_index = dev_reg._devices_index[REGISTERED_DEVICE][IDX_CONFIG_ENTRIES]
     references_config_entries = {
-        device.id
-        for device in dev_reg.devices.values()
-        for config_entry_id in device.config_entries
-        if config_entry_id in config_entry_ids
+        device_id
+        for config_entry_id in config_entry_ids
+        for device_id in config_entries_index.get(config_entry_id, ())
     }
 
     # Find all devices that are referenced in the entity registry.
@@ -560,12 +582,11 @@ def async_cleanup(
 
     # Find all referenced config entries that no longer exist
     # This shouldn't happen but have not been able to track down the bug :(
-    for device in list(dev_reg.devices.values()):
-        for config_entry_id in device.config_entries:
-            if config_entry_id not in config_entry_ids:
-                dev_reg.async_update_device(
-                    device.id, remove_config_entry_id=config_entry_id
-                )
+    for config_entry_id in set(config_entries_index) - config_entry_ids:
+        for device_id in list(config_entries_index.get(config_entry_id, ())):
+            dev_reg.async_update_device(
+                device_id, remove_config_entry_id=config_entry_id
+            )
 
 
 @callback
@@ -624,15 +645,32 @@ def _add_device_to_index(
         devices_index[IDX_IDENTIFIERS][identifier] = device.id
     for connection in device.connections:
         devices_index[IDX_CONNECTIONS][connection] = device.id
+    # Device ids of a config entry are kept in the order they were added
+    for config_entry_id in device.config_entries:
+        devices_index[IDX_CONFIG_ENTRIES].setdefault(config_entry_id, {})[
+            device.id
+        ] = None
 
 
 def _remove_device_from_index(
-    devices_index: dict, device: Union[DeviceEntry, DeletedDeviceEntry]
+    devices_index: dict,
+    device: Union[DeviceEntry, DeletedDeviceEntry],
+    keep_config_entries: Optional[Set[str]] = None,
 ) -> None:
-    """Remove a device from the index."""
+    """Remove a device from the index.
+
+    Config entries in keep_config_entries keep their position in the index.
+    """
     for identifier in device.identifiers:
         if identifier in devices_index[IDX_IDENTIFIERS]:
             del devices_index[IDX_IDENTIFIERS][identifier]
     for connection in device.connections:
         if connection in devices_index[IDX_CONNECTIONS]:
             del devices_index[IDX_CONNECTIONS][connection]
+    for config_entry_id in device.config_entries - (keep_config_entries or set()):
+        device_ids = devices_index[IDX_CONFIG_ENTRIES].get(config_entry_id)
+        if device_ids is None:
+            continue
+        device_ids.pop(device.id, None)
+        if not device_ids:
+            del devices_index[IDX_CONFIG_ENTRIES][config_entry_id]
@@ -2,9 +2,12 @@
 import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+from functools import partial
 from logging import Logger
+import random
+from time import monotonic
 from types import ModuleType
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
 
 from homeassistant.const import DEVICE_DEFAULT_NAME
 from homeassistant.core import CALLBACK_TYPE, callback, split_entity_id, valid_entity_id
@@ -28,8 +31,50 @@ SLOW_ADD_MIN_TIMEOUT = 60
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_POLL_SEMAPHORE = "entity_platform_poll_semaphore"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Maximum number of entity polls running at the same time across all platforms
+MAX_PARALLEL_POLLS = 32
+# Maximum number of polls of a platform without parallel updates running at the
+# same time, so a single async platform can't take all of MAX_PARALLEL_POLLS
+MAX_PARALLEL_PLATFORM_POLLS = 8
+# Platforms polling at least this many entities spread the polls over a
+# fraction of the scan interval instead of starting them all at once
+POLL_SPREAD_MIN_ENTITIES = 20
+POLL_SPREAD_FRACTION = 0.5
+
+
+class PollStats:
+    """Update latency of a polling entity."""
+
+    __slots__ = ["count", "skipped", "last", "total", "max"]
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.skipped = 0
+        self.last = 0.0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record the duration of an update."""
+        self.count += 1
+        self.last = duration
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats as a dict."""
+        return {
+            "count": self.count,
+            "skipped": self.skipped,
+            "last": self.last,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -60,7 +105,16 @@ class EntityPlatform:
         self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
+        # Polling entities waiting for or running an update
+        self._polling: Set[str] = set()
+        # Limits the polls of this platform, separate from the parallel updates
+        # so waiting polls don't hold on to a slot of MAX_PARALLEL_POLLS
+        self._poll_semaphore: Optional[asyncio.Semaphore] = None
+        # Methods to cancel polls spread over the scan interval
+        self._async_unsub_spread_polls: List[CALLBACK_TYPE] = []
+        # The first tick polls all entities right away
+        self._polled_once = False
+        self.poll_stats: Dict[str, PollStats] = {}
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -100,6 +154,7 @@ class EntityPlatform:
 
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
+            self._poll_semaphore = asyncio.Semaphore(parallel_updates)
 
         return self.parallel_updates
 
@@ -312,6 +367,7 @@ class EntityPlatform:
         ):
             return
 
+        self._polled_once = False
         self._async_unsub_polling = async_track_time_interval(
             self.hass, self._update_entity_states, self.scan_interval,
         )
@@ -493,6 +549,8 @@ class EntityPlatform:
             self._async_unsub_polling()
             self._async_unsub_polling = None
 
+        self._async_cancel_spread_polls()
+
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
 
@@ -504,6 +562,7 @@ class EntityPlatform:
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
+        self.poll_stats.pop(entity_id, None)
 
         # Clean up polling job if no longer needed
         if self._async_unsub_polling is not None and not any(
@@ -511,6 +570,7 @@ class EntityPlatform:
         ):
             self._async_unsub_polling()
             self._async_unsub_polling = None
+            self._async_cancel_spread_polls()
 
     async def async_extract_from_service(self, service_call, expand_group=True):
         """Extract all known and available entities from a service call.
@@ -553,34 +613,123 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
+    @callback
+    def _update_entity_states(self, now: datetime) -> None:
+        """Poll the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        Polls are queued per entity, an entity which is still updating is
+        skipped without holding back the others. To protect from flooding
+        the executor, no more updates than the parallel updates of the
+        platform and MAX_PARALLEL_POLLS overall run at the same time.
+        Platforms without parallel updates are capped at
+        MAX_PARALLEL_PLATFORM_POLLS.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
+        entities = [entity for entity in self.entities.values() if entity.should_poll]
+
+        first_tick = not self._polled_once
+        self._polled_once = True
+
+        if first_tick or len(entities) < POLL_SPREAD_MIN_ENTITIES:
+            for entity in entities:
+                self._async_poll_entity(entity)
+            return
+
+        # Spread the polls evenly with jitter to avoid bursts
+        self._async_cancel_spread_polls()
+        slot = self.scan_interval.total_seconds() * POLL_SPREAD_FRACTION / len(entities)
+        for idx, entity in enumerate(entities):
+            self._async_unsub_spread_polls.append(
+                async_call_later(
+                    self.hass,
+                    (idx + random.random()) * slot,
+                    partial(self._async_poll_spread_entity, entity),
+                )
+            )
+
+    @callback
+    def _async_poll_spread_entity(self, entity: "Entity", _now: datetime) -> None:
+        """Poll an entity at its spot in the scan interval."""
+        if self.entities.get(entity.entity_id) is entity:
+            self._async_poll_entity(entity)
+
+    @callback
+    def _async_cancel_spread_polls(self) -> None:
+        """Cancel the polls not yet started of the last scan interval."""
+        for unsub in self._async_unsub_spread_polls:
+            unsub()
+        self._async_unsub_spread_polls = []
+
+    @callback
+    def _async_poll_entity(self, entity: "Entity") -> None:
+        """Queue an update of a polling entity."""
+        entity_id = entity.entity_id
+        stats = self.poll_stats.get(entity_id)
+        if stats is None:
+            stats = self.poll_stats[entity_id] = PollStats()
+
+        if entity_id in self._polling:
+            stats.skipped += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
-                self.domain,
+                entity_id,
                 self.scan_interval,
             )
             return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        self._polling.add(entity_id)
+        self.hass.async_create_task(self._async_poll(entity))
 
-            if tasks:
-                await asyncio.gather(*tasks)
+    async def _async_poll(self, entity: "Entity") -> None:
+        """Update a polling entity once the platform has room for it."""
+        if self._poll_semaphore is None:
+            self._poll_semaphore = asyncio.Semaphore(MAX_PARALLEL_PLATFORM_POLLS)
+
+        try:
+            async with self._poll_semaphore:
+                await self._async_poll_update(entity)
+        finally:
+            self._polling.discard(entity.entity_id)
+
+    async def _async_poll_update(self, entity: "Entity") -> None:
+        """Update a polling entity and record how long it took."""
+        entity_id = entity.entity_id
+        # The entity may have been removed while waiting
+        if self.entities.get(entity_id) is not entity:
+            return
+
+        async with _async_get_poll_semaphore(self.hass):
+            start = monotonic()
+            await entity.async_update_ha_state(True)
+            duration = monotonic() - start
+
+        stats = self.poll_stats.get(entity_id)
+        if stats is not None:
+            stats.record(duration)
+
+
+@callback
+def _async_get_poll_semaphore(hass: HomeAssistantType) -> asyncio.Semaphore:
+    """Return the semaphore limiting the polls of all platforms."""
+    semaphore: Optional[asyncio.Semaphore] = hass.data.get(DATA_POLL_SEMAPHORE)
+    if semaphore is None:
+        semaphore = hass.data[DATA_POLL_SEMAPHORE] = asyncio.Semaphore(
+            MAX_PARALLEL_POLLS
+        )
+    return semaphore
+
+
+@callback
+def async_get_poll_stats(hass: HomeAssistantType) -> Dict[str, Dict[str, Any]]:
+    """Return the update latency of all polling entities, in seconds."""
+    return {
+        entity_id: stats.as_dict()
+        for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+        for platform in platforms
+        for entity_id, stats in platform.poll_stats.items()
+    }
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
@@ -125,7 +125,12 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # Entity ids by device and config entry, in the order they were added
+        self._device_index: Dict[str, Dict[str, None]] = {}
+        self._config_entry_index: Dict[str, Dict[str, None]] = {}
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
         )
@@ -387,9 +392,12 @@ class EntityRegistry:
         if not changes:
             return old
 
-        self._remove_index(old)
         new = attr.evolve(old, **changes)
-        self._register_entry(new)
+        if _index_keys(old) == _index_keys(new):
+            self.entities[entity_id] = new
+        else:
+            self._remove_index(old)
+            self._register_entry(new)
 
         self.async_schedule_save()
 
@@ -477,11 +485,7 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
@@ -490,6 +494,12 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if entry.device_id is not None:
+            self._device_index.setdefault(entry.device_id, {})[entry.entity_id] = None
+        if entry.config_entry_id is not None:
+            self._config_entry_index.setdefault(entry.config_entry_id, {})[
+                entry.entity_id
+            ] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -497,9 +507,17 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        if entry.device_id is not None:
+            _discard_from_index(self._device_index, entry.device_id, entry.entity_id)
+        if entry.config_entry_id is not None:
+            _discard_from_index(
+                self._config_entry_index, entry.config_entry_id, entry.entity_id
+            )
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -518,7 +536,9 @@ def async_entries_for_device(
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
     return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
+        registry.entities[entity_id]
+        # pylint: disable=protected-access
+        for entity_id in registry._device_index.get(device_id, ())
     ]
 
 
@@ -528,9 +548,9 @@ def async_entries_for_config_entry(
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
     return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
+        registry.entities[entity_id]
+        # pylint: disable=protected-access
+        for entity_id in registry._config_entry_index.get(config_entry_id, ())
     ]
 
 
@@ -612,11 +632,30 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = await async_get_registry(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in async_entries_for_config_entry(ent_reg, config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
             ent_reg.async_update_entity(entry.entity_id, **updates)
+
+
+def _index_keys(entry: RegistryEntry) -> Tuple[Optional[str], ...]:
+    """Return the values of an entry that the registry indexes are keyed on."""
+    return (
+        entry.entity_id,
+        entry.unique_id,
+        entry.device_id,
+        entry.config_entry_id,
+    )
+
+
+def _discard_from_index(
+    index: Dict[str, Dict[str, None]], key: str, entity_id: str
+) -> None:
+    """Remove an entity_id from a secondary index, dropping empty keys."""
+    entity_ids = index.get(key)
+    if entity_ids is None:
+        return
+    entity_ids.pop(entity_id, None)
+    if not entity_ids:
+        del index[key]
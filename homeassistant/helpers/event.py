@@ -4,29 +4,48 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 import time
-from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import attr
 
 from homeassistant.const import (
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
 )
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.sun import get_astral_event_next
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import Template, is_template_string
+from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_TIME_SCHEDULER = "track_time_scheduler"
+
+# Seconds between renders of templates that iterate all states
+ALL_STATES_RATE_LIMIT = 1
 
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
@@ -151,55 +170,16 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
+    for each one, the event bus keeps an index of entity ids
+    that care about the state change events so it can
     do a fast dict lookup to route events.
     """
-
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for action in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_job(action, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state changed for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
-        )
-
     if isinstance(entity_ids, str):
         entity_ids = [entity_ids]
 
-    entity_ids = [entity_id.lower() for entity_id in entity_ids]
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(action)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_entity_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            action,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_entity(
+        [entity_id.lower() for entity_id in entity_ids], action
+    )
 
 
 @callback
@@ -291,32 +271,241 @@ def async_track_template(
     variables: Optional[Dict[str, Any]] = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that track state changes with template condition."""
-    from . import condition  # pylint: disable=import-outside-toplevel
-
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def template_condition_listener(
+        event: Event, last_result: Any, result: Any
+    ) -> None:
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+
+        if isinstance(result, TemplateError):
+            _LOGGER.error("Error during template condition: %s", result)
+            template_result = False
+        else:
+            template_result = result.lower() == "true"
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
+    # A template condition without states is checked on every state change
+    info = async_track_template_result(
+        hass,
+        template,
+        template_condition_listener,
+        variables,
+        track_static=is_template_string(template.template),
     )
 
+    return info.async_remove
+
 
 track_template = threaded_listener_factory(async_track_template)
 
 
+class TrackTemplateResultInfo:
+    """Re-render a template when the states it depends on change.
+
+    Every render records the entities and domains the template accessed.
+    Only state changes of those entities, and entities of those domains being
+    added or removed, trigger a new render. The listeners follow the set of
+    dependencies of the last render.
+
+    Templates that iterate all states are re-rendered on any state change,
+    but at most once every ALL_STATES_RATE_LIMIT seconds. Templates that do
+    not access any state are not re-rendered by state changes, unless
+    track_static is set. Then they are re-rendered on any state change.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        template: Template,
+        action: Callable[[Event, Any, Any], None],
+        variables: TemplateVarsType,
+        track_static: bool = False,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._template = template
+        self._action = action
+        self._variables = variables
+        self._track_static = track_static
+        self._last_result: Any = None
+        self._last_render = 0.0
+        self._entities: FrozenSet[str] = frozenset()
+        self._domains: FrozenSet[str] = frozenset()
+        self._all_states = False
+        self._all_states_rate_limit = False
+        self._unsub_entities: Optional[CALLBACK_TYPE] = None
+        self._unsub_states: Optional[CALLBACK_TYPE] = None
+        self._unsub_rate_limit: Optional[CALLBACK_TYPE] = None
+        self._pending_event: Optional[Event] = None
+
+    @property
+    def last_result(self) -> Any:
+        """Return the result of the last render."""
+        return self._last_result
+
+    @callback
+    def async_setup(self) -> None:
+        """Render the template and listen for its dependencies."""
+        self._render()
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop tracking the template."""
+        for unsub in (self._unsub_entities, self._unsub_states, self._unsub_rate_limit):
+            if unsub is not None:
+                unsub()
+        self._unsub_entities = self._unsub_states = self._unsub_rate_limit = None
+
+    @callback
+    def _render(self) -> Any:
+        """Render the template and update the listeners, return last result."""
+        self._last_render = self.hass.loop.time()
+        info = self._template.async_render_to_info(self._variables)
+
+        try:
+            result: Any = info.result
+        except TemplateError as ex:
+            result = ex
+
+        last_result = self._last_result
+        self._last_result = result
+
+        # pylint: disable=protected-access
+        all_states = info._all_states
+        entities = frozenset(entity_id.lower() for entity_id in info._entities)
+        domains = frozenset(getattr(info, "_domains", ()))
+        if self._track_static and not all_states and not entities and not domains:
+            # Nothing to route on, fall back to every state change
+            all_states = True
+            self._all_states_rate_limit = False
+        else:
+            self._all_states_rate_limit = all_states
+
+        if (
+            all_states != self._all_states
+            or entities != self._entities
+            or domains != self._domains
+        ):
+            self._all_states = all_states
+            self._entities = entities
+            self._domains = domains
+            self._update_listeners()
+
+        return last_result
+
+    @callback
+    def _update_listeners(self) -> None:
+        """Listen for the dependencies of the last render."""
+        if self._unsub_entities is not None:
+            self._unsub_entities()
+            self._unsub_entities = None
+        if self._unsub_states is not None:
+            self._unsub_states()
+            self._unsub_states = None
+
+        if self._all_states or self._domains:
+            self._unsub_states = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._state_changed_listener
+            )
+        if self._entities and not self._all_states:
+            self._unsub_entities = self.hass.bus.async_listen_entity(
+                self._entities, self._entity_changed_listener
+            )
+
+    @callback
+    def _entity_changed_listener(self, event: Event) -> None:
+        """Handle a state change of an entity the template accessed."""
+        self._refresh(event)
+
+    @callback
+    def _state_changed_listener(self, event: Event) -> None:
+        """Handle any state change for domain or all states templates."""
+        if self._all_states:
+            if self._all_states_rate_limit:
+                self._refresh_rate_limited(event)
+            else:
+                self._refresh(event)
+            return
+
+        entity_id = event.data["entity_id"]
+        if entity_id in self._entities:
+            # Handled by the entity listener
+            return
+
+        # Only entities added to or removed from a domain are of interest
+        if (
+            event.data.get("old_state") is None or event.data.get("new_state") is None
+        ) and split_entity_id(entity_id)[0] in self._domains:
+            self._refresh(event)
+
+    @callback
+    def _refresh_rate_limited(self, event: Event) -> None:
+        """Render now or once the rate limit window has passed."""
+        self._pending_event = event
+        if self._unsub_rate_limit is not None:
+            return
+
+        delay = self._last_render + ALL_STATES_RATE_LIMIT - self.hass.loop.time()
+        if delay <= 0:
+            self._refresh(event)
+            return
+
+        @callback
+        def _refresh_pending(_now: datetime) -> None:
+            """Render with the last state change seen."""
+            self._unsub_rate_limit = None
+            if self._pending_event is not None:
+                self._refresh(self._pending_event)
+
+        self._unsub_rate_limit = async_call_later(self.hass, delay, _refresh_pending)
+
+    @callback
+    def _refresh(self, event: Event) -> None:
+        """Render the template and pass the result to the action."""
+        self._pending_event = None
+        if self._unsub_entities is None and self._unsub_states is None:
+            # Removed while this state change was pending
+            return
+        last_result = self._render()
+        self.hass.async_run_job(self._action, event, last_result, self._last_result)
+
+
+@callback
+@bind_hass
+def async_track_template_result(
+    hass: HomeAssistant,
+    template: Template,
+    action: Callable[[Event, Any, Any], None],
+    variables: TemplateVarsType = None,
+    track_static: bool = False,
+) -> TrackTemplateResultInfo:
+    """Add a listener that re-renders a template when its states change.
+
+    The action is called with the state changed event that caused the render,
+    the previous result and the new result. A result is the rendered string,
+    or the TemplateError if rendering failed. With track_static, a template
+    that does not access any state is re-rendered on any state change.
+    """
+    info = TrackTemplateResultInfo(hass, template, action, variables, track_static)
+    info.async_setup()
+    return info
+
+
 @callback
 @bind_hass
 def async_track_same_state(
@@ -409,22 +598,7 @@ def async_track_point_in_utc_time(
     hass: HomeAssistant, action: Callable[..., Any], point_in_time: datetime
 ) -> CALLBACK_TYPE:
     """Add a listener that fires once after a specific point in UTC time."""
-    # Ensure point_in_time is UTC
-    utc_point_in_time = dt_util.as_utc(point_in_time)
-
-    cancel_callback = hass.loop.call_at(
-        hass.loop.time() + point_in_time.timestamp() - time.time(),
-        hass.async_run_job,
-        action,
-        utc_point_in_time,
-    )
-
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        cancel_callback.cancel()
-
-    return unsub_point_in_time_listener
+    return _async_get_time_scheduler(hass).async_schedule(point_in_time, action)
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -579,20 +753,10 @@ def async_track_utc_time_change(
     local: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire if time matches a pattern."""
-    # We do not have to wrap the function with time pattern matching logic
-    # if no pattern given
-    if all(val is None for val in (hour, minute, second)):
-
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_job(action, event.data[ATTR_NOW])
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
-
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
+    scheduler = _async_get_time_scheduler(hass)
 
     next_time: datetime = dt_util.utcnow()
 
@@ -607,11 +771,11 @@ def async_track_utc_time_change(
 
     # Make sure rolling back the clock doesn't prevent the timer from
     # triggering.
-    cancel_callback: Optional[asyncio.TimerHandle] = None
+    cancel_callback: Optional[CALLBACK_TYPE] = None
     calculate_next(next_time)
 
     @callback
-    def pattern_time_change_listener() -> None:
+    def pattern_time_change_listener(_: datetime) -> None:
         """Listen for matching time_changed events."""
         nonlocal next_time, cancel_callback
 
@@ -620,22 +784,17 @@ def async_track_utc_time_change(
 
         calculate_next(now + timedelta(seconds=1))
 
-        cancel_callback = hass.loop.call_at(
-            hass.loop.time() + next_time.timestamp() - time.time(),
-            pattern_time_change_listener,
+        cancel_callback = scheduler.async_schedule(
+            next_time, pattern_time_change_listener
         )
 
-    cancel_callback = hass.loop.call_at(
-        hass.loop.time() + next_time.timestamp() - time.time(),
-        pattern_time_change_listener,
-    )
+    cancel_callback = scheduler.async_schedule(next_time, pattern_time_change_listener)
 
     @callback
     def unsub_pattern_time_change_listener() -> None:
-        """Cancel the call_later."""
-        nonlocal cancel_callback
+        """Cancel the scheduled listener."""
         assert cancel_callback is not None
-        cancel_callback.cancel()
+        cancel_callback()
 
     return unsub_pattern_time_change_listener
 
@@ -659,6 +818,81 @@ def async_track_time_change(
 track_time_change = threaded_listener_factory(async_track_time_change)
 
 
+class TimeScheduler:
+    """Run time based listeners, coalescing the ones that are due together.
+
+    Listeners are grouped by the point in time they are due and every group
+    is served by a single loop timer. Time patterns matching the same second
+    and intervals ending at the same moment cost one wakeup.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._due: Dict[float, Tuple[asyncio.TimerHandle, Dict[object, Callable]]] = {}
+
+    @callback
+    def async_schedule(
+        self, point_in_time: datetime, action: Callable[..., Any]
+    ) -> CALLBACK_TYPE:
+        """Run action once at point_in_time, return function to cancel it."""
+        utc_point_in_time = dt_util.as_utc(point_in_time)
+        when = utc_point_in_time.timestamp()
+        token = object()
+
+        if when in self._due:
+            self._due[when][1][token] = action
+        else:
+            handle = self.hass.loop.call_at(
+                self.hass.loop.time() + when - time.time(),
+                self._async_run_due,
+                when,
+                utc_point_in_time,
+            )
+            self._due[when] = (handle, {token: action})
+
+        @callback
+        def cancel() -> None:
+            """Cancel the scheduled action."""
+            due = self._due.get(when)
+            if due is None or due[1].pop(token, None) is None:
+                return
+            if not due[1]:
+                due[0].cancel()
+                del self._due[when]
+
+        return cancel
+
+    @callback
+    def async_pending(self) -> int:
+        """Return the number of scheduled actions."""
+        return sum(len(actions) for _, actions in self._due.values())
+
+    @callback
+    def _async_run_due(self, when: float, utc_point_in_time: datetime) -> None:
+        """Run all actions that are due at a point in time."""
+        due = self._due.pop(when, None)
+        if due is None:
+            return
+
+        for action in due[1].values():
+            try:
+                self.hass.async_run_job(action, utc_point_in_time)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while running scheduled action at %s", utc_point_in_time
+                )
+
+
+@callback
+def _async_get_time_scheduler(hass: HomeAssistant) -> TimeScheduler:
+    """Return the time scheduler of this instance."""
+    scheduler: Optional[TimeScheduler] = hass.data.get(TRACK_TIME_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_SCHEDULER] = TimeScheduler(hass)
+    return scheduler
+
+
 def process_state_match(
     parameter: Union[None, str, Iterable[str]]
 ) -> Callable[[str], bool]:
@@ -1,12 +1,19 @@
 """Support for restoring entity states on startup."""
 import asyncio
 from datetime import datetime, timedelta
+import json
 import logging
+import os
 from typing import Any, Awaitable, Dict, List, Optional, Set, cast
 
-from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
 from homeassistant.core import (
     CoreState,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -27,12 +34,19 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
+# Suffix of the file the changed states are appended to between snapshots
+STORAGE_LOG_SUFFIX = ".log"
+
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between compacting the append log into a full snapshot. This also
+# refreshes the last seen time of entities which did not change in between.
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 
 class StoredState:
     """Object to represent a stored state."""
@@ -77,15 +91,24 @@ class RestoreStateData:
                     _LOGGER.error("Error loading last states", exc_info=exc)
                     stored_states = None
 
-                if stored_states is None:
+                try:
+                    logged_states = await hass.async_add_executor_job(
+                        _load_log, data.log_path
+                    )
+                except HomeAssistantError as exc:
+                    _LOGGER.error("Error loading changed states", exc_info=exc)
+                    logged_states = []
+
+                if stored_states is None and not logged_states:
                     _LOGGER.debug("Not creating cache - no saved states found")
                     data.last_states = {}
                 else:
                     data.last_states = {
                         item["state"]["entity_id"]: StoredState.from_dict(item)
-                        for item in stored_states
+                        for item in stored_states or []
                         if valid_entity_id(item["state"]["entity_id"])
                     }
+                    data.async_replay_log(logged_states)
                     _LOGGER.debug("Created cache with %s", list(data.last_states))
 
                 if hass.state == CoreState.running:
@@ -107,10 +130,45 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # Entities which changed since the last dump
+        self.dirty_entity_ids: Set[str] = set()
+        # Number of states appended to the log since the last snapshot
+        self.log_entries = 0
+        self.last_compaction: Optional[datetime] = None
+        self._dump_lock = asyncio.Lock()
+
+    @property
+    def log_path(self) -> str:
+        """Return the path of the append log."""
+        return f"{self.store.path}{STORAGE_LOG_SUFFIX}"
+
+    @callback
+    def async_replay_log(self, logged_states: List[Dict[str, Any]]) -> None:
+        """Apply the states appended to the log on top of the last snapshot."""
+        for item in logged_states:
+            try:
+                stored_state = StoredState.from_dict(item)
+                entity_id = stored_state.state.entity_id
+            except (AttributeError, KeyError, TypeError, ValueError):
+                stored_state = None
+
+            if stored_state is None or stored_state.last_seen is None:
+                _LOGGER.warning("Ignoring invalid changed state: %s", item)
+                continue
+
+            if not valid_entity_id(entity_id):
+                continue
+
+            # A snapshot written after the log entry wins
+            current = self.last_states.get(entity_id)
+            if current is None or current.last_seen <= stored_state.last_seen:
+                self.last_states[entity_id] = stored_state
+
+        self.log_entries = len(logged_states)
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -154,30 +212,120 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def async_get_dirty_stored_states(self) -> List[StoredState]:
+        """Get the stored states of the entities changed since the last dump."""
+        now = dt_util.utcnow()
+        stored_states = []
+
+        for entity_id in self.dirty_entity_ids:
+            if entity_id not in self.entity_ids:
+                # Removed this run, the state was kept when it was removed
+                if entity_id in self.last_states:
+                    stored_states.append(self.last_states[entity_id])
+                continue
+
+            state = self.hass.states.get(entity_id)
+            if state is None or state.attributes.get(entity_registry.ATTR_RESTORED):
+                continue
+
+            stored_states.append(StoredState(state, now))
+
+        return stored_states
+
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Writes a full snapshot and truncates the append log.
+        """
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
-        except HomeAssistantError as exc:
-            _LOGGER.error("Error saving current states", exc_info=exc)
+        async with self._dump_lock:
+            dirty_entity_ids = self.dirty_entity_ids
+            self.dirty_entity_ids = set()
+            try:
+                await self.store.async_save(
+                    [
+                        stored_state.as_dict()
+                        for stored_state in self.async_get_stored_states()
+                    ]
+                )
+                # The snapshot is deferred to the final write when stopping,
+                # keep the log around until it has been written.
+                if self.hass.state != CoreState.stopping:
+                    await self.hass.async_add_executor_job(_remove_log, self.log_path)
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error saving current states", exc_info=exc)
+                self.dirty_entity_ids |= dirty_entity_ids
+                return
+
+            self.log_entries = 0
+            self.last_compaction = dt_util.utcnow()
+
+    async def async_dump_dirty_states(self) -> None:
+        """Append the states changed since the last dump to the log.
+
+        Compacts the log into a full snapshot once it holds more entries than
+        there are states to store, unless Home Assistant is stopping.
+        """
+        if self.hass.state != CoreState.stopping and (
+            self.last_compaction is None
+            or self.last_compaction < dt_util.utcnow() - STATE_COMPACT_INTERVAL
+            or self.log_entries + len(self.dirty_entity_ids)
+            > len(self.entity_ids) + len(self.last_states)
+        ):
+            await self.async_dump_states()
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self.dirty_entity_ids))
+        async with self._dump_lock:
+            stored_states = self.async_get_dirty_stored_states()
+            dirty_entity_ids = self.dirty_entity_ids
+            self.dirty_entity_ids = set()
+            if not stored_states:
+                return
+
+            lines = []
+            for stored_state in stored_states:
+                try:
+                    lines.append(_encode_stored_state(stored_state))
+                except (TypeError, ValueError) as exc:
+                    _LOGGER.error(
+                        "Error serializing state of %s: %s",
+                        stored_state.state.entity_id,
+                        exc,
+                    )
+
+            try:
+                await self.hass.async_add_executor_job(
+                    _append_log, self.log_path, lines
+                )
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error saving changed states", exc_info=exc)
+                self.dirty_entity_ids |= dirty_entity_ids
+                return
+
+            self.log_entries += len(lines)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
         async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+            await self.async_dump_dirty_states()
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            entity_id = event.data["entity_id"]
+            if entity_id in self.entity_ids:
+                self.dirty_entity_ids.add(entity_id)
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
+
+        # Track which states changed since the last dump
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
 
         # Dump states periodically
         async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
@@ -189,6 +337,7 @@ class RestoreStateData:
     def async_restore_entity_added(self, entity_id: str) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entity_ids.add(entity_id)
+        self.dirty_entity_ids.add(entity_id)
 
     @callback
     def async_restore_entity_removed(self, entity_id: str) -> None:
@@ -203,10 +352,62 @@ class RestoreStateData:
             state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
+            self.dirty_entity_ids.add(entity_id)
 
         self.entity_ids.remove(entity_id)
 
 
+def _encode_stored_state(stored_state: StoredState) -> str:
+    """Encode a stored state as a single compact JSON line.
+
+    Reuses the JSON representation cached on the state.
+    """
+    last_seen = json.dumps(stored_state.last_seen, cls=JSONEncoder)
+    return f'{{"state": {stored_state.state.as_json()}, "last_seen": {last_seen}}}'
+
+
+def _append_log(path: str, lines: List[str]) -> None:
+    """Append encoded stored states to the log."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as fdesc:
+            fdesc.write("".join(f"{line}\n" for line in lines))
+    except OSError as err:
+        raise HomeAssistantError(err) from err
+
+
+def _load_log(path: str) -> List[Dict[str, Any]]:
+    """Load the stored states appended to the log.
+
+    Lines which can't be parsed, like one cut off by a crash, are skipped.
+    """
+    try:
+        with open(path, encoding="utf-8") as fdesc:
+            lines = fdesc.readlines()
+    except FileNotFoundError:
+        return []
+    except OSError as err:
+        raise HomeAssistantError(err) from err
+
+    logged_states = []
+    for line in lines:
+        try:
+            logged_states.append(json.loads(line))
+        except ValueError:
+            _LOGGER.warning("Skipping invalid line in %s", path)
+    return logged_states
+
+
+def _remove_log(path: str) -> None:
+    """Remove the log after a snapshot has been written."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as err:
+        raise HomeAssistantError(err) from err
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
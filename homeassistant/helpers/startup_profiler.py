@@ -0,0 +1,274 @@
+"""Profile the time integrations take to start up."""
+import dataclasses
+import html
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional, TypeVar
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_PROFILER = "startup_profiler"
+
+REPORT_FILE = "startup_profile.json"
+FLAME_FILE = "startup_profile.html"
+
+PHASE_MANIFEST = "manifest"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_IMPORT = "import"
+PHASE_SETUP = "setup"
+PHASE_SETUP_ENTRY = "setup_entry"
+
+PHASES = (
+    PHASE_MANIFEST,
+    PHASE_REQUIREMENTS,
+    PHASE_IMPORT,
+    PHASE_SETUP,
+    PHASE_SETUP_ENTRY,
+)
+
+PHASE_COLORS = {
+    PHASE_MANIFEST: "#9e9e9e",
+    PHASE_REQUIREMENTS: "#ff9800",
+    PHASE_IMPORT: "#f44336",
+    PHASE_SETUP: "#2196f3",
+    PHASE_SETUP_ENTRY: "#4caf50",
+}
+
+_T = TypeVar("_T")
+
+
+@dataclasses.dataclass
+class Span:
+    """Time spent by an integration in a phase of its setup."""
+
+    domain: str
+    phase: str
+    start: float
+    wall: float
+    blocking: float
+
+
+class _TimedAwaitable:
+    """Await an awaitable and measure the time it runs on the event loop.
+
+    Each step of the awaitable is timed between the points where it yields
+    to the event loop, so the time spent waiting on other tasks or the
+    executor is not counted as blocking.
+    """
+
+    def __init__(self, awaitable: Awaitable) -> None:
+        """Initialize the timed awaitable."""
+        self._awaitable = awaitable
+        self.blocking = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """Drive the awaitable one step at a time."""
+        iterator = self._awaitable.__await__()
+        step: Callable = iterator.send
+        message: Any = None
+
+        while True:
+            start = time.perf_counter()
+            try:
+                yielded = step(message)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.blocking += time.perf_counter() - start
+
+            try:
+                message = yield yielded
+                step = iterator.send
+            except BaseException as err:  # pylint: disable=broad-except
+                step, message = iterator.throw, err
+
+
+class StartupProfiler:
+    """Record the setup phases of integrations during startup."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.started = dt_util.utcnow()
+        self.spans: List[Span] = []
+        self._start = time.perf_counter()
+        self._stop: Optional[float] = None
+
+    def _add_span(self, domain: str, phase: str, start: float, blocking: float) -> None:
+        """Store the span of a phase that started at start."""
+        self.spans.append(
+            Span(
+                domain,
+                phase,
+                start - self._start,
+                time.perf_counter() - start,
+                blocking,
+            )
+        )
+
+    async def async_record(
+        self, domain: str, phase: str, awaitable: Awaitable[_T]
+    ) -> _T:
+        """Await an awaitable and record it as a phase of an integration."""
+        timed = _TimedAwaitable(awaitable)
+        start = time.perf_counter()
+        try:
+            return await timed  # type: ignore
+        finally:
+            self._add_span(domain, phase, start, timed.blocking)
+
+    def record(self, domain: str, phase: str, target: Callable[[], _T]) -> _T:
+        """Call a function on the event loop and record it as a phase."""
+        start = time.perf_counter()
+        try:
+            return target()
+        finally:
+            self._add_span(domain, phase, start, time.perf_counter() - start)
+
+    def stop(self) -> None:
+        """Mark the end of startup."""
+        self._stop = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        """Return the time startup took, up to now if it is still running."""
+        return (self._stop or time.perf_counter()) - self._start
+
+    def as_dict(self, import_times: Dict[str, float]) -> Dict[str, Any]:
+        """Return the report as a dictionary that can be serialized to JSON."""
+        integrations: Dict[str, Dict[str, Any]] = {}
+
+        for span in self.spans:
+            info = integrations.setdefault(
+                span.domain, {"wall": 0.0, "blocking": 0.0, "phases": {}}
+            )
+            phase = info["phases"].setdefault(
+                span.phase, {"start": span.start, "wall": 0.0, "blocking": 0.0}
+            )
+            phase["start"] = min(phase["start"], span.start)
+            phase["wall"] += span.wall
+            phase["blocking"] += span.blocking
+            info["wall"] += span.wall
+            info["blocking"] += span.blocking
+
+        return {
+            "started": self.started.isoformat(),
+            "duration": self.duration,
+            "integrations": dict(
+                sorted(
+                    integrations.items(),
+                    key=lambda item: item[1]["blocking"],
+                    reverse=True,
+                )
+            ),
+            "import_times": import_times,
+            "spans": [dataclasses.asdict(span) for span in self.spans],
+        }
+
+    def as_html(self) -> str:
+        """Return a page that shows the spans on a timeline per integration."""
+        duration = max(self.duration, 1e-6)
+        rows: Dict[str, List[Span]] = {}
+
+        for span in sorted(self.spans, key=lambda span: span.start):
+            rows.setdefault(span.domain, []).append(span)
+
+        lines = []
+        for domain, spans in rows.items():
+            bars = "".join(
+                '<div class="span" style="left:{:.3f}%;width:{:.3f}%;'
+                'background:{}" title="{}"></div>'.format(
+                    100 * span.start / duration,
+                    max(100 * span.wall / duration, 0.1),
+                    PHASE_COLORS.get(span.phase, "#000"),
+                    html.escape(
+                        f"{domain} {span.phase}: {span.wall:.3f}s wall, "
+                        f"{span.blocking:.3f}s blocking",
+                        quote=True,
+                    ),
+                )
+                for span in spans
+            )
+            blocking = sum(span.blocking for span in spans)
+            lines.append(
+                f'<div class="row"><div class="name">{html.escape(domain)} '
+                f'({blocking:.2f}s)</div><div class="bars">{bars}</div></div>'
+            )
+
+        legend = "".join(
+            f'<span style="background:{PHASE_COLORS[phase]}">{phase}</span>'
+            for phase in PHASES
+        )
+
+        return (
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            "<title>Home Assistant startup profile</title><style>"
+            "body{font-family:sans-serif;font-size:12px}"
+            ".legend span{color:#fff;padding:2px 6px;margin-right:4px}"
+            ".row{display:flex;height:16px;margin:1px 0}"
+            ".name{width:260px;overflow:hidden;white-space:nowrap}"
+            ".bars{position:relative;flex:1;background:#f5f5f5}"
+            ".span{position:absolute;top:0;bottom:0}"
+            "</style></head><body>"
+            f"<h1>Startup took {self.duration:.2f}s</h1>"
+            "<p>Started at "
+            f"{html.escape(self.started.isoformat())}. The time after each "
+            "integration is the time it blocked the event loop.</p>"
+            f'<p class="legend">{legend}</p>'
+            f"{''.join(lines)}</body></html>\n"
+        )
+
+    def write(self, config_dir: str, import_times: Dict[str, float]) -> None:
+        """Write the report and the timeline to the config dir."""
+        with open(os.path.join(config_dir, REPORT_FILE), "w") as report_file:
+            json.dump(self.as_dict(import_times), report_file, indent=2)
+
+        with open(os.path.join(config_dir, FLAME_FILE), "w") as flame_file:
+            flame_file.write(self.as_html())
+
+
+async def async_profile(
+    hass: HomeAssistant, domain: str, phase: str, awaitable: Awaitable[_T]
+) -> _T:
+    """Await an awaitable, recording it if startup is being profiled."""
+    profiler: StartupProfiler = hass.data.get(DATA_STARTUP_PROFILER)
+
+    if profiler is None:
+        return await awaitable
+
+    return await profiler.async_record(domain, phase, awaitable)
+
+
+def profile(
+    hass: HomeAssistant, domain: str, phase: str, target: Callable[[], _T]
+) -> _T:
+    """Call a function, recording it if startup is being profiled."""
+    profiler: StartupProfiler = hass.data.get(DATA_STARTUP_PROFILER)
+
+    if profiler is None:
+        return target()
+
+    return profiler.record(domain, phase, target)
+
+
+async def async_write_report(hass: HomeAssistant) -> None:
+    """Stop profiling and write the report to the config dir."""
+    profiler: StartupProfiler = hass.data.pop(DATA_STARTUP_PROFILER)
+    profiler.stop()
+
+    await hass.async_add_executor_job(
+        profiler.write,
+        hass.config.config_dir,
+        dict(hass.data.get(loader.DATA_IMPORT_TIMES, {})),
+    )
+
+    _LOGGER.info(
+        "Startup profile written to %s and %s",
+        hass.config.path(REPORT_FILE),
+        hass.config.path(FLAME_FILE),
+    )
@@ -3,7 +3,7 @@ import asyncio
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -15,8 +15,12 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+DATA_STORAGE_WRITER = "storage_writer"
 _LOGGER = logging.getLogger(__name__)
 
+# Delayed writes due within this many seconds join a batch being written
+WRITE_COALESCE_WINDOW = 5
+
 
 @bind_hass
 async def async_migrator(
@@ -67,8 +71,13 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Compact stores are written without indentation, which is smaller and
+        faster to write but harder to read by hand.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -79,6 +88,7 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._compact = compact
 
     @property
     def path(self):
@@ -157,6 +167,7 @@ class Store:
         self._unsub_delay_listener = async_call_later(
             self.hass, delay, self._async_callback_delayed_write
         )
+        _async_get_writer(self.hass).async_schedule(self, delay)
         self._async_ensure_final_write_listener()
 
     @callback
@@ -180,6 +191,7 @@ class Store:
         if self._unsub_delay_listener is not None:
             self._unsub_delay_listener()
             self._unsub_delay_listener = None
+            _async_get_writer(self.hass).async_unschedule(self)
 
     async def _async_callback_delayed_write(self, _now):
         """Handle a delayed write callback."""
@@ -188,6 +200,7 @@ class Store:
             self._async_ensure_final_write_listener()
             return
         self._unsub_delay_listener = None
+        _async_get_writer(self.hass).async_unschedule(self)
         self._async_cleanup_final_write_listener()
         await self._async_handle_write_data()
 
@@ -213,9 +226,7 @@ class Store:
             self._data = None
 
             try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
+                await _async_get_writer(self.hass).async_write(self, data)
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
@@ -225,7 +236,9 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -237,3 +250,99 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+
+@callback
+def _async_get_writer(hass: HomeAssistant) -> "_StoreWriter":
+    """Return the writer shared by all stores."""
+    writer = hass.data.get(DATA_STORAGE_WRITER)
+    if writer is None:
+        writer = hass.data[DATA_STORAGE_WRITER] = _StoreWriter(hass)
+    return writer
+
+
+class _StoreWriter:
+    """Coalesce the writes of many stores into a single executor job.
+
+    Writes requested while a batch is pending or being written are written
+    together in the next batch. Delayed writes which are due shortly are
+    pulled into a batch instead of getting their own job.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self._pending: List[Tuple[Store, str, Dict, asyncio.Future]] = []
+        self._scheduled: Dict[Store, float] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @callback
+    def async_schedule(self, store: Store, delay: float) -> None:
+        """Track when a delayed write of a store is due."""
+        self._scheduled[store] = self.hass.loop.time() + delay
+
+    @callback
+    def async_unschedule(self, store: Store) -> None:
+        """Stop tracking the delayed write of a store."""
+        self._scheduled.pop(store, None)
+
+    async def async_write(self, store: Store, data: Dict) -> None:
+        """Write data of a store as part of the next batch."""
+        future = self.hass.loop.create_future()
+        self._pending.append((store, store.path, data, future))
+
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_task(self._async_flush())
+
+        await future
+
+    async def _async_flush(self) -> None:
+        """Write all pending data in batches."""
+        try:
+            while self._pending:
+                self._async_pull_scheduled()
+                # Let the pulled stores add their data to this batch
+                await asyncio.sleep(0)
+
+                batch, self._pending = self._pending, []
+                try:
+                    results = await self.hass.async_add_executor_job(
+                        _write_batch,
+                        [(store, path, data) for store, path, data, _ in batch],
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    results = [err] * len(batch)
+
+                for (_, _, _, future), err in zip(batch, results):
+                    if err is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(err)
+        finally:
+            self._flush_task = None
+
+    @callback
+    def _async_pull_scheduled(self) -> None:
+        """Start the delayed writes that are due within the coalesce window."""
+        # pylint: disable=protected-access
+        if self.hass.state == CoreState.stopping:
+            return
+
+        deadline = self.hass.loop.time() + WRITE_COALESCE_WINDOW
+        for store, when in list(self._scheduled.items()):
+            if when <= deadline:
+                store._async_cleanup_delay_listener()
+                self.hass.async_create_task(store._async_callback_delayed_write(None))
+
+
+def _write_batch(batch: List[Tuple[Store, str, Dict]]) -> List[Optional[Exception]]:
+    """Write the data of many stores, returning the error of each write."""
+    results: List[Optional[Exception]] = []
+    for store, path, data in batch:
+        try:
+            store._write_data(path, data)  # pylint: disable=protected-access
+        except Exception as err:  # pylint: disable=broad-except
+            results.append(err)
+        else:
+            results.append(None)
+    return results
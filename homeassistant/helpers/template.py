@@ -1,5 +1,6 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime
 from functools import wraps
@@ -8,9 +9,10 @@ import logging
 import math
 import random
 import re
-from typing import Any, Dict, Iterable, List, Optional, Union
+import threading
+from types import CodeType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -44,6 +46,9 @@ DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 
+# Number of compiled templates kept by the cache shared by all environments
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
     r"(?:(?:(?:states\.|(?P<func>is_state|is_state_attr|state_attr|states|expand)\((?:[\ \'\"]?))(?P<entity_id>[\w]+\.[\w]+)|states\.(?P<domain_outer>[a-z]+)|states\[(?:[\'\"]?)(?P<domain_inner>[\w]+))|(?P<variable>[\w]+))",
@@ -65,6 +70,11 @@ def attach(hass: HomeAssistantType, obj: Any) -> None:
         obj.hass = hass
 
 
+def is_template_string(maybe_template: str) -> bool:
+    """Check if the input is a Jinja2 template."""
+    return _RE_JINJA_DELIMITERS.search(maybe_template) is not None
+
+
 def render_complex(value: Any, variables: TemplateVarsType = None) -> Any:
     """Recursive template creator helper function."""
     if isinstance(value, list):
@@ -82,7 +92,7 @@ def extract_entities(
     variables: Optional[Dict[str, Any]] = None,
 ) -> Union[str, List[str]]:
     """Extract all entities for state_changed listener from template string."""
-    if template is None or _RE_JINJA_DELIMITERS.search(template) is None:
+    if template is None or not is_template_string(template):
         return []
 
     if _RE_NONE_ENTITIES.search(template):
@@ -365,7 +375,7 @@ class AllStates:
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_all()
-        return len(self._hass.states.async_entity_ids())
+        return self._hass.states.async_entity_ids_count()
 
     def __call__(self, entity_id):
         """Return the states."""
@@ -402,12 +412,9 @@ class DomainStates:
         """Return the iteration over all the states."""
         self._collect_domain()
         return iter(
-            sorted(
-                (
-                    _wrap_state(self._hass, state)
-                    for state in self._hass.states.async_all()
-                    if state.domain == self._domain
-                ),
+            _wrap_state(self._hass, state)
+            for state in sorted(
+                self._hass.states.async_all(self._domain),
                 key=lambda state: state.entity_id,
             )
         )
@@ -415,7 +422,7 @@ class DomainStates:
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_domain()
-        return len(self._hass.states.async_entity_ids(self._domain))
+        return self._hass.states.async_entity_ids_count(self._domain)
 
     def __repr__(self) -> str:
         """Representation of Domain States."""
@@ -964,7 +971,6 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1062,12 +1068,57 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        return _compile_source(self, source)
 
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
 
-        return cached
+_NO_HASS_ENV = TemplateEnvironment(None)
 
+# Compiled code by template source and whether the environment has hass
+_COMPILED_CACHE: "OrderedDict[Tuple[str, bool], CodeType]" = OrderedDict()
+_COMPILED_CACHE_LOCK = threading.Lock()
+_COMPILED_CACHE_STATS = {"hits": 0, "misses": 0}
 
-_NO_HASS_ENV = TemplateEnvironment(None)
+
+def _compile_source(env: TemplateEnvironment, source: str) -> CodeType:
+    """Compile template source.
+
+    Compiling checks that the filters exist, and environments with hass have
+    more filters, so those get their own entries. Otherwise the compiled code
+    does not depend on the environment that compiled it and is shared by all
+    template environments.
+    """
+    key = (source, env.hass is not None)
+
+    with _COMPILED_CACHE_LOCK:
+        code = _COMPILED_CACHE.get(key)
+        if code is not None:
+            _COMPILED_CACHE.move_to_end(key)
+            _COMPILED_CACHE_STATS["hits"] += 1
+            return code
+
+    code = super(TemplateEnvironment, env).compile(source)
+
+    with _COMPILED_CACHE_LOCK:
+        _COMPILED_CACHE_STATS["misses"] += 1
+        _COMPILED_CACHE[key] = code
+        if len(_COMPILED_CACHE) > COMPILED_TEMPLATE_CACHE_SIZE:
+            _COMPILED_CACHE.popitem(last=False)
+
+    return code
+
+
+def _clear_compiled_cache() -> None:
+    """Clear the compiled template cache and its statistics."""
+    with _COMPILED_CACHE_LOCK:
+        _COMPILED_CACHE.clear()
+        _COMPILED_CACHE_STATS["hits"] = _COMPILED_CACHE_STATS["misses"] = 0
+
+
+def compiled_template_cache_info() -> Dict[str, int]:
+    """Return statistics of the compiled template cache."""
+    with _COMPILED_CACHE_LOCK:
+        return {
+            **_COMPILED_CACHE_STATS,
+            "size": len(_COMPILED_CACHE),
+            "max_size": COMPILED_TEMPLATE_CACHE_SIZE,
+        }
@@ -11,12 +11,14 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -25,6 +27,7 @@ from typing import (
     cast,
 )
 
+from homeassistant.generated.integrations import INTEGRATIONS
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
 
@@ -39,6 +42,12 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+# Set to False to use the cached custom integration manifests without saving them
+DATA_CUSTOM_COMPONENTS_CACHE_SAVE = "custom_components_cache_save"
+DATA_IMPORT_TIMES = "integration_import_times"
+CUSTOM_COMPONENTS_STORAGE_KEY = "core.custom_components"
+CUSTOM_COMPONENTS_STORAGE_VERSION = 1
+CUSTOM_COMPONENTS_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -47,6 +56,7 @@ CUSTOM_WARNING = (
     "cause stability problems, be sure to disable it if you "
     "experience issues with Home Assistant."
 )
+MANIFEST_INDEX_KEYS = ("dependencies", "after_dependencies", "requirements")
 _UNDEF = object()
 
 
@@ -74,33 +84,91 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.exceptions import HomeAssistantError
+    from homeassistant.helpers.storage import Store
+
+    store = Store(
+        hass,
+        CUSTOM_COMPONENTS_STORAGE_VERSION,
+        CUSTOM_COMPONENTS_STORAGE_KEY,
+        private=True,
+        compact=True,
+    )
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    try:
+        cached = await store.async_load() or {}
+    except HomeAssistantError as err:
+        _LOGGER.warning("Ignoring the cached custom integration manifests: %s", err)
+        cached = {}
+
+    manifests = await hass.async_add_executor_job(
+        _load_custom_manifests, custom_components.__path__, cached
     )
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
+    if manifests != cached and hass.data.get(DATA_CUSTOM_COMPONENTS_CACHE_SAVE, True):
+        store.async_delay_save(lambda: manifests, CUSTOM_COMPONENTS_SAVE_DELAY)
+
+    integrations = (
+        Integration(
+            hass,
+            f"{PACKAGE_CUSTOM_COMPONENTS}.{name}",
+            pathlib.Path(entry["path"]).parent,
+            dict(entry["manifest"]),
         )
+        for name, entry in manifests.items()
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    return {integration.domain: integration for integration in integrations}
+
+
+def _load_custom_manifests(
+    paths: List[str], cached: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Load the manifests of the custom integrations by directory name.
+
+    Manifests that did not change since they were cached are not parsed again.
+    """
+    manifests: Dict[str, Dict[str, Any]] = {}
+
+    for path in paths:
+        for entry in pathlib.Path(path).iterdir():
+            if entry.name in manifests or not entry.is_dir():
+                continue
+
+            manifest_path = entry / "manifest.json"
+
+            try:
+                stat = manifest_path.stat()
+            except OSError:
+                continue
+
+            version = [stat.st_mtime_ns, stat.st_size]
+            cached_entry = cached.get(entry.name)
+
+            if (
+                cached_entry is not None
+                and cached_entry["path"] == str(manifest_path)
+                and cached_entry["version"] == version
+            ):
+                manifests[entry.name] = cached_entry
+                continue
+
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (OSError, ValueError) as err:
+                _LOGGER.error(
+                    "Error parsing manifest.json file at %s: %s", manifest_path, err
+                )
+                continue
+
+            manifests[entry.name] = {
+                "path": str(manifest_path),
+                "version": version,
+                "manifest": manifest,
+            }
+
+    return manifests
 
 
 async def async_get_custom_components(
@@ -125,6 +193,42 @@ async def async_get_custom_components(
     return cast(Dict[str, "Integration"], reg_or_evt)
 
 
+async def async_get_manifest_index(
+    hass: "HomeAssistant",
+) -> Dict[str, Dict[str, List[str]]]:
+    """Return the dependencies and requirements of all integrations.
+
+    Custom integrations replace the built-in integrations of the same domain.
+    """
+    index: Dict[str, Dict[str, List[str]]] = INTEGRATIONS.copy()
+
+    integrations = await async_get_custom_components(hass)
+    for integration in integrations.values():
+        index[integration.domain] = {
+            key: integration.manifest[key]
+            for key in MANIFEST_INDEX_KEYS
+            if integration.manifest.get(key)
+        }
+
+    return index
+
+
+def dependencies_from_index(
+    index: Dict[str, Dict[str, List[str]]], domains: Set[str]
+) -> Set[str]:
+    """Return the domains with all dependencies that are in the manifest index."""
+    found = set(domains)
+    to_check = list(domains)
+
+    while to_check:
+        for dependency in index.get(to_check.pop(), {}).get("dependencies", []):
+            if dependency not in found and dependency in index:
+                found.add(dependency)
+                to_check.append(dependency)
+
+    return found
+
+
 async def async_get_config_flows(hass: "HomeAssistant") -> Set[str]:
     """Return cached list of config flows."""
     # pylint: disable=import-outside-toplevel
@@ -378,7 +482,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = _import_module(self.hass, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -386,11 +490,26 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = importlib.import_module(
-                f"{self.pkg_path}.{platform_name}"
+            cache[full_name] = _import_module(
+                self.hass, f"{self.pkg_path}.{platform_name}"
             )
         return cache[full_name]  # type: ignore
 
+    def preimport(self, platform_names: Iterable[str]) -> None:
+        """Import the component and the given platforms.
+
+        Runs in the executor ahead of setup so the event loop finds the
+        modules imported. Failures are left for setup to report.
+        """
+        try:
+            self.get_component()
+            for platform_name in platform_names:
+                self.get_platform(platform_name)
+        except ImportError as err:
+            _LOGGER.debug("Unable to preimport %s: %s", self.domain, err)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to preimport %s", self.domain, exc_info=True)
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -479,6 +598,16 @@ class CircularDependency(LoaderError):
         self.to_domain = to_domain
 
 
+def _import_module(hass: "HomeAssistant", name: str) -> ModuleType:
+    """Import a module and record how long the first import took."""
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    hass.data.setdefault(DATA_IMPORT_TIMES, {}).setdefault(
+        name, time.perf_counter() - start
+    )
+    return module
+
+
 def _load_file(
     hass: "HomeAssistant", comp_or_platform: str, base_paths: List[str]
 ) -> Optional[ModuleType]:
@@ -501,7 +630,7 @@ def _load_file(
 
     for path in (f"{base}.{comp_or_platform}" for base in base_paths):
         try:
-            module = importlib.import_module(path)
+            module = _import_module(hass, path)
 
             # In Python 3 you can import files from directories that do not
             # contain the file __init__.py. A directory is a valid module if
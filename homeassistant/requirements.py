@@ -11,6 +11,7 @@ import homeassistant.util.package as pkg_util
 
 DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
+DATA_SATISFIED_REQS = "satisfied_requirements"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
 CONSTRAINT_FILE = "package_constraints.txt"
 _LOGGER = logging.getLogger(__name__)
@@ -111,6 +112,11 @@ async def async_process_requirements(
     This method is a coroutine. It will raise RequirementsNotFound
     if an requirement can't be satisfied.
     """
+    missing = [req for req in requirements if not await _async_is_satisfied(hass, req)]
+
+    if not missing:
+        return
+
     pip_lock = hass.data.get(DATA_PIP_LOCK)
     if pip_lock is None:
         pip_lock = hass.data[DATA_PIP_LOCK] = asyncio.Lock()
@@ -118,8 +124,9 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
-        for req in requirements:
-            if pkg_util.is_installed(req):
+        for req in missing:
+            # Another integration may have installed it while we waited
+            if req in hass.data[DATA_SATISFIED_REQS]:
                 continue
 
             def _install(req: str, kwargs: Dict) -> bool:
@@ -131,6 +138,34 @@ async def async_process_requirements(
             if not ret:
                 raise RequirementsNotFound(name, [req])
 
+            # The installed distributions changed, take a new snapshot
+            hass.data.pop(DATA_PKG_CACHE, None)
+            hass.data[DATA_SATISFIED_REQS].add(req)
+
+
+async def _async_is_satisfied(hass: HomeAssistant, req: str) -> bool:
+    """Check a requirement against a snapshot of the installed distributions.
+
+    Requirements found satisfied are remembered, so requirements shared by
+    integrations are only checked once.
+    """
+    satisfied: Set[str] = hass.data.setdefault(DATA_SATISFIED_REQS, set())
+
+    if req in satisfied:
+        return True
+
+    installed = hass.data.get(DATA_PKG_CACHE)
+    if installed is None:
+        installed = hass.data[DATA_PKG_CACHE] = hass.async_add_executor_job(
+            pkg_util.get_installed_versions
+        )
+
+    if not pkg_util.is_installed(req, await installed):
+        return False
+
+    satisfied.add(req)
+    return True
+
 
 def pip_kwargs(config_dir: Optional[str]) -> Dict[str, Any]:
     """Return keyword arguments for PIP install."""
@@ -28,6 +28,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    profile_startup: bool = False
 
 
 # In Python 3.8+ proactor policy is the default on Windows
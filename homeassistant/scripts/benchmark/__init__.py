@@ -3,7 +3,7 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import timedelta
 import json
 import logging
 from timeit import default_timer as timer
@@ -11,7 +11,7 @@ from typing import Callable, Dict, TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -87,7 +87,7 @@ async def fire_events(hass):
 
 @benchmark
 async def time_changed_helper(hass):
-    """Run a million events through time changed helper."""
+    """Run 100k time based listeners that are due at 100 points in time."""
     count = 0
     event = asyncio.Event()
 
@@ -97,14 +97,14 @@ async def time_changed_helper(hass):
         nonlocal count
         count += 1
 
-        if count == 10 ** 6:
+        if count == 10 ** 5:
             event.set()
 
-    hass.helpers.event.async_track_time_change(listener, minute=0, second=0)
-    event_data = {ATTR_NOW: datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)}
-
-    for _ in range(10 ** 6):
-        hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
+    now = dt_util.utcnow()
+    for idx in range(10 ** 5):
+        hass.helpers.event.async_track_point_in_utc_time(
+            listener, now + timedelta(milliseconds=idx % 100)
+        )
 
     start = timer()
 
@@ -185,6 +185,54 @@ async def state_changed_event_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_indexed_helpers(hass):
+    """Run a million events for 1000 entities through indexed state helpers."""
+    count = 0
+    entity_id = "light.kitchen"
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 6:
+            event.set()
+
+    @core.callback
+    def same_state(*args):
+        """Keep tracking the same state."""
+        return True
+
+    for idx in range(1000):
+        hass.helpers.event.async_track_state_change(
+            f"{entity_id}{idx}", listener, "off", "on"
+        )
+        hass.helpers.event.async_track_same_state(
+            timedelta(days=1), listener, same_state, f"{entity_id}{idx}"
+        )
+
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(f"{entity_id}{idx}", "off"),
+            "new_state": core.State(f"{entity_id}{idx}", "on"),
+        }
+        for idx in range(1000)
+    ]
+
+    start = timer()
+
+    for idx in range(10 ** 6):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % 1000])
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -323,6 +371,110 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_topic_dispatch(hass):
+    """Match 100k MQTT messages against 3000 subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    subscriptions = TopicTrie()
+    for idx in range(1000):
+        subscriptions.add(f"zigbee2mqtt/device_{idx}", idx)
+        subscriptions.add(f"zigbee2mqtt/device_{idx}/availability", idx)
+        subscriptions.add(f"tasmota/discovery/{idx}/+", idx)
+    subscriptions.add("homeassistant/#", None)
+
+    topics = [f"zigbee2mqtt/device_{idx}" for idx in range(1000)]
+    size = len(topics)
+    matched = 0
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        for _ in subscriptions.iter_match(topics[i % size]):
+            matched += 1
+
+    runtime = timer() - start
+    print(f"Dispatched {10 ** 5 / runtime:.0f} messages/s to {matched} callbacks")
+    return runtime
+
+
+@benchmark
+async def recorder_ingest(hass):
+    """Record 10k state changes of 100 entities to an in-memory database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder
+
+    instance = Recorder(
+        hass,
+        auto_purge=False,
+        keep_days=1,
+        commit_interval=1,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=1,
+        entity_filter=lambda entity_id: True,
+        exclude_t=[],
+    )
+    instance.async_initialize()
+    instance.start()
+    assert await instance.async_db_ready
+    await hass.async_start()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    start = timer()
+
+    for idx in range(10 ** 4):
+        hass.states.async_set(f"sensor.benchmark_{idx % 100}", idx, {"idx": idx})
+
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    runtime = timer() - start
+    print(f"Recorded {10 ** 4 / runtime:.0f} state changes/s")
+    return runtime
+
+
+@benchmark
+async def restore_state_dump(hass):
+    """Dump the states of 5000 restore entities of which 1% changed."""
+    # pylint: disable=import-outside-toplevel
+    import os
+    import tempfile
+
+    from homeassistant.helpers.restore_state import RestoreStateData
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        data = await RestoreStateData.async_get_instance(hass)
+
+        for idx in range(5000):
+            entity_id = f"sensor.benchmark_{idx}"
+            hass.states.async_set(entity_id, idx, {"unit_of_measurement": "W"})
+            data.async_restore_entity_added(entity_id)
+
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+
+        start = timer()
+        await data.async_dump_states()
+        full_runtime = timer() - start
+        full_size = os.path.getsize(data.store.path)
+
+        for idx in range(0, 5000, 100):
+            hass.states.async_set(f"sensor.benchmark_{idx}", -idx)
+        await hass.async_block_till_done()
+
+        start = timer()
+        await data.async_dump_dirty_states()
+        runtime = timer() - start
+        log_size = os.path.getsize(data.log_path)
+
+    print(f"Full dump: {full_runtime:.4f}s, {full_size} bytes")
+    print(f"Incremental dump: {runtime:.4f}s, {log_size} bytes")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -9,7 +9,7 @@ import os
 from typing import Any, Callable, Dict, List, Tuple
 from unittest.mock import patch
 
-from homeassistant import bootstrap, core
+from homeassistant import bootstrap, core, loader
 from homeassistant.config import get_default_config_dir
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.check_config import async_check_ha_config_file
@@ -229,6 +229,8 @@ async def async_check_config(config_dir):
     """Check the HA config."""
     hass = core.HomeAssistant()
     hass.config.config_dir = config_dir
+    # Checking the config must not write to the config dir
+    hass.data[loader.DATA_CUSTOM_COMPONENTS_CACHE_SAVE] = False
     components = await async_check_ha_config_file(hass)
     await hass.async_stop(force=True)
     return components
@@ -0,0 +1,258 @@
+"""Script to migrate and compact the recorder database offline."""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+from typing import Dict, List, Optional
+
+from homeassistant.config import get_default_config_dir
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+REQUIREMENTS = ("sqlalchemy==1.3.18",)
+
+DEFAULT_BATCH_SIZE = 10000
+MIGRATED_SUFFIX = ".migrated"
+
+
+def run(script_args: List) -> int:
+    """Handle recorder migrate commandline script."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Copy the recorder database into a new database with the current "
+            "schema. Run it while Home Assistant is stopped, then replace the "
+            "database with the copy."
+        )
+    )
+    parser.add_argument("--script", choices=["recorder_migrate"])
+    parser.add_argument(
+        "-c",
+        "--config",
+        metavar="path_to_config_dir",
+        default=get_default_config_dir(),
+        help="Directory that contains the Home Assistant configuration",
+    )
+    parser.add_argument(
+        "--db-url",
+        default=None,
+        help="URL of the database to migrate. Defaults to the SQLite database "
+        "in the configuration directory",
+    )
+    parser.add_argument(
+        "--target-url",
+        default=None,
+        help="URL of the empty database to copy into. Defaults to the source "
+        f"SQLite database with a {MIGRATED_SUFFIX} suffix",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of rows to copy per transaction",
+    )
+
+    args = parser.parse_args(script_args)
+
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import DEFAULT_DB_FILE, DEFAULT_URL
+    from homeassistant.components.recorder.const import SQLITE_URL_PREFIX
+
+    config_dir = os.path.join(os.getcwd(), args.config)
+    db_url = args.db_url or DEFAULT_URL.format(
+        hass_config_path=os.path.join(config_dir, DEFAULT_DB_FILE)
+    )
+    target_url = args.target_url
+
+    if target_url is None:
+        if not db_url.startswith(SQLITE_URL_PREFIX):
+            print("A --target-url is required for databases other than SQLite")
+            return 1
+        target_url = f"{db_url}{MIGRATED_SUFFIX}"
+
+    if args.batch_size < 1:
+        print("The batch size must be at least 1")
+        return 1
+
+    try:
+        stats = migrate(db_url, target_url, args.batch_size)
+    except ValueError as err:
+        print(err)
+        return 1
+
+    total_rows = sum(table["rows"] for table in stats["tables"].values())
+    print(
+        f"Copied {total_rows} rows in {stats['copy_time']:.1f}s, "
+        f"rebuilt indexes in {stats['index_time']:.1f}s"
+    )
+    print(
+        "Stop Home Assistant and replace the database with the migrated copy "
+        "before starting it again."
+    )
+    return 0
+
+
+def migrate(db_url: str, target_url: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict:
+    """Copy a recorder database into a new database with the current schema.
+
+    Rows are copied per table in primary key order, one batch per
+    transaction, into tables created without secondary indexes. The indexes
+    are built once the tables are loaded, in parallel where the database
+    allows concurrent writers. Columns missing from the source are left
+    empty, like the in place migration does when it adds them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import reflection
+
+    from homeassistant.components.recorder.const import SQLITE_URL_PREFIX
+    from homeassistant.components.recorder.models import (
+        SCHEMA_VERSION,
+        Base,
+        SchemaChanges,
+    )
+
+    source = create_engine(db_url)
+    target = create_engine(target_url)
+
+    try:
+        source_tables = set(reflection.Inspector.from_engine(source).get_table_names())
+        if not source_tables & set(Base.metadata.tables):
+            raise ValueError(f"No recorder tables found in {db_url}")
+
+        if reflection.Inspector.from_engine(target).get_table_names():
+            raise ValueError(f"The target database {target_url} is not empty")
+
+        is_sqlite = target_url.startswith(SQLITE_URL_PREFIX)
+        stats: Dict = {"tables": {}}
+
+        start = time.perf_counter()
+        for table in Base.metadata.sorted_tables:
+            _create_table(target, table)
+            if table.name in source_tables:
+                stats["tables"][table.name] = _copy_table(
+                    source, target, table, batch_size, is_sqlite
+                )
+        stats["copy_time"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _create_indexes(target, Base.metadata.sorted_tables, is_sqlite)
+        stats["index_time"] = time.perf_counter() - start
+
+        schema_table = SchemaChanges.__table__
+        with target.begin() as conn:
+            current_version = conn.execute(
+                schema_table.select().order_by(schema_table.c.change_id.desc()).limit(1)
+            ).first()
+            if (
+                current_version is None
+                or current_version.schema_version != SCHEMA_VERSION
+            ):
+                conn.execute(schema_table.insert(), schema_version=SCHEMA_VERSION)
+
+        if is_sqlite:
+            # Refresh the statistics the query planner uses for the new indexes
+            with target.connect() as conn:
+                conn.execute("ANALYZE")
+
+        return stats
+    finally:
+        source.dispose()
+        target.dispose()
+
+
+def _create_table(engine, table) -> None:
+    """Create a table without its secondary indexes."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.schema import CreateTable
+
+    with engine.begin() as conn:
+        conn.execute(CreateTable(table))
+
+
+def _copy_table(source, target, table, batch_size: int, is_sqlite: bool) -> Dict:
+    """Copy the rows of a table in batches and report the throughput."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import select
+    from sqlalchemy.engine import reflection
+
+    source_columns = {
+        column["name"]
+        for column in reflection.Inspector.from_engine(source).get_columns(table.name)
+    }
+    columns = [column for column in table.columns if column.name in source_columns]
+    primary_key = table.primary_key.columns.values()[0]
+
+    if primary_key not in columns:
+        raise ValueError(f"The {table.name} table has no {primary_key.name} column")
+
+    query = select(columns).order_by(primary_key).limit(batch_size)
+    rows = 0
+    last_id: Optional[int] = None
+    start = time.perf_counter()
+
+    with source.connect() as source_conn, target.connect() as target_conn:
+        if is_sqlite:
+            # The copy can be started over if it is interrupted
+            target_conn.execute("PRAGMA synchronous=OFF")
+
+        while True:
+            batch_query = query
+            if last_id is not None:
+                batch_query = query.where(primary_key > last_id)
+
+            batch = [dict(row) for row in source_conn.execute(batch_query)]
+            if not batch:
+                break
+
+            with target_conn.begin():
+                target_conn.execute(table.insert(), batch)
+
+            rows += len(batch)
+            last_id = batch[-1][primary_key.name]
+            elapsed = time.perf_counter() - start
+            print(
+                f"{table.name}: {rows} rows copied "
+                f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+
+        if last_id is not None and target.dialect.name == "postgresql":
+            # Inserting the ids does not advance the sequence of the column
+            with target_conn.begin():
+                target_conn.execute(
+                    _sequence_reset_statement(table, primary_key, last_id)
+                )
+
+    elapsed = time.perf_counter() - start
+    print(f"{table.name}: done, {rows} rows in {elapsed:.1f}s")
+    return {"rows": rows, "time": elapsed}
+
+
+def _sequence_reset_statement(table, primary_key, max_id: int):
+    """Return the statement that moves a PostgreSQL serial sequence to max_id."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import func, select
+
+    sequence = func.pg_get_serial_sequence(table.name, primary_key.name)
+    return select([func.setval(sequence, max_id)])
+
+
+def _create_indexes(engine, tables, is_sqlite: bool) -> None:
+    """Build the indexes of the tables after the bulk load.
+
+    SQLite allows a single writer, so its indexes are built one at a time.
+    """
+    indexes = [index for table in tables for index in table.indexes]
+
+    def create_index(index):
+        start = time.perf_counter()
+        index.create(engine)
+        print(f"Index {index.name} built in {time.perf_counter() - start:.1f}s")
+
+    if is_sqlite:
+        for index in indexes:
+            create_index(index)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        for future in [executor.submit(create_index, index) for index in indexes]:
+            future.result()
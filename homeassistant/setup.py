@@ -9,6 +9,7 @@ from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
 from homeassistant.const import EVENT_COMPONENT_LOADED, PLATFORM_FORMAT
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import startup_profiler
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
@@ -119,7 +120,12 @@ async def _async_setup_component(
         async_notify_setup_error(hass, domain, link)
 
     try:
-        integration = await loader.async_get_integration(hass, domain)
+        integration = await startup_profiler.async_profile(
+            hass,
+            domain,
+            startup_profiler.PHASE_MANIFEST,
+            loader.async_get_integration(hass, domain),
+        )
     except loader.IntegrationNotFound:
         log_error("Integration not found.")
         return False
@@ -139,7 +145,9 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        component = startup_profiler.profile(
+            hass, domain, startup_profiler.PHASE_IMPORT, integration.get_component
+        )
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -188,7 +196,9 @@ async def _async_setup_component(
             return False
 
         async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-            result = await task
+            result = await startup_profiler.async_profile(
+                hass, domain, startup_profiler.PHASE_SETUP, task
+            )
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -227,7 +237,12 @@ async def _async_setup_component(
 
     await asyncio.gather(
         *[
-            entry.async_setup(hass, integration=integration)
+            startup_profiler.async_profile(
+                hass,
+                domain,
+                startup_profiler.PHASE_SETUP_ENTRY,
+                entry.async_setup(hass, integration=integration),
+            )
             for entry in hass.config_entries.async_entries(domain)
         ]
     )
@@ -273,7 +288,12 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        platform = startup_profiler.profile(
+            hass,
+            integration.domain,
+            startup_profiler.PHASE_IMPORT,
+            lambda: integration.get_platform(domain),
+        )
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -318,8 +338,13 @@ async def async_process_deps_reqs(
 
     if not hass.config.skip_pip and integration.requirements:
         async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
+            await startup_profiler.async_profile(
+                hass,
+                integration.domain,
+                startup_profiler.PHASE_REQUIREMENTS,
+                requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                ),
             )
 
     processed.add(integration.domain)
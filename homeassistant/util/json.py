@@ -9,6 +9,11 @@ from typing import Any, Callable, Dict, List, Optional, Type, Union
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -48,13 +53,19 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
+    Compact data is written without indentation, using orjson if installed.
+
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, sort_keys=True, indent=4, cls=encoder)
+        if compact:
+            json_data = dumps_compact(data, encoder=encoder)
+        else:
+            json_data = json.dumps(data, sort_keys=True, indent=4, cls=encoder)
     except TypeError:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -85,6 +96,26 @@ def save_json(
                 _LOGGER.error("JSON replacement cleanup failed: %s", err)
 
 
+def dumps_compact(
+    data: Any, *, encoder: Optional[Type[json.JSONEncoder]] = None
+) -> str:
+    """Serialize data to JSON without any whitespace.
+
+    Raises TypeError if the data can't be serialized.
+    """
+    if orjson is not None:
+        default = None if encoder is None else encoder().default
+        try:
+            return orjson.dumps(  # type: ignore
+                data, default=default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # orjson is stricter, e.g. on integers larger than 64 bit.
+            pass
+
+    return json.dumps(data, separators=(",", ":"), cls=encoder)
+
+
 def format_unserializable_data(data: Dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
 
@@ -0,0 +1,141 @@
+"""Time the jobs that run on the event loop.
+
+The watchdog measures how long each job keeps the event loop busy and
+adds it up per module of the job target. Jobs that run longer than the
+stall threshold are reported to a callback.
+"""
+import collections.abc
+import dataclasses
+import functools
+import time
+from types import CoroutineType
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+STALL_THRESHOLD = 0.1
+
+UNKNOWN_MODULE = "unknown"
+
+StallCallback = Callable[[Any, str, float], None]
+
+
+@dataclasses.dataclass
+class JobStats:
+    """Time the jobs of a module kept the event loop busy."""
+
+    calls: int = 0
+    time: float = 0.0
+    max_time: float = 0.0
+    stalls: int = 0
+
+
+def target_module(target: Any) -> str:
+    """Return the name of the module a job target was defined in."""
+    while isinstance(target, functools.partial):
+        target = target.func
+
+    if isinstance(target, CoroutineType):
+        return target.cr_frame.f_globals.get(  # type: ignore
+            "__name__", UNKNOWN_MODULE
+        )
+
+    return getattr(target, "__module__", None) or UNKNOWN_MODULE
+
+
+class _TimedCoroutine(collections.abc.Coroutine):
+    """Coroutine that times each step of the coroutine it wraps.
+
+    Tasks drive it through send and throw, so every step that runs on the
+    event loop is timed until the coroutine finishes.
+    """
+
+    def __init__(self, watchdog: "LoopWatchdog", coro: Coroutine) -> None:
+        """Initialize the timed coroutine."""
+        self._watchdog = watchdog
+        self._coro = coro
+        self._module = target_module(coro)
+
+    def send(self, value: Any) -> Any:
+        """Run the next step of the coroutine."""
+        return self._watchdog.run_step(self._coro, self._module, self._coro.send, value)
+
+    def throw(self, *args: Any) -> Any:  # pylint: disable=arguments-differ
+        """Raise an exception in the coroutine."""
+        return self._watchdog.run_step(
+            self._coro, self._module, self._coro.throw, *args
+        )
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __await__(self) -> Any:
+        """Return an iterator to await the coroutine."""
+        return self._coro.__await__()
+
+    def __getattr__(self, name: str) -> Any:
+        """Look up the cr_* attributes on the coroutine."""
+        return getattr(self._coro, name)
+
+    def __repr__(self) -> str:
+        """Return the representation of the coroutine."""
+        return repr(self._coro)
+
+
+class LoopWatchdog:
+    """Measure the time jobs keep the event loop busy."""
+
+    def __init__(
+        self,
+        stall_threshold: float = STALL_THRESHOLD,
+        stall_callback: Optional[StallCallback] = None,
+    ) -> None:
+        """Initialize the watchdog."""
+        self.stall_threshold = stall_threshold
+        self.stats: Dict[str, JobStats] = {}
+        self._stall_callback = stall_callback
+        # Time spent in jobs run from within the running job
+        self._nested_time = 0.0
+
+    def run(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Call a job target and record the time it took."""
+        return self.run_step(target, target_module(target), target, *args)
+
+    def run_step(
+        self, target: Any, module: str, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Call func and record the time it took for target.
+
+        Jobs run from within the call are only counted for their own target.
+        """
+        outer_nested_time = self._nested_time
+        self._nested_time = 0.0
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._record(target, module, elapsed - self._nested_time)
+            self._nested_time = outer_nested_time + elapsed
+
+    def wrap_coroutine(self, coro: Coroutine) -> Coroutine:
+        """Return a coroutine that records the time of each step of coro."""
+        return _TimedCoroutine(self, coro)
+
+    def _record(self, target: Any, module: str, duration: float) -> None:
+        """Add the duration of a job to the stats of its module."""
+        stats = self.stats.get(module)
+
+        if stats is None:
+            stats = self.stats[module] = JobStats()
+
+        stats.calls += 1
+        stats.time += duration
+
+        if duration > stats.max_time:
+            stats.max_time = duration
+
+        if duration >= self.stall_threshold:
+            stats.stalls += 1
+
+            if self._stall_callback is not None:
+                self._stall_callback(target, module, duration)
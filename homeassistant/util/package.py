@@ -3,9 +3,10 @@ import asyncio
 import logging
 import os
 from pathlib import Path
+import re
 from subprocess import PIPE, Popen
 import sys
-from typing import Optional
+from typing import Dict, Optional
 from urllib.parse import urlparse
 
 import pkg_resources
@@ -13,16 +14,20 @@ import pkg_resources
 if sys.version_info[:2] >= (3, 8):
     from importlib.metadata import (  # pylint: disable=no-name-in-module,import-error
         PackageNotFoundError,
+        distributions,
         version,
     )
 else:
     from importlib_metadata import (  # pylint: disable=import-error
         PackageNotFoundError,
+        distributions,
         version,
     )
 
 _LOGGER = logging.getLogger(__name__)
 
+_RE_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
 
 def is_virtual_env() -> bool:
     """Return if we run in a virtual environment."""
@@ -37,9 +42,31 @@ def is_docker_env() -> bool:
     return Path("/.dockerenv").exists()
 
 
-def is_installed(package: str) -> bool:
+def _normalize_name(name: str) -> str:
+    """Return the normalized form of a distribution name."""
+    return _RE_NAME_SEPARATORS.sub("-", name).lower()
+
+
+def get_installed_versions() -> Dict[str, str]:
+    """Return the versions of the installed distributions by normalized name.
+
+    The first distribution found on the path wins, as that is the one that
+    gets imported.
+    """
+    installed: Dict[str, str] = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(_normalize_name(name), dist.version)
+    return installed
+
+
+def is_installed(package: str, installed: Optional[Dict[str, str]] = None) -> bool:
     """Check if a package is installed and will be loaded when we import it.
 
+    Pass the result of get_installed_versions as installed to check against it
+    instead of looking up the package metadata.
+
     Returns True when the requirement is met.
     Returns False when the package is not installed or doesn't meet req.
     """
@@ -50,6 +77,10 @@ def is_installed(package: str) -> bool:
         # leaving it in for custom components.
         req = pkg_resources.Requirement.parse(urlparse(package).fragment)
 
+    if installed is not None:
+        installed_version = installed.get(_normalize_name(req.project_name))
+        return installed_version is not None and installed_version in req
+
     try:
         return version(req.project_name) in req
     except PackageNotFoundError:
@@ -0,0 +1,64 @@
+"""Generate the integration manifest index file."""
+from collections import OrderedDict
+import json
+from typing import Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+INTEGRATIONS = {}
+""".strip()
+
+INDEX_KEYS = ("dependencies", "after_dependencies", "requirements")
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index."""
+    data = OrderedDict()
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        data[domain] = OrderedDict(
+            (key, integration.manifest[key])
+            for key in INDEX_KEYS
+            if integration.manifest.get(key)
+        )
+
+    return BASE.format(json.dumps(data, indent=4))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate the manifest index file."""
+    integrations_path = config.root / "homeassistant/generated/integrations.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(integrations_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File integrations.py is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate the manifest index file."""
+    integrations_path = config.root / "homeassistant/generated/integrations.py"
+    with open(str(integrations_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
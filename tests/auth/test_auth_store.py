@@ -95,6 +95,16 @@ async def test_loading_no_group_data_format(hass, hass_storage):
     system_token = list(system.refresh_tokens.values())[0]
     assert system_token.id == "system-token-id"
 
+    assert await store.async_get_refresh_token("user-token-id") is owner_token
+    assert await store.async_get_refresh_token("hidden-because-no-jwt-id") is None
+
+    await store.async_remove_refresh_token(owner_token)
+    assert await store.async_get_refresh_token("user-token-id") is None
+    assert owner.refresh_tokens == {}
+
+    await store.async_remove_user(system)
+    assert await store.async_get_refresh_token("system-token-id") is None
+
 
 async def test_loading_all_access_group_data_format(hass, hass_storage):
     """Test we correctly load old data with single group."""
@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+from time import monotonic
 
 import jwt
 import pytest
@@ -344,6 +345,57 @@ async def test_cannot_retrieve_expired_access_token(hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validate_access_token_cached(hass):
+    """Test verified access tokens are cached until their refresh token is removed."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch("jwt.decode", wraps=jwt.decode) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    assert len(mock_decode.mock_calls) == 2
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+
+    with patch(
+        "homeassistant.auth.monotonic",
+        return_value=monotonic() + auth_const.ACCESS_TOKEN_CACHE_TTL.total_seconds(),
+    ), patch("jwt.decode", wraps=jwt.decode) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    assert len(mock_decode.mock_calls) == 2
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validate_access_token_cache_evicts_least_recently_used(hass):
+    """Test the access token cache evicts the least recently used token."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    access_tokens = []
+    for client_id in ("https://one.example.com/", "https://two.example.com/"):
+        refresh_token = await manager.async_create_refresh_token(user, client_id)
+        access_tokens.append(manager.async_create_access_token(refresh_token))
+    first, second = access_tokens
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    third = manager.async_create_access_token(refresh_token)
+
+    with patch("homeassistant.auth.ACCESS_TOKEN_CACHE_SIZE", 2):
+        assert await manager.async_validate_access_token(first) is not None
+        assert await manager.async_validate_access_token(second) is not None
+        # Using the first token makes the second one the least recently used
+        assert await manager.async_validate_access_token(first) is not None
+        assert await manager.async_validate_access_token(third) is not None
+
+    assert list(manager._access_token_cache) == [first, third]
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
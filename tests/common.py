@@ -116,6 +116,8 @@ def get_test_home_assistant():
 
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
+    # Storage is not mocked, keep the test config dir clean
+    hass.data[loader.DATA_CUSTOM_COMPONENTS_CACHE_SAVE] = False
 
     stop_event = threading.Event()
 
@@ -807,7 +809,7 @@ def mock_restore_cache(hass, states):
 
     last_states = {}
     for state in states:
-        restored_state = state.as_dict()
+        restored_state = dict(state.as_dict())
         restored_state["attributes"] = json.loads(
             json.dumps(restored_state["attributes"], cls=JSONEncoder)
         )
@@ -940,6 +942,20 @@ def mock_storage(data=None):
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_append_log(path, lines):
+        """Mock version of appending to the restore state log."""
+        data.setdefault(os.path.basename(path), []).extend(
+            json.loads(line) for line in lines
+        )
+
+    def mock_load_log(path):
+        """Mock version of loading the restore state log."""
+        return list(data.get(os.path.basename(path), []))
+
+    def mock_remove_log(path):
+        """Mock version of removing the restore state log."""
+        data.pop(os.path.basename(path), None)
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -952,6 +968,12 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state._append_log", side_effect=mock_append_log,
+    ), patch(
+        "homeassistant.helpers.restore_state._load_log", side_effect=mock_load_log,
+    ), patch(
+        "homeassistant.helpers.restore_state._remove_log", side_effect=mock_remove_log,
     ):
         yield data
 
@@ -14,7 +14,6 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNKNOWN,
 )
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from homeassistant.setup import async_setup_component, setup_component
 
 from tests.async_mock import patch
@@ -391,12 +390,13 @@ class TestComponentsGroup(unittest.TestCase):
             "group.second_group",
             "group.test_group",
         ]
-        assert self.hass.bus.listeners["state_changed"] == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["sensor.happy"]) == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+        assert "state_changed" not in self.hass.bus.listeners
+        entity_listeners = self.hass.bus.entity_listeners
+        assert entity_listeners["hello.world"] == 1
+        assert entity_listeners["sensor.happy"] == 1
+        assert entity_listeners["light.bowl"] == 1
+        assert entity_listeners["test.one"] == 1
+        assert entity_listeners["test.two"] == 1
 
         with patch(
             "homeassistant.config.load_yaml_config_file",
@@ -411,10 +411,11 @@ class TestComponentsGroup(unittest.TestCase):
             "group.all_tests",
             "group.hello",
         ]
-        assert self.hass.bus.listeners["state_changed"] == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-        assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+        assert "state_changed" not in self.hass.bus.listeners
+        entity_listeners = self.hass.bus.entity_listeners
+        assert entity_listeners["light.bowl"] == 1
+        assert entity_listeners["test.one"] == 1
+        assert entity_listeners["test.two"] == 1
 
     def test_modify_group(self):
         """Test modifying a group."""
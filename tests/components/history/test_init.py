@@ -5,6 +5,9 @@ from datetime import timedelta
 import json
 import unittest
 
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Query
+
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.models import process_timestamp
 import homeassistant.core as ha
@@ -12,7 +15,7 @@ from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.async_mock import patch, sentinel
+from tests.async_mock import MagicMock, patch, sentinel
 from tests.common import (
     get_test_home_assistant,
     init_recorder_component,
@@ -822,3 +825,199 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_period_api_with_stream(hass, hass_client):
+    """Test the fetch period view streams the same states per entity."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.temperature", "20")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.temperature", "21")
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    response = await client.get(f"/api/history/period/{start.isoformat()}")
+    assert response.status == 200
+    expected = await response.json()
+
+    response = await client.get(f"/api/history/period/{start.isoformat()}?stream")
+    assert response.status == 200
+    assert response.headers["Transfer-Encoding"] == "chunked"
+    streamed = await response.json()
+
+    assert len(streamed) == 2
+    assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+        expected, key=lambda states: states[0]["entity_id"]
+    )
+    assert [state["state"] for state in streamed[0]] == ["on", "off"]
+
+
+async def test_fetch_period_api_with_bucket_size(hass, hass_client):
+    """Test the fetch period view aggregates numeric entities."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on")
+    for value in ("10", "20", "unavailable", "30"):
+        hass.states.async_set(
+            "sensor.temperature", value, {"unit_of_measurement": "°C"}
+        )
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"bucket_size": "3600", "skip_initial_state": ""},
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    result = {states[0]["entity_id"]: states for states in response_json}
+
+    assert [state["state"] for state in result["light.kitchen"]] == ["on"]
+    assert result["sensor.temperature"] == [
+        {
+            "entity_id": "sensor.temperature",
+            "last_changed": start.isoformat(),
+            "min": 10.0,
+            "max": 30.0,
+            "mean": 20.0,
+        }
+    ]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}", params={"bucket_size": "0"}
+    )
+    assert response.status == 400
+
+
+def test_aggregate_rows():
+    """Test aggregating rows into buckets without the database."""
+    start = dt_util.utcnow()
+    rows = [
+        ("sensor.a", "1", start),
+        ("sensor.a", "3", start + timedelta(seconds=30)),
+        ("sensor.a", "not a number", start + timedelta(seconds=40)),
+        ("sensor.a", "5", start + timedelta(seconds=60)),
+        ("sensor.b", "nan", start),
+        ("sensor.b", "7", start + timedelta(seconds=90)),
+    ]
+
+    assert list(history._aggregate_rows(rows, start, 60)) == [
+        ("sensor.a", 0, 1.0, 3.0, 2.0, 2),
+        ("sensor.a", 1, 5.0, 5.0, 5.0, 1),
+        ("sensor.b", 1, 7.0, 7.0, 7.0, 1),
+    ]
+
+
+async def _async_get_aggregated_states(hass, start, **kwargs):
+    """Fetch the aggregated states of sensor.temperature since start."""
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def get_states():
+        with recorder.session_scope(hass=hass) as session:
+            return history._get_aggregated_states(
+                hass, session, start, None, 3600, ["sensor.temperature"], **kwargs
+            )
+
+    return await hass.async_add_executor_job(get_states)
+
+
+async def test_aggregated_states_with_start_state(hass):
+    """Test the start state of a numeric entity is counted in its first bucket."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.temperature", "5", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    for value in ("10", "unavailable", "30"):
+        hass.states.async_set(
+            "sensor.temperature", value, {"unit_of_measurement": "°C"}
+        )
+
+    result = await _async_get_aggregated_states(hass, start)
+
+    assert [state.state for state in result["light.kitchen"]] == ["on"]
+    assert result["sensor.temperature"] == [
+        {
+            "entity_id": "sensor.temperature",
+            "last_changed": start.isoformat(),
+            "min": 5.0,
+            "max": 30.0,
+            "mean": 15.0,
+        }
+    ]
+
+    # Only the start state is known in the period
+    result = await _async_get_aggregated_states(hass, dt_util.utcnow())
+
+    assert result["sensor.temperature"] == [
+        {
+            "entity_id": "sensor.temperature",
+            "last_changed": result["sensor.temperature"][0]["last_changed"],
+            "min": 30.0,
+            "max": 30.0,
+            "mean": 30.0,
+        }
+    ]
+
+
+async def test_aggregated_states_skip_non_numeric(hass):
+    """Test states that are not numbers are not aggregated."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    for value in ("None", "error", "12abc", "7", "1e1"):
+        hass.states.async_set(
+            "sensor.temperature", value, {"unit_of_measurement": "°C"}
+        )
+
+    result = await _async_get_aggregated_states(
+        hass, start, include_start_time_state=False
+    )
+
+    assert result["sensor.temperature"] == [
+        {
+            "entity_id": "sensor.temperature",
+            "last_changed": start.isoformat(),
+            "min": 7.0,
+            "max": 10.0,
+            "mean": 8.5,
+        }
+    ]
+
+
+def test_aggregated_states_query_mysql():
+    """Test MySQL aggregates the states as numbers, not as strings."""
+    session = MagicMock()
+    session.bind.dialect.name = "mysql"
+    session.query.side_effect = lambda *entities: Query(entities)
+
+    with patch(
+        "homeassistant.components.history.execute", return_value=[]
+    ) as mock_execute:
+        history._aggregate_numeric_states(
+            session, dt_util.utcnow(), None, 60, ["sensor.temperature"], None, None
+        )
+
+    query = mock_execute.call_args[0][0]
+    sql = str(query.statement.compile(dialect=mysql.dialect()))
+    assert "min(states.state + %s)" in sql
+    assert "max(states.state + %s)" in sql
+    assert "avg(states.state + %s)" in sql
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 from ipaddress import ip_address
 import os
+from time import monotonic
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPUnauthorized
@@ -11,10 +12,13 @@ import pytest
 import homeassistant.components.http as http
 from homeassistant.components.http import KEY_AUTHENTICATED
 from homeassistant.components.http.ban import (
+    FAILED_LOGIN_EXPIRY,
     IP_BANS_FILE,
     KEY_BANNED_IPS,
     KEY_FAILED_LOGIN_ATTEMPTS,
+    FailedLoginAttempts,
     IpBan,
+    IpBans,
     setup_bans,
 )
 from homeassistant.components.http.view import request_handler_factory
@@ -59,6 +63,67 @@ async def test_access_from_banned_ip(hass, aiohttp_client):
         assert resp.status == HTTP_FORBIDDEN
 
 
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from an address in a banned network."""
+    app = web.Application()
+    app["hass"] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=[IpBan("10.10.0.0/16"), IpBan("2001:db8::/32")],
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr in ("10.10.1.2", "2001:db8::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTP_FORBIDDEN
+
+    for remote_addr in ("10.11.1.2", "2001:db9::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == 404
+
+
+def test_ip_bans_lookup():
+    """Test looking up addresses in the banned IPs."""
+    ip_bans = IpBans([IpBan("200.201.202.203"), IpBan("100.64.0.0/10")])
+    ip_bans.append(IpBan("fd00::/8"))
+
+    assert len(ip_bans) == 3
+    assert ip_bans.is_banned(ip_address("200.201.202.203"))
+    assert ip_bans.is_banned(ip_address("100.100.1.1"))
+    assert ip_bans.is_banned(ip_address("fd12::1"))
+    assert not ip_bans.is_banned(ip_address("200.201.202.204"))
+    assert not ip_bans.is_banned(ip_address("100.128.0.1"))
+    assert not ip_bans.is_banned(ip_address("fe80::1"))
+
+
+def test_failed_login_attempts_bounded():
+    """Test failed login attempts are bounded and expire."""
+    attempts = FailedLoginAttempts()
+    first = ip_address("10.0.0.1")
+    second = ip_address("10.0.0.2")
+
+    with patch("homeassistant.components.http.ban.MAX_FAILED_LOGIN_ADDRESSES", 1):
+        assert attempts.increment(first) == 1
+        assert attempts.increment(first) == 2
+        assert attempts.increment(second) == 1
+
+    assert first not in attempts
+    assert attempts[second] == 1
+
+    with patch(
+        "homeassistant.components.http.ban.monotonic",
+        return_value=monotonic() + FAILED_LOGIN_EXPIRY,
+    ):
+        assert second not in attempts
+        assert attempts[second] == 0
+        assert len(attempts) == 0
+
+
 @pytest.mark.parametrize(
     "remote_addr, bans, status",
     list(
@@ -0,0 +1 @@
+"""Tests for the Loop Watchdog integration."""
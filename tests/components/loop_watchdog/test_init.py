@@ -0,0 +1,76 @@
+"""Tests for the Loop Watchdog integration."""
+import logging
+
+from homeassistant.components import loop_watchdog
+from homeassistant.components.loop_watchdog.const import CORE_DOMAIN, DOMAIN
+from homeassistant.core import callback
+from homeassistant.setup import async_setup_component
+from homeassistant.util.loop_watchdog import LoopWatchdog
+
+from tests.common import MockModule, mock_integration
+
+
+async def test_setup(hass):
+    """Test setting up the watchdog starts timing the jobs."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"stall_threshold": 0.5}})
+
+    assert isinstance(hass.loop_watchdog, LoopWatchdog)
+    assert hass.loop_watchdog.stall_threshold == 0.5
+
+
+async def test_domain_stats(hass):
+    """Test the stats of modules are added up per integration domain."""
+    mock_integration(hass, MockModule("hue"))
+    watchdog = hass.data[DOMAIN] = LoopWatchdog()
+
+    for module, duration in (
+        ("homeassistant.components.hue", 0.5),
+        ("homeassistant.components.hue.light", 0.25),
+        ("homeassistant.helpers.event", 0.1),
+        ("aiohttp.client", 0.05),
+    ):
+        watchdog._record(None, module, duration)
+
+    stats = loop_watchdog.async_domain_stats(hass)
+
+    assert list(stats) == ["hue", CORE_DOMAIN, "aiohttp"]
+    assert stats["hue"] == {"calls": 2, "time": 0.75, "max_time": 0.5, "stalls": 2}
+    assert stats[CORE_DOMAIN]["stalls"] == 1
+
+
+async def test_log_stall_once(hass, caplog):
+    """Test a stall is logged once per module."""
+    caplog.set_level(logging.WARNING)
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {"stall_threshold": 0.001}}
+    )
+
+    @callback
+    def slow_job():
+        sum(range(100000))
+
+    hass.loop_watchdog.run(slow_job)
+    hass.loop_watchdog.run(slow_job)
+
+    assert caplog.text.count("blocked the event loop") == 1
+    assert "integration tests" in caplog.text
+    assert "slow_job" in caplog.text
+
+
+async def test_websocket_stats(hass, hass_ws_client):
+    """Test the stats are available through the websocket API."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    hass.loop_watchdog._record(None, "homeassistant.components.sun", 0.5)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "loop_watchdog/stats"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"]["stall_threshold"] == 0.1
+    assert msg["result"]["domains"]["sun"] == {
+        "calls": 1,
+        "time": 0.5,
+        "max_time": 0.5,
+        "stalls": 1,
+    }
@@ -0,0 +1,20 @@
+"""Tests for the Loop Watchdog sensor."""
+from homeassistant.components.loop_watchdog.const import DOMAIN
+from homeassistant.setup import async_setup_component
+
+
+async def test_sensor(hass):
+    """Test the sensor shows the busiest integrations."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    hass.loop_watchdog.stats.clear()
+    hass.loop_watchdog._record(None, "homeassistant.components.sun", 0.5)
+    await hass.helpers.entity_component.async_update_entity(
+        "sensor.event_loop_busy_time"
+    )
+
+    state = hass.states.get("sensor.event_loop_busy_time")
+    assert float(state.state) >= 0.5
+    assert state.attributes["sun"] == 0.5
+    assert state.attributes["stalls"] >= 1
@@ -0,0 +1,70 @@
+"""Test the MQTT topic trie."""
+from paho.mqtt.matcher import MQTTMatcher
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+def _paho_match(topic_filter, topic):
+    """Match a topic using the paho matcher."""
+    matcher = MQTTMatcher()
+    matcher[topic_filter] = True
+    return any(True for _ in matcher.iter_match(topic))
+
+
+@pytest.mark.parametrize(
+    "topic_filter",
+    ["a", "a/b", "a/+", "+/b", "+", "#", "a/#", "a/+/c", "+/+/#", "$SYS/#", "a//c"],
+)
+@pytest.mark.parametrize(
+    "topic", ["a", "b", "a/b", "a/b/c", "a//c", "a/c", "x/b", "$SYS/broker", "/b"]
+)
+def test_match_same_as_paho(topic_filter, topic):
+    """Test the trie matches the same topics as the paho matcher."""
+    trie = TopicTrie()
+    trie.add(topic_filter, topic_filter)
+
+    assert (list(trie.iter_match(topic)) == [topic_filter]) == _paho_match(
+        topic_filter, topic
+    )
+
+
+def test_match_order():
+    """Test matches are returned in insertion order."""
+    trie = TopicTrie()
+    trie.add("a/#", 1)
+    trie.add("a/b", 2)
+    trie.add("+/b", 3)
+    trie.add("a/b", 4)
+    trie.add("a/c", 5)
+
+    assert list(trie.iter_match("a/b")) == [1, 2, 3, 4]
+    assert len(trie) == 5
+
+
+def test_remove():
+    """Test removing items from the trie."""
+    trie = TopicTrie()
+    trie.add("a/b", 1)
+    trie.add("a/b", 2)
+    trie.add("a/b/c", 3)
+
+    trie.remove("a/b", 1)
+    assert list(trie.iter_match("a/b")) == [2]
+    assert trie.has_filter("a/b")
+
+    trie.remove("a/b", 2)
+    assert list(trie.iter_match("a/b")) == []
+    assert not trie.has_filter("a/b")
+    assert list(trie.iter_match("a/b/c")) == [3]
+
+    trie.remove("a/b/c", 3)
+    assert len(trie) == 0
+    assert not trie._root.children
+
+    with pytest.raises(ValueError):
+        trie.remove("a/b", 1)
+
+    trie.add("a", 1)
+    with pytest.raises(ValueError):
+        trie.remove("a", 2)
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import unittest
 
 import pytest
+from sqlalchemy import exc
 
 from homeassistant.components.recorder import (
     CONFIG_SCHEMA,
@@ -17,7 +18,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import Events, RecorderRuns, States
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import MATCH_ALL, STATE_LOCKED, STATE_UNLOCKED
-from homeassistant.core import Context, callback
+from homeassistant.core import Context, Event as ha_event, State as ha_state, callback
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -382,6 +383,37 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_sets_old_state_within_batch(hass_recorder):
+    """Test old state is linked for several changes recorded in one batch."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "1", {})
+    hass.states.set("test.two", "1", {})
+    hass.states.set("test.one", "2", {})
+    hass.states.set("test.one", "3", {})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = {
+            (state.entity_id, state.state): state for state in session.query(States)
+        }
+        assert len(states) == 5
+
+        assert states[("test.one", "1")].old_state_id is None
+        assert (
+            states[("test.one", "2")].old_state_id == states[("test.one", "1")].state_id
+        )
+        assert (
+            states[("test.one", "3")].old_state_id == states[("test.one", "2")].state_id
+        )
+        assert (
+            states[("test.two", None)].old_state_id
+            == states[("test.two", "1")].state_id
+        )
+        assert session.query(Events).filter_by(event_type="state_changed").count() == 5
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -405,6 +437,136 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+def test_event_that_fails_to_convert(hass_recorder, caplog):
+    """Test an event that cannot be converted does not drop the others."""
+    hass = hass_recorder()
+    from_event = Events.from_event
+
+    def fail_bad_event(event, *args, **kwargs):
+        if event.event_type == "bad_event":
+            raise RuntimeError("conversion failed")
+        return from_event(event, *args, **kwargs)
+
+    with patch(
+        "homeassistant.components.recorder.Events.from_event",
+        side_effect=fail_bad_event,
+    ):
+        hass.bus.fire("bad_event")
+        hass.bus.fire("good_event")
+        hass.states.set("test.one", "on", {})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        event_types = {event.event_type for event in session.query(Events)}
+        assert "good_event" in event_types
+        assert "bad_event" not in event_types
+        assert session.query(States).count() == 1
+
+    assert "Error converting event" in caplog.text
+
+
+def test_batch_retried_one_event_at_a_time(hass_recorder, caplog):
+    """Test a batch the database refuses is retried one event at a time."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    insert_rows = instance._insert_rows
+
+    def refuse_bad_event(rows):
+        if any(event.event_type == "bad_event" for event, _, _ in rows):
+            raise exc.OperationalError("INSERT", {}, Exception("refused"))
+        insert_rows(rows)
+
+    hass.states.set("test.one", "1", {})
+    wait_recording_done(hass)
+
+    with patch.object(instance, "_insert_rows", side_effect=refuse_bad_event):
+        # Queue the events at once so they are written in one batch
+        with instance.queue.mutex:
+            for event_type in ("good_event", "bad_event", "good_event"):
+                instance.queue._put(ha_event(event_type))
+                instance.queue.unfinished_tasks += 1
+            instance.queue.not_empty.notify()
+        hass.states.set("test.one", "2", {})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        event_types = [event.event_type for event in session.query(Events)]
+        assert event_types.count("good_event") == 2
+        assert "bad_event" not in event_types
+        states = list(session.query(States).order_by(States.state_id))
+        assert [state.state for state in states] == ["1", "2"]
+
+    assert "retrying them one at a time" in caplog.text
+    assert "Error adding event" in caplog.text
+
+
+def test_failed_batch_keeps_uncommitted_batches(hass_recorder):
+    """Test a failed batch does not drop the batches not committed yet."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    insert_rows = instance._insert_rows
+
+    def refuse_bad_event(rows):
+        if any(event.event_type == "bad_event" for event, _, _ in rows):
+            raise exc.OperationalError("INSERT", {}, Exception("refused"))
+        insert_rows(rows)
+
+    with patch.object(instance, "_insert_rows", side_effect=refuse_bad_event):
+        hass.bus.fire("first_event")
+        hass.states.set("test.one", "1", {})
+        # Write the batch without a time change, so it is not committed
+        hass.block_till_done()
+        instance.block_till_done()
+        assert instance._uncommitted_events
+
+        hass.bus.fire("bad_event")
+        hass.states.set("test.one", "2", {})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        event_types = [event.event_type for event in session.query(Events)]
+        assert "first_event" in event_types
+        assert "bad_event" not in event_types
+        states = list(session.query(States).order_by(States.state_id))
+        assert [state.state for state in states] == ["1", "2"]
+        assert states[1].old_state_id == states[0].state_id
+
+
+def test_event_ids_follow_firing_order(hass_recorder):
+    """Test events of a batch are inserted in the order they were fired."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    events = [
+        ha_event("first_event"),
+        ha_event(
+            "state_changed",
+            {"entity_id": "test.one", "new_state": ha_state("test.one", "1")},
+        ),
+        ha_event("second_event"),
+        ha_event("third_event"),
+        ha_event(
+            "state_changed",
+            {"entity_id": "test.one", "new_state": ha_state("test.one", "2")},
+        ),
+    ]
+
+    # Queue the events at once so they are written in one batch
+    with instance.queue.mutex:
+        for event in events:
+            instance.queue._put(event)
+            instance.queue.unfinished_tasks += 1
+        instance.queue.not_empty.notify()
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        event_types = [
+            event.event_type
+            for event in session.query(Events).order_by(Events.event_id)
+            if event.event_type in {fired.event_type for fired in events}
+        ]
+        assert event_types == [event.event_type for event in events]
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
@@ -4,7 +4,10 @@ import json
 import unittest
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.const import (
+    DATA_INSTANCE,
+    EVENT_RECORDER_PURGE_PROGRESS,
+)
 from homeassistant.components.recorder.models import Events, RecorderRuns, States
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
@@ -12,6 +15,7 @@ from homeassistant.util import dt as dt_util
 
 from tests.async_mock import patch
 from tests.common import get_test_home_assistant, init_recorder_component
+from tests.components.recorder.common import wait_recording_done
 
 
 class TestRecorderPurge(unittest.TestCase):
@@ -130,10 +134,6 @@ class TestRecorderPurge(unittest.TestCase):
             assert states.count() == 6
 
             # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 4
-
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert not finished
             assert states.count() == 2
@@ -151,10 +151,6 @@ class TestRecorderPurge(unittest.TestCase):
             assert events.count() == 6
 
             # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert events.count() == 4
-
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert not finished
             assert events.count() == 2
@@ -164,6 +160,45 @@ class TestRecorderPurge(unittest.TestCase):
             assert finished
             assert events.count() == 2
 
+    def test_purge_old_states_in_chunks(self):
+        """Test purging deletes a bounded chunk per pass and reports progress."""
+        self._add_test_states()
+        progress = []
+        self.hass.bus.listen(
+            EVENT_RECORDER_PURGE_PROGRESS, lambda event: progress.append(event.data)
+        )
+
+        with patch(
+            "homeassistant.components.recorder.purge.PURGE_CHUNK_SIZE", 2
+        ), session_scope(hass=self.hass) as session:
+            states = session.query(States)
+            assert states.count() == 6
+
+            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+            assert not finished
+            assert states.count() == 4
+
+            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+            assert not finished
+            assert states.count() == 2
+
+            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+            assert finished
+            assert states.count() == 2
+
+        self.hass.block_till_done()
+        assert [data["deleted_states"] for data in progress] == [2, 4, 4]
+        assert [data["remaining"] for data in progress] == [2, 0, 0]
+        assert self.hass.data[DATA_INSTANCE].purge_progress is None
+
+        # The progress events are not recorded
+        wait_recording_done(self.hass)
+        with session_scope(hass=self.hass) as session:
+            events = session.query(Events).filter(
+                Events.event_type == EVENT_RECORDER_PURGE_PROGRESS
+            )
+            assert events.count() == 0
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -224,6 +259,6 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 assert (
-                    mock_logger.debug.mock_calls[5][1][0]
+                    mock_logger.debug.mock_calls[3][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
@@ -556,8 +556,8 @@ async def test_invalid_availability_template_keeps_component_available(hass, cap
     assert ("UndefinedError: 'x' is undefined") in caplog.text
 
 
-async def test_no_update_template_match_all(hass, caplog):
-    """Test that we do not update sensors that match on all."""
+async def test_no_update_template_match_all(hass):
+    """Test that templates without states are not updated by state changes."""
     hass.states.async_set("binary_sensor.test_sensor", "true")
 
     await setup.async_setup_component(
@@ -586,26 +586,6 @@ async def test_no_update_template_match_all(hass, caplog):
     )
     await hass.async_block_till_done()
     assert len(hass.states.async_all()) == 5
-    assert (
-        "Template binary sensor 'all_state' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the value template"
-    ) in caplog.text
-    assert (
-        "Template binary sensor 'all_icon' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the icon template"
-    ) in caplog.text
-    assert (
-        "Template binary sensor 'all_entity_picture' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the entity_picture template"
-    ) in caplog.text
-    assert (
-        "Template binary sensor 'all_attribute' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the test_attribute template"
-    ) in caplog.text
 
     assert hass.states.get("binary_sensor.all_state").state == "off"
     assert hass.states.get("binary_sensor.all_icon").state == "off"
@@ -620,11 +600,20 @@ async def test_no_update_template_match_all(hass, caplog):
     assert hass.states.get("binary_sensor.all_entity_picture").state == "on"
     assert hass.states.get("binary_sensor.all_attribute").state == "on"
 
-    hass.states.async_set("binary_sensor.test_sensor", "false")
-    await hass.async_block_till_done()
-
+    with mock.patch.object(
+        template_hlpr.Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=template_hlpr.Template.async_render_to_info,
+    ) as mock_render:
+        hass.states.async_set("binary_sensor.test_sensor", "false")
+        await hass.async_block_till_done()
+
+    # Only the templates that read the state are rendered again
+    assert {call[1][0].template for call in mock_render.mock_calls} == {
+        "{{ states.binary_sensor.test_sensor.state }}"
+    }
     assert hass.states.get("binary_sensor.all_state").state == "on"
-    # Will now process because we have one valid template
     assert hass.states.get("binary_sensor.all_icon").state == "off"
     assert hass.states.get("binary_sensor.all_entity_picture").state == "off"
     assert hass.states.get("binary_sensor.all_attribute").state == "off"
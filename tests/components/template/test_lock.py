@@ -5,7 +5,9 @@ from homeassistant import setup
 from homeassistant.components import lock
 from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON, STATE_UNAVAILABLE
 from homeassistant.core import callback
+from homeassistant.helpers.template import Template
 
+from tests.async_mock import patch
 from tests.common import assert_setup_component, get_test_home_assistant
 
 _LOGGER = logging.getLogger(__name__)
@@ -231,8 +233,8 @@ class TestTemplateLock:
 
         assert self.hass.states.all() == []
 
-    def test_no_template_match_all(self, caplog):
-        """Test that we do not allow locks that match on all."""
+    def test_no_template_match_all(self):
+        """Test that templates without states are not updated by state changes."""
         with assert_setup_component(1, "lock"):
             assert setup.setup_component(
                 self.hass,
@@ -260,14 +262,17 @@ class TestTemplateLock:
         state = self.hass.states.get("lock.template_lock")
         assert state.state == lock.STATE_UNLOCKED
 
-        assert (
-            "Template lock 'Template Lock' has no entity ids configured to track "
-            "nor were we able to extract the entities to track from the value "
-            "template(s). This entity will only be able to be updated manually"
-        ) in caplog.text
-
-        self.hass.states.set("lock.template_lock", lock.STATE_LOCKED)
-        self.hass.block_till_done()
+        with patch.object(
+            Template,
+            "async_render_to_info",
+            autospec=True,
+            side_effect=Template.async_render_to_info,
+        ) as mock_render:
+            self.hass.states.set("lock.template_lock", lock.STATE_LOCKED)
+            self.hass.block_till_done()
+
+        # The template does not read any state, so it is not rendered again
+        assert not mock_render.mock_calls
         state = self.hass.states.get("lock.template_lock")
         assert state.state == lock.STATE_LOCKED
 
@@ -10,6 +10,7 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNAVAILABLE,
 )
+from homeassistant.helpers.template import Template
 from homeassistant.setup import ATTR_COMPONENT, async_setup_component, setup_component
 
 from tests.common import assert_setup_component, get_test_home_assistant
@@ -576,8 +577,8 @@ async def test_invalid_availability_template_keeps_component_available(hass, cap
     assert ("UndefinedError: 'x' is undefined") in caplog.text
 
 
-async def test_no_template_match_all(hass, caplog):
-    """Test that we do not allow sensors that match on all."""
+async def test_no_template_match_all(hass):
+    """Test that templates without states are not updated by state changes."""
     hass.states.async_set("sensor.test_sensor", "startup")
 
     await async_setup_component(
@@ -617,31 +618,6 @@ async def test_no_template_match_all(hass, caplog):
 
     await hass.async_block_till_done()
     assert len(hass.states.async_all()) == 6
-    assert (
-        "Template sensor 'invalid_state' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the value template"
-    ) in caplog.text
-    assert (
-        "Template sensor 'invalid_icon' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the icon template"
-    ) in caplog.text
-    assert (
-        "Template sensor 'invalid_entity_picture' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the entity_picture template"
-    ) in caplog.text
-    assert (
-        "Template sensor 'invalid_friendly_name' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the friendly_name template"
-    ) in caplog.text
-    assert (
-        "Template sensor 'invalid_attribute' has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the test_attribute template"
-    ) in caplog.text
 
     assert hass.states.get("sensor.invalid_state").state == "unknown"
     assert hass.states.get("sensor.invalid_icon").state == "unknown"
@@ -658,11 +634,20 @@ async def test_no_template_match_all(hass, caplog):
     assert hass.states.get("sensor.invalid_friendly_name").state == "startup"
     assert hass.states.get("sensor.invalid_attribute").state == "startup"
 
-    hass.states.async_set("sensor.test_sensor", "hello")
-    await hass.async_block_till_done()
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        hass.states.async_set("sensor.test_sensor", "hello")
+        await hass.async_block_till_done()
 
+    # Only the templates that read the state are rendered again
+    assert {call[1][0].template for call in mock_render.mock_calls} == {
+        "{{ states.sensor.test_sensor.state }}"
+    }
     assert hass.states.get("sensor.invalid_state").state == "2"
-    # Will now process because we have at least one valid template
     assert hass.states.get("sensor.invalid_icon").state == "hello"
     assert hass.states.get("sensor.invalid_entity_picture").state == "hello"
     assert hass.states.get("sensor.invalid_friendly_name").state == "hello"
@@ -712,3 +697,47 @@ async def test_unique_id(hass):
     await hass.async_block_till_done()
 
     assert len(hass.states.async_all()) == 1
+
+
+async def test_template_tracks_rendered_entities(hass):
+    """Test the sensor follows the entities its template accessed."""
+    hass.states.async_set("input_select.source", "one")
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": {
+                "platform": "template",
+                "sensors": {
+                    "selected": {
+                        "value_template": "{{ states('sensor.' ~ "
+                        "states('input_select.source')) }}"
+                    },
+                },
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.selected").state == "1"
+
+    hass.states.async_set("sensor.one", "10")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.selected").state == "10"
+
+    hass.states.async_set("input_select.source", "two")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.selected").state == "2"
+
+    with patch(
+        "homeassistant.components.template.sensor.SensorTemplate.async_update"
+    ) as mock_update:
+        hass.states.async_set("sensor.one", "11")
+        await hass.async_block_till_done()
+
+    assert not mock_update.mock_calls
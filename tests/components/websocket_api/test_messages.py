@@ -0,0 +1,54 @@
+"""Test Websocket API messages module."""
+import json
+
+from homeassistant.components.websocket_api.messages import (
+    _cached_event_message as lru_event_cache,
+    cached_event_message,
+    message_to_json,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+
+async def test_cached_event_message(hass):
+    """Test that we cache event messages."""
+    lru_event_cache.cache_clear()
+
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.window", "new_state": State("light.window", "on")},
+    )
+
+    msg0 = cached_event_message(2, event)
+    assert msg0 == cached_event_message(2, event)
+
+    msg1 = cached_event_message(3, event)
+    assert msg0 != msg1
+
+    assert json.loads(msg0)["id"] == 2
+    assert json.loads(msg1)["id"] == 3
+    assert json.loads(msg0)["event"] == json.loads(msg1)["event"]
+
+    cache_info = lru_event_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
+
+
+async def test_message_to_json(caplog):
+    """Test we can serialize websocket messages."""
+    json_str = message_to_json({"id": 1, "message": "xyz"})
+
+    assert json_str == '{"id": 1, "message": "xyz"}'
+
+    json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
+
+    assert (
+        json_str2
+        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+    )
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+class _Unserializeable:
+    """A class that cannot be serialized."""
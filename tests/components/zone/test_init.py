@@ -198,6 +198,32 @@ async def test_active_zone_prefers_smaller_zone_if_same_distance_2(hass):
     assert "zone.smallest_zone" == active.entity_id
 
 
+async def test_active_zone_after_zone_change(hass):
+    """Test the active zone follows zone changes."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": {}})
+    hass.states.async_set(
+        "zone.moving",
+        "zoning",
+        {"latitude": 32.8806, "longitude": -117.2375, "radius": 250},
+    )
+    await hass.async_block_till_done()
+
+    active = zone.async_active_zone(hass, 32.8806, -117.2375)
+    assert active.entity_id == "zone.moving"
+    assert zone.async_active_zone(hass, 52.3731, 4.8922) is None
+
+    hass.states.async_set(
+        "zone.moving",
+        "zoning",
+        {"latitude": 52.3731, "longitude": 4.8922, "radius": 250},
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 32.8806, -117.2375) is None
+    active = zone.async_active_zone(hass, 52.3731, 4.8922)
+    assert active.entity_id == "zone.moving"
+
+
 async def test_in_zone_works_for_passive_zones(hass):
     """Test working in passive zones."""
     latitude = 32.880600
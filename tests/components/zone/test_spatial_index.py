@@ -0,0 +1,81 @@
+"""Test the zone spatial index."""
+import random
+
+import pytest
+
+from homeassistant.components.zone.spatial_index import ZoneIndex
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import State
+from homeassistant.util.location import distance
+
+
+def _zone(idx, latitude, longitude, radius, state="zoning", passive=False):
+    """Create a zone state."""
+    return State(
+        f"zone.zone_{idx}",
+        state,
+        {
+            "latitude": latitude,
+            "longitude": longitude,
+            "radius": radius,
+            "passive": passive,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "center", [(32.8806, -117.2375), (0.0, 179.999), (-45.0, -180.0), (89.5, 10.0)]
+)
+def test_candidates_include_containing_zones(center):
+    """Test no zone containing a location is missed."""
+    rand = random.Random(42)
+    zones = [
+        _zone(
+            idx,
+            center[0] + rand.uniform(-0.05, 0.05),
+            (center[1] + rand.uniform(-0.05, 0.05) + 180) % 360 - 180,
+            rand.choice([50, 100, 250, 1000, 30000]),
+        )
+        for idx in range(200)
+    ]
+    index = ZoneIndex(zones)
+
+    for _ in range(200):
+        latitude = center[0] + rand.uniform(-0.06, 0.06)
+        longitude = (center[1] + rand.uniform(-0.06, 0.06) + 180) % 360 - 180
+        radius = rand.choice([0, 20, 500])
+        candidates = index.candidates(latitude, longitude, radius)
+
+        assert candidates == sorted(candidates, key=lambda zone: zone.entity_id)
+        for zone in zones:
+            zone_dist = distance(
+                latitude,
+                longitude,
+                zone.attributes["latitude"],
+                zone.attributes["longitude"],
+            )
+            if zone_dist is not None and zone_dist - radius < zone.attributes["radius"]:
+                assert zone in candidates
+
+
+def test_candidates_are_pruned():
+    """Test far away zones are not returned."""
+    near = _zone(1, 32.8806, -117.2375, 100)
+    far = _zone(2, 52.3731, 4.8922, 100)
+    index = ZoneIndex([near, far])
+
+    assert index.candidates(32.8806, -117.2375) == [near]
+    assert index.candidates(0, 0) == []
+    assert index.candidates(None, None) == [near, far]
+
+
+def test_skips_unavailable_and_passive_zones():
+    """Test inactive zones are not indexed."""
+    zones = [
+        _zone(1, 32.8806, -117.2375, 100, state=STATE_UNAVAILABLE),
+        _zone(2, 32.8806, -117.2375, 100, passive=True),
+        _zone(3, 32.8806, -117.2375, 100),
+    ]
+    index = ZoneIndex(zones)
+
+    assert index.candidates(32.8806, -117.2375) == [zones[2]]
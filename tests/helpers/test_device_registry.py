@@ -321,6 +321,38 @@ async def test_deleted_device_removing_config_entries(hass, registry, update_eve
     assert entry.id != entry2.id
 
 
+async def test_entries_for_config_entry(registry):
+    """Test looking up devices by config entry."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="123",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="456", connections=set(), identifiers={("bridgeid", "4567")},
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [entry1]
+
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123", connections=set(), identifiers={("bridgeid", "4567")},
+    )
+    assert sorted(
+        device.id
+        for device in device_registry.async_entries_for_config_entry(registry, "123")
+    ) == sorted([entry1.id, entry2.id])
+
+    registry.async_remove_device(entry1.id)
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [entry2]
+
+    registry.async_clear_config_entry("123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        registry.async_get(entry2.id)
+    ]
+    assert len(registry.deleted_devices) == 0
+
+
 async def test_removing_area_id(registry):
     """Make sure we can clear area id."""
     entry = registry.async_get_or_create(
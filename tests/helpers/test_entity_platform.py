@@ -90,6 +90,124 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_slow_entity_does_not_block_others(hass, caplog):
+    """Test a slow entity is skipped while the others keep polling."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    release = asyncio.Event()
+    slow_updates = []
+    fast_updates = []
+
+    async def slow_update():
+        """Mock slow update."""
+        slow_updates.append(None)
+        await release.wait()
+
+    async def fast_update():
+        """Mock fast update."""
+        fast_updates.append(None)
+
+    slow_ent = MockEntity(should_poll=True)
+    slow_ent.async_update = slow_update
+    fast_ent = MockEntity(should_poll=True)
+    fast_ent.async_update = fast_update
+
+    await component.async_add_entities([slow_ent, fast_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert len(slow_updates) == 1
+    assert len(fast_updates) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert len(slow_updates) == 1
+    assert len(fast_updates) == 2
+    assert "took longer than the scheduled update interval" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done()
+
+    stats = entity_platform.async_get_poll_stats(hass)
+    assert stats[slow_ent.entity_id]["count"] == 1
+    assert stats[slow_ent.entity_id]["skipped"] == 1
+    assert stats[fast_ent.entity_id]["count"] == 2
+    assert stats[fast_ent.entity_id]["skipped"] == 0
+    assert stats[fast_ent.entity_id]["max"] >= stats[fast_ent.entity_id]["mean"]
+
+
+async def test_polling_spread_over_scan_interval(hass):
+    """Test polls of large platforms are spread over the scan interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    ent1 = MockEntity(should_poll=True)
+    ent1.update = Mock()
+    ent2 = MockEntity(should_poll=True)
+    ent2.update = Mock()
+
+    await component.async_add_entities([ent1, ent2])
+
+    with patch.object(entity_platform, "POLL_SPREAD_MIN_ENTITIES", 2):
+        # The first tick polls all entities right away
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+
+        assert len(ent1.update.mock_calls) == 1
+        assert len(ent2.update.mock_calls) == 1
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+        await hass.async_block_till_done()
+
+    # The second entity polls in the second half of the spread window
+    assert len(ent2.update.mock_calls) == 1
+
+    # Before the next scan interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=51))
+    await hass.async_block_till_done()
+
+    assert len(ent1.update.mock_calls) == 2
+    assert len(ent2.update.mock_calls) == 2
+
+
+async def test_polling_async_platform_is_capped(hass):
+    """Test polls of a platform without parallel updates are capped."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    release = asyncio.Event()
+    running = []
+
+    async def slow_update():
+        """Mock slow update."""
+        running.append(None)
+        await release.wait()
+
+    entities = []
+    for _ in range(entity_platform.MAX_PARALLEL_PLATFORM_POLLS + 2):
+        ent = MockEntity(should_poll=True)
+        ent.async_update = slow_update
+        entities.append(ent)
+
+    await component.async_add_entities(entities)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert entity_platform.MAX_PARALLEL_PLATFORM_POLLS < (
+        entity_platform.MAX_PARALLEL_POLLS
+    )
+    assert len(running) == entity_platform.MAX_PARALLEL_PLATFORM_POLLS
+
+    release.set()
+    await hass.async_block_till_done()
+
+    assert len(running) == len(entities)
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -330,6 +330,47 @@ async def test_removing_config_entry_id(hass, registry, update_events):
     assert update_events[1]["entity_id"] == entry.entity_id
 
 
+async def test_entries_for_device_and_config_entry(registry):
+    """Test looking up entries by device and config entry."""
+    mock_config_1 = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    mock_config_2 = MockConfigEntry(domain="light", entry_id="mock-id-2")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config_1, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config_1, device_id="device-1"
+    )
+    registry.async_get_or_create("light", "hue", "9012")
+
+    assert sorted(
+        entry.entity_id
+        for entry in entity_registry.async_entries_for_device(registry, "device-1")
+    ) == [entry1.entity_id, entry2.entity_id]
+    assert sorted(
+        entry.entity_id
+        for entry in entity_registry.async_entries_for_config_entry(
+            registry, "mock-id-1"
+        )
+    ) == [entry1.entity_id, entry2.entity_id]
+
+    # Moving an entity to another device and config entry updates the index
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config_2, device_id="device-2"
+    )
+    entry2 = registry.async_update_entity(
+        entry2.entity_id, new_entity_id="light.renamed"
+    )
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry1]
+    assert entity_registry.async_entries_for_device(registry, "device-2") == [entry2]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-2") == [
+        entry2
+    ]
+
+    registry.async_remove(entry1.entity_id)
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == []
+
+
 async def test_migration(hass):
     """Test migration from old data to new."""
     mock_config = MockConfigEntry(domain="test-platform", entry_id="test-config-id")
@@ -7,11 +7,12 @@ from astral import Astral
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_SCHEDULER,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -21,6 +22,7 @@ from homeassistant.helpers.event import (
     async_track_sunrise,
     async_track_sunset,
     async_track_template,
+    async_track_template_result,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -408,6 +410,139 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_template_result(hass):
+    """Test tracking template results by the states they access."""
+    runs = []
+
+    template = Template(
+        "{% if is_state('input_boolean.switch', 'on') %}"
+        "{{ states('sensor.one') }}"
+        "{% else %}"
+        "{{ states('sensor.two') }}"
+        "{% endif %}",
+        hass,
+    )
+    hass.states.async_set("input_boolean.switch", "on")
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+
+    @ha.callback
+    def result_callback(event, last_result, result):
+        runs.append((event.data["entity_id"], last_result, result))
+
+    info = async_track_template_result(hass, template, result_callback)
+    assert info.last_result == "1"
+
+    hass.states.async_set("sensor.two", "22")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("sensor.one", "11")
+    await hass.async_block_till_done()
+    assert runs == [("sensor.one", "1", "11")]
+
+    hass.states.async_set("input_boolean.switch", "off")
+    await hass.async_block_till_done()
+    assert runs[-1] == ("input_boolean.switch", "11", "22")
+
+    hass.states.async_set("sensor.one", "111")
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    hass.states.async_set("sensor.two", "222")
+    await hass.async_block_till_done()
+    assert runs[-1] == ("sensor.two", "22", "222")
+
+    info.async_remove()
+    hass.states.async_set("sensor.two", "2222")
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+    assert hass.bus.async_entity_listeners() == {}
+
+
+async def test_track_template_result_domain(hass):
+    """Test templates iterating a domain follow entities added or removed."""
+    runs = []
+
+    template = Template("{{ states.light | map(attribute='state') | list }}", hass)
+    hass.states.async_set("light.one", "on")
+
+    @ha.callback
+    def result_callback(event, last_result, result):
+        runs.append(result)
+
+    async_track_template_result(hass, template, result_callback)
+
+    hass.states.async_set("switch.one", "on")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("light.two", "off")
+    await hass.async_block_till_done()
+    assert runs == ["['on', 'off']"]
+
+    hass.states.async_set("light.two", "on")
+    await hass.async_block_till_done()
+    assert runs[-1] == "['on', 'on']"
+
+    hass.states.async_remove("light.one")
+    await hass.async_block_till_done()
+    assert runs[-1] == "['on']"
+
+
+async def test_track_template_result_all_states_rate_limited(hass):
+    """Test templates iterating all states are rate limited."""
+    runs = []
+
+    template = Template("{{ states | count }}", hass)
+
+    @ha.callback
+    def result_callback(event, last_result, result):
+        runs.append(result)
+
+    with patch("homeassistant.helpers.event.ALL_STATES_RATE_LIMIT", 0):
+        async_track_template_result(hass, template, result_callback)
+        hass.states.async_set("sensor.one", "on")
+        await hass.async_block_till_done()
+        assert runs == ["1"]
+
+    hass.states.async_set("sensor.two", "on")
+    hass.states.async_set("sensor.three", "on")
+    await hass.async_block_till_done()
+    assert runs == ["1"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert runs == ["1", "3"]
+
+
+async def test_track_template_result_without_states(hass):
+    """Test templates that do not access any state are not re-rendered."""
+    runs = []
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    template = Template("{{ 1 + 1 }}", hass)
+
+    @ha.callback
+    def result_callback(event, last_result, result):
+        runs.append(result)
+
+    info = async_track_template_result(hass, template, result_callback)
+    assert info.last_result == "2"
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+    assert hass.bus.async_entity_listeners() == {}
+
+    hass.states.async_set("sensor.one", "on")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    async_track_template_result(hass, template, result_callback, track_static=True)
+
+    hass.states.async_set("sensor.one", "off")
+    await hass.async_block_till_done()
+    assert runs == ["2"]
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -1327,6 +1462,43 @@ async def test_track_point_in_utc_time_cancel(hass):
     assert times[0].tzinfo == dt_util.UTC
 
 
+async def test_track_point_in_utc_time_coalesced(hass):
+    """Test listeners due at the same point in time share one loop timer."""
+    times = []
+
+    @ha.callback
+    def run_callback(utc_time):
+        times.append(utc_time)
+
+    @ha.callback
+    def run_callback_that_throws(utc_time):
+        raise ValueError
+
+    utc_now = dt_util.utcnow()
+    point_in_time = utc_now + timedelta(seconds=0.1)
+    local_point_in_time = dt_util.as_local(point_in_time)
+
+    with patch.object(hass.loop, "call_at", wraps=hass.loop.call_at) as mock_call_at:
+        async_track_point_in_utc_time(hass, run_callback, point_in_time)
+        async_track_point_in_utc_time(hass, run_callback_that_throws, point_in_time)
+        async_track_point_in_time(hass, run_callback, local_point_in_time)
+        unsub = async_track_point_in_utc_time(
+            hass, run_callback, utc_now + timedelta(seconds=0.15)
+        )
+
+    assert len(mock_call_at.mock_calls) == 2
+    assert hass.data[TRACK_TIME_SCHEDULER].async_pending() == 4
+
+    unsub()
+    assert hass.data[TRACK_TIME_SCHEDULER].async_pending() == 3
+
+    await asyncio.sleep(0.2)
+
+    assert len(times) == 2
+    assert times[0] == point_in_time
+    assert hass.data[TRACK_TIME_SCHEDULER].async_pending() == 0
+
+
 async def test_async_track_point_in_time_cancel(hass):
     """Test cancel of async track point in time."""
 
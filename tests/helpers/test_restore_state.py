@@ -1,5 +1,5 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import CoreState, State
@@ -8,6 +8,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_LOG_SUFFIX,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -198,6 +199,103 @@ async def test_dump_error(hass):
     assert mock_write_data.called
 
 
+async def test_dump_dirty_states(hass, hass_storage):
+    """Test that only changed states are appended to the log."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+    snapshot = hass_storage[STORAGE_KEY]["data"]
+    assert [item["state"]["state"] for item in snapshot] == ["on"]
+
+    hass.states.async_set("input_boolean.b0", "off")
+    hass.states.async_set("input_boolean.b1", "off")
+    await hass.async_block_till_done()
+    await data.async_dump_dirty_states()
+
+    # b0 is not a restore entity, the snapshot is left alone
+    logged_states = hass_storage[f"{STORAGE_KEY}{STORAGE_LOG_SUFFIX}"]
+    assert len(logged_states) == 1
+    assert logged_states[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert logged_states[0]["state"]["state"] == "off"
+    assert hass_storage[STORAGE_KEY]["data"] == snapshot
+    assert data.log_entries == 1
+
+    # Nothing changed, nothing is written
+    await data.async_dump_dirty_states()
+    assert len(hass_storage[f"{STORAGE_KEY}{STORAGE_LOG_SUFFIX}"]) == 1
+
+
+async def test_dump_dirty_states_compacts(hass, hass_storage):
+    """Test that the log is compacted into a snapshot once it grows."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await hass.async_block_till_done()
+    data.log_entries = 1
+    await data.async_dump_dirty_states()
+
+    assert f"{STORAGE_KEY}{STORAGE_LOG_SUFFIX}" not in hass_storage
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "on"
+    assert data.log_entries == 0
+
+    # Never compact while stopping
+    hass.states.async_set("input_boolean.b1", "off")
+    await hass.async_block_till_done()
+    data.log_entries = 1
+    hass.state = CoreState.stopping
+    await data.async_dump_dirty_states()
+
+    logged_states = hass_storage[f"{STORAGE_KEY}{STORAGE_LOG_SUFFIX}"]
+    assert logged_states[0]["state"]["state"] == "off"
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "on"
+    hass.state = CoreState.running
+
+
+async def test_load_replays_log(hass, hass_storage):
+    """Test that logged states are applied on top of the snapshot."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b0", "off"), now).as_dict(),
+            StoredState(State("input_boolean.b1", "off"), now).as_dict(),
+        ],
+    }
+    hass_storage[f"{STORAGE_KEY}{STORAGE_LOG_SUFFIX}"] = [
+        StoredState(
+            State("input_boolean.b0", "on"), now - timedelta(minutes=15)
+        ).as_dict(),
+        StoredState(
+            State("input_boolean.b1", "on"), now + timedelta(minutes=15)
+        ).as_dict(),
+        StoredState(
+            State("input_boolean.b2", "on"), now + timedelta(minutes=15)
+        ).as_dict(),
+        {"invalid": "entry"},
+    ]
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    # b0 was logged before the snapshot was written
+    assert data.last_states["input_boolean.b0"].state.state == "off"
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+
+
 async def test_load_error(hass):
     """Test that we cache data."""
     entity = RestoreEntity()
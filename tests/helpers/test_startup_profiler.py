@@ -0,0 +1,153 @@
+"""Tests for the startup profiler."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from homeassistant import loader
+from homeassistant.helpers import startup_profiler
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry, MockModule, mock_integration
+
+
+@pytest.fixture
+def profiler(hass):
+    """Profile the setups done in a test."""
+    profiler = hass.data[
+        startup_profiler.DATA_STARTUP_PROFILER
+    ] = startup_profiler.StartupProfiler()
+    return profiler
+
+
+async def test_blocking_time(hass, profiler):
+    """Test only the time spent running on the event loop counts as blocking."""
+
+    async def setup():
+        time.sleep(0.05)
+        await asyncio.sleep(0.1)
+        return True
+
+    assert await startup_profiler.async_profile(
+        hass, "test", startup_profiler.PHASE_SETUP, setup()
+    )
+
+    span = profiler.spans[0]
+    assert span.domain == "test"
+    assert span.phase == startup_profiler.PHASE_SETUP
+    assert span.wall >= 0.15
+    assert 0.05 <= span.blocking < 0.1
+
+
+async def test_errors_are_recorded(hass, profiler):
+    """Test exceptions and cancellation pass through the profiler."""
+
+    async def setup():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await startup_profiler.async_profile(
+            hass, "test", startup_profiler.PHASE_SETUP, setup()
+        )
+
+    task = hass.async_create_task(
+        startup_profiler.async_profile(
+            hass, "test", startup_profiler.PHASE_SETUP_ENTRY, asyncio.sleep(10)
+        )
+    )
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    with pytest.raises(ImportError):
+        startup_profiler.profile(
+            hass, "test", startup_profiler.PHASE_IMPORT, _raise_import_error
+        )
+
+    assert [span.phase for span in profiler.spans] == [
+        startup_profiler.PHASE_SETUP,
+        startup_profiler.PHASE_SETUP_ENTRY,
+        startup_profiler.PHASE_IMPORT,
+    ]
+
+
+async def test_not_profiling(hass):
+    """Test nothing is recorded when startup is not profiled."""
+
+    async def setup():
+        return True
+
+    assert await startup_profiler.async_profile(
+        hass, "test", startup_profiler.PHASE_SETUP, setup()
+    )
+    assert startup_profiler.profile(
+        hass, "test", startup_profiler.PHASE_IMPORT, lambda: True
+    )
+    assert startup_profiler.DATA_STARTUP_PROFILER not in hass.data
+
+
+async def test_setup_phases(hass, profiler):
+    """Test the phases of setting up an integration are recorded."""
+    mock_integration(
+        hass, MockModule("comp", async_setup_entry=lambda hass, entry: _true()),
+    )
+    MockConfigEntry(domain="comp").add_to_hass(hass)
+
+    assert await async_setup_component(hass, "comp", {})
+
+    phases = {span.phase for span in profiler.spans if span.domain == "comp"}
+    assert phases == {
+        startup_profiler.PHASE_MANIFEST,
+        startup_profiler.PHASE_IMPORT,
+        startup_profiler.PHASE_SETUP,
+        startup_profiler.PHASE_SETUP_ENTRY,
+    }
+
+
+async def test_write_report(hass, profiler, tmpdir):
+    """Test the report and the timeline are written to the config dir."""
+    hass.config.config_dir = str(tmpdir)
+    hass.data[loader.DATA_IMPORT_TIMES] = {"homeassistant.components.comp": 0.5}
+
+    async def setup():
+        return True
+
+    await startup_profiler.async_profile(
+        hass, "comp", startup_profiler.PHASE_SETUP, setup()
+    )
+    await startup_profiler.async_profile(
+        hass, "comp", startup_profiler.PHASE_SETUP, setup()
+    )
+    startup_profiler.profile(
+        hass, "<script>", startup_profiler.PHASE_IMPORT, lambda: None
+    )
+
+    await startup_profiler.async_write_report(hass)
+
+    assert startup_profiler.DATA_STARTUP_PROFILER not in hass.data
+
+    report = json.loads(tmpdir.join(startup_profiler.REPORT_FILE).read())
+    assert report["duration"] == profiler.duration
+    assert report["import_times"] == {"homeassistant.components.comp": 0.5}
+    assert len(report["spans"]) == 3
+    comp = report["integrations"]["comp"]
+    assert set(comp["phases"]) == {startup_profiler.PHASE_SETUP}
+    assert comp["wall"] == comp["phases"][startup_profiler.PHASE_SETUP]["wall"]
+
+    flame = tmpdir.join(startup_profiler.FLAME_FILE).read()
+    assert "comp setup" in flame
+    assert "&lt;script&gt;" in flame
+    assert "<script>" not in flame
+
+
+def _raise_import_error():
+    """Raise an import error."""
+    raise ImportError
+
+
+async def _true():
+    """Return True."""
+    return True
@@ -236,3 +236,24 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_writes_are_coalesced(hass, hass_storage):
+    """Test that writes of several stores share one executor job."""
+    store1 = storage.Store(hass, MOCK_VERSION, "store-1")
+    store2 = storage.Store(hass, MOCK_VERSION, "store-2", compact=True)
+    store3 = storage.Store(hass, MOCK_VERSION, "store-3")
+    store3.async_delay_save(lambda: MOCK_DATA2, 1)
+
+    with patch(
+        "homeassistant.helpers.storage._write_batch", wraps=storage._write_batch
+    ) as mock_write_batch:
+        await asyncio.gather(store1.async_save(MOCK_DATA), store2.async_save(MOCK_DATA))
+        await hass.async_block_till_done()
+
+    # The delayed write of store3 was due shortly and joined the batch
+    assert len(mock_write_batch.mock_calls) == 1
+    assert len(mock_write_batch.mock_calls[0][1][0]) == 3
+    assert hass_storage["store-1"]["data"] == MOCK_DATA
+    assert hass_storage["store-2"]["data"] == MOCK_DATA
+    assert hass_storage["store-3"]["data"] == MOCK_DATA2
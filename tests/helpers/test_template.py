@@ -1550,6 +1550,15 @@ def test_closest_function_no_location_states(hass):
     )
 
 
+def test_is_template_string():
+    """Test is template string."""
+    assert template.is_template_string("{{ x }}") is True
+    assert template.is_template_string("{% if x == 2 %}1{% else %}0{%end if %}") is True
+    assert template.is_template_string("{# a comment #} Hey") is False
+    assert template.is_template_string("1") is False
+    assert template.is_template_string("Some Text") is False
+
+
 def test_extract_entities_none_exclude_stuff(hass):
     """Test extract entities function with none or exclude stuff."""
     assert template.extract_entities(hass, None) == []
@@ -1934,28 +1943,39 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache(hass):
+    """Test compiled templates are shared between template instances."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template((template_string),)
+    template._clear_compiled_cache()  # pylint: disable=protected-access
+
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_template_cache_info() == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+        "max_size": template.COMPILED_TEMPLATE_CACHE_SIZE,
+    }
 
-    tpl2 = template.Template((template_string),)
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    info = template.compiled_template_cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+
+    # pylint: disable=protected-access
+    assert tpl._compiled_code is tpl2._compiled_code
+    assert tpl2.async_render() == "foo=x%26y&bar=42"
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_template_cache_info()["size"] == 1
+
+    # Environments without hass know fewer filters, so they compile separately
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    info = template.compiled_template_cache_info()
+    assert info["misses"] == 2
+    assert info["size"] == 2
@@ -0,0 +1,164 @@
+"""Test the recorder migrate script."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import reflection
+
+from homeassistant.components.recorder.models import (
+    SCHEMA_VERSION,
+    Base,
+    Events,
+    SchemaChanges,
+    States,
+)
+from homeassistant.scripts import recorder_migrate
+
+
+def _create_old_schema(engine):
+    """Create tables with the columns of an old schema version."""
+    engine.execute(
+        "CREATE TABLE events (event_id INTEGER PRIMARY KEY, "
+        "event_type VARCHAR(32), event_data TEXT, origin VARCHAR(32), "
+        "time_fired DATETIME, created DATETIME)"
+    )
+    engine.execute(
+        "CREATE TABLE states (state_id INTEGER PRIMARY KEY, domain VARCHAR(64), "
+        "entity_id VARCHAR(255), state VARCHAR(255), attributes TEXT, "
+        "event_id INTEGER, last_changed DATETIME, last_updated DATETIME, "
+        "created DATETIME)"
+    )
+    engine.execute(
+        "CREATE TABLE schema_changes (change_id INTEGER PRIMARY KEY, "
+        "schema_version INTEGER, changed DATETIME)"
+    )
+    engine.execute(
+        "INSERT INTO schema_changes (schema_version, changed) "
+        "VALUES (5, '2020-01-01 00:00:00.000000')"
+    )
+
+
+def test_migrate_in_batches(tmpdir):
+    """Test rows are copied in batches into the current schema."""
+    source_url = f"sqlite:///{tmpdir}/source.db"
+    target_url = f"sqlite:///{tmpdir}/target.db"
+    source = create_engine(source_url)
+    _create_old_schema(source)
+
+    time_fired = datetime(2020, 1, 1)
+    for event_id in range(1, 26):
+        source.execute(
+            Events.__table__.insert(),
+            event_id=event_id,
+            event_type="state_changed",
+            event_data="{}",
+            origin="LOCAL",
+            time_fired=time_fired,
+        )
+        # Leave gaps in the ids so batches cannot rely on them being dense
+        source.execute(
+            "INSERT INTO states (state_id, domain, entity_id, state, attributes, "
+            "event_id) VALUES (?, 'light', 'light.kitchen', 'on', '{}', ?)",
+            event_id * 2,
+            event_id,
+        )
+    source.dispose()
+
+    stats = recorder_migrate.migrate(source_url, target_url, batch_size=10)
+
+    assert stats["tables"]["events"]["rows"] == 25
+    assert stats["tables"]["states"]["rows"] == 25
+    assert stats["tables"]["schema_changes"]["rows"] == 1
+    assert "recorder_runs" not in stats["tables"]
+
+    target = create_engine(target_url)
+    states = target.execute(
+        States.__table__.select().order_by(States.state_id)
+    ).fetchall()
+    assert [state.state_id for state in states] == list(range(2, 52, 2))
+    assert states[0].entity_id == "light.kitchen"
+    assert states[0].old_state_id is None
+
+    events = target.execute(Events.__table__.select()).fetchall()
+    assert len(events) == 25
+    assert events[0].time_fired == time_fired
+    assert events[0].context_id is None
+
+    versions = target.execute(
+        SchemaChanges.__table__.select().order_by(SchemaChanges.change_id)
+    ).fetchall()
+    assert [row.schema_version for row in versions] == [5, SCHEMA_VERSION]
+
+    inspector = reflection.Inspector.from_engine(target)
+    for table in Base.metadata.sorted_tables:
+        assert {index["name"] for index in inspector.get_indexes(table.name)} == {
+            index.name for index in table.indexes
+        }
+    target.dispose()
+
+
+def test_migrate_current_schema(tmpdir):
+    """Test a database with the current schema only gets compacted."""
+    source_url = f"sqlite:///{tmpdir}/source.db"
+    target_url = f"sqlite:///{tmpdir}/target.db"
+    source = create_engine(source_url)
+    Base.metadata.create_all(source)
+    source.execute(SchemaChanges.__table__.insert(), schema_version=SCHEMA_VERSION)
+    source.dispose()
+
+    recorder_migrate.migrate(source_url, target_url)
+
+    target = create_engine(target_url)
+    versions = target.execute(SchemaChanges.__table__.select()).fetchall()
+    assert [row.schema_version for row in versions] == [SCHEMA_VERSION]
+    target.dispose()
+
+
+def test_migrate_refuses_non_empty_target(tmpdir):
+    """Test we do not copy into a database that has tables."""
+    source_url = f"sqlite:///{tmpdir}/source.db"
+    target_url = f"sqlite:///{tmpdir}/target.db"
+    for url in (source_url, target_url):
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        engine.dispose()
+
+    with pytest.raises(ValueError):
+        recorder_migrate.migrate(source_url, target_url)
+
+
+def test_run_default_target(tmpdir, capsys):
+    """Test the script copies the database next to the configured one."""
+    engine = create_engine(f"sqlite:///{tmpdir}/home-assistant_v2.db")
+    _create_old_schema(engine)
+    engine.dispose()
+
+    assert recorder_migrate.run(["--config", str(tmpdir)]) == 0
+    assert tmpdir.join(
+        f"home-assistant_v2.db{recorder_migrate.MIGRATED_SUFFIX}"
+    ).check()
+    assert "Copied 1 rows" in capsys.readouterr().out
+
+    assert recorder_migrate.run(["--config", str(tmpdir)]) == 1
+    assert "not empty" in capsys.readouterr().out
+
+
+def test_sequence_reset_statement():
+    """Test the serial sequence of a PostgreSQL primary key follows the copy."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.dialects import postgresql
+
+    table = Events.__table__
+    statement = recorder_migrate._sequence_reset_statement(
+        table, table.c.event_id, 42
+    ).compile(dialect=postgresql.dialect())
+
+    assert str(statement) == (
+        "SELECT setval(pg_get_serial_sequence(%(pg_get_serial_sequence_1)s, "
+        "%(pg_get_serial_sequence_2)s), %(setval_2)s) AS setval_1"
+    )
+    assert statement.params == {
+        "pg_get_serial_sequence_1": "events",
+        "pg_get_serial_sequence_2": "event_id",
+        "setval_2": 42,
+    }
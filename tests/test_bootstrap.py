@@ -7,7 +7,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -104,6 +104,34 @@ async def test_setting_up_config(hass):
     assert "group" in hass.config.components
 
 
+async def test_preimport_integrations(hass):
+    """Test only the platforms in the config are imported ahead of setup."""
+    await bootstrap._async_preimport_integrations(
+        hass,
+        {"light", "not_an_integration"},
+        {"light": [{"platform": "demo"}, {"platform": "not_an_integration"}]},
+    )
+
+    components = hass.data[loader.DATA_COMPONENTS]
+    assert "light" in components
+    assert "demo.light" in components
+    assert "demo.switch" not in components
+    assert "homeassistant.components.demo.light" in hass.data[loader.DATA_IMPORT_TIMES]
+
+
+async def test_log_slowest_imports(hass, caplog):
+    """Test the slowest imports are logged after startup."""
+    caplog.set_level(logging.INFO)
+    hass.data[loader.DATA_IMPORT_TIMES] = {
+        f"module_{idx}": idx / 10 for idx in range(bootstrap.LOG_SLOWEST_IMPORTS + 1)
+    }
+
+    bootstrap._async_log_slowest_imports(hass)
+
+    assert f"module_{bootstrap.LOG_SLOWEST_IMPORTS} (1.00s)" in caplog.text
+    assert "module_0 " not in caplog.text
+
+
 async def test_setup_after_deps_all_present(hass):
     """Test after_dependencies when all present."""
     order = []
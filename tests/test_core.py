@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -34,7 +35,9 @@ from homeassistant.const import (
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError, InvalidStateError
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
+from homeassistant.util.loop_watchdog import LoopWatchdog
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from tests.async_mock import MagicMock, Mock, PropertyMock, patch
@@ -50,7 +53,7 @@ def test_split_entity_id():
 
 def test_async_add_job_schedule_callback():
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(loop_watchdog=None)
     job = MagicMock()
 
     ha.HomeAssistant.async_add_job(hass, ha.callback(job))
@@ -61,7 +64,7 @@ def test_async_add_job_schedule_callback():
 
 def test_async_add_job_schedule_partial_callback():
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(loop_watchdog=None)
     job = MagicMock()
     partial = functools.partial(ha.callback(job))
 
@@ -73,7 +76,7 @@ def test_async_add_job_schedule_partial_callback():
 
 def test_async_add_job_schedule_coroutinefunction(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), loop_watchdog=None)
 
     async def job():
         pass
@@ -86,7 +89,7 @@ def test_async_add_job_schedule_coroutinefunction(loop):
 
 def test_async_add_job_schedule_partial_coroutinefunction(loop):
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), loop_watchdog=None)
 
     async def job():
         pass
@@ -101,7 +104,7 @@ def test_async_add_job_schedule_partial_coroutinefunction(loop):
 
 def test_async_add_job_add_threaded_job_to_pool():
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(loop_watchdog=None)
 
     def job():
         pass
@@ -127,7 +130,7 @@ def test_async_create_task_schedule_coroutine(loop):
 
 def test_async_run_job_calls_callback():
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(loop_watchdog=None)
     calls = []
 
     def job():
@@ -140,7 +143,7 @@ def test_async_run_job_calls_callback():
 
 def test_async_run_job_delegates_non_async():
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(loop_watchdog=None)
     calls = []
 
     def job():
@@ -151,6 +154,31 @@ def test_async_run_job_delegates_non_async():
     assert len(hass.async_add_job.mock_calls) == 1
 
 
+async def test_loop_watchdog_times_jobs(hass):
+    """Test the loop watchdog times the jobs run on the event loop."""
+    hass.loop_watchdog = LoopWatchdog()
+    calls = []
+
+    @ha.callback
+    def callback_job(value):
+        calls.append(value)
+
+    async def coroutine_job(value):
+        calls.append(value)
+
+    hass.async_add_job(callback_job, 1)
+    hass.async_add_job(coroutine_job, 2)
+    hass.async_add_job(coroutine_job(3))
+    hass.async_run_job(callback_job, 4)
+    hass.bus.async_listen("test_event", ha.callback(lambda event: calls.append(5)))
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    assert sorted(calls) == [1, 2, 3, 4, 5]
+    # The coroutines take one step each, bus dispatch counts for the listener
+    assert hass.loop_watchdog.stats[__name__].calls == 5
+
+
 def test_stage_shutdown():
     """Simulate a shutdown, test calling stuff."""
     hass = get_test_home_assistant()
@@ -520,6 +548,23 @@ def test_state_dict_conversion():
     assert state == ha.State.from_dict(state.as_dict())
 
 
+def test_state_as_dict_cached():
+    """Test the dict and JSON of a state are built once and read only."""
+    state = ha.State("domain.hello", "world", {"some": "attr"})
+    as_dict = state.as_dict()
+    assert as_dict is state.as_dict()
+    assert as_dict["attributes"] == {"some": "attr"}
+
+    with pytest.raises(RuntimeError):
+        as_dict["state"] = "changed"
+    with pytest.raises(RuntimeError):
+        as_dict["attributes"]["some"] = "changed"
+
+    as_json = state.as_json()
+    assert as_json is state.as_json()
+    assert json.loads(as_json) == json.loads(json.dumps(as_dict, cls=JSONEncoder))
+
+
 def test_state_dict_conversion_with_wrong_data():
     """Test conversion with wrong data."""
     assert ha.State.from_dict(None) is None
@@ -596,6 +641,20 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         assert ["light.bowl", "switch.ac"] == states
 
+    def test_all_domain(self):
+        """Test the states of a single domain."""
+        self.states.set("light.Desk", "off")
+        states = sorted(state.entity_id for state in self.states.all("light"))
+        assert ["light.bowl", "light.desk"] == states
+        assert self.states.all("LIGHT") == self.states.all("light")
+        assert self.states.all("sensor") == []
+
+        self.states.remove("light.bowl")
+        self.states.remove("light.desk")
+        assert self.states.all("light") == []
+        assert self.states.entity_ids("light") == []
+        assert ["switch.ac"] == self.states.entity_ids("switch")
+
     def test_remove(self):
         """Test remove method."""
         events = []
@@ -1478,3 +1537,40 @@ async def test_chained_logging_misses_log_timeout(hass, caplog):
     await hass.async_block_till_done()
 
     assert "_task_chain_" not in caplog.text
+
+
+async def test_bus_listen_entity(hass, caplog):
+    """Test state changes are routed to the listeners of their entity_id."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    @ha.callback
+    def listener_that_throws(event):
+        """Mock listener that raises."""
+        raise ValueError
+
+    unsub = hass.bus.async_listen_entity(["light.kitchen", "light.bowl"], listener)
+    unsub_throws = hass.bus.async_listen_entity(["light.bowl"], listener_that_throws)
+    assert hass.bus.async_entity_listeners() == {"light.kitchen": 1, "light.bowl": 2}
+    assert EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.other", "on")
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen", "light.bowl"]
+    assert "Error while processing state changed for light.bowl" in caplog.text
+
+    unsub()
+    unsub_throws()
+    assert hass.bus.async_entity_listeners() == {}
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
@@ -1,12 +1,21 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import json
+
 import pytest
 
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 import homeassistant.loader as loader
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import ANY, patch
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass):
@@ -142,6 +151,35 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_import_times(hass):
+    """Test the first import of a component and its platforms is timed."""
+    integration = await loader.async_get_integration(hass, "hue")
+    integration.get_component()
+    integration.get_platform("light")
+
+    import_times = hass.data[loader.DATA_IMPORT_TIMES]
+    assert set(import_times) == {
+        "homeassistant.components.hue",
+        "homeassistant.components.hue.light",
+    }
+    assert all(duration >= 0 for duration in import_times.values())
+
+
+async def test_preimport(hass):
+    """Test preimporting an integration imports the requested platforms."""
+    integration = await loader.async_get_integration(hass, "hue")
+    await hass.async_add_executor_job(integration.preimport, ["light"])
+
+    components = hass.data[loader.DATA_COMPONENTS]
+    assert components["hue"] is hue
+    assert components["hue.light"] is hue_light
+    assert "hue.sensor" not in components
+
+    # Import errors are left for setup to report
+    await hass.async_add_executor_job(integration.preimport, ["not_a_platform"])
+    assert "hue.not_a_platform" not in components
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -234,6 +272,89 @@ async def test_get_custom_components_internal(hass):
     assert integrations == {"test": ANY, "test_package": ANY}
 
 
+async def test_get_custom_components_caches_manifests(hass, hass_storage):
+    """Test the custom integration manifests are stored for the next start."""
+    # pylint: disable=protected-access
+    await loader._async_get_custom_components(hass)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    cached = hass_storage[loader.CUSTOM_COMPONENTS_STORAGE_KEY]["data"]
+    assert set(cached) == {"test", "test_package"}
+    assert cached["test"]["manifest"]["domain"] == "test"
+
+
+async def test_get_custom_components_cache_not_saved(hass, hass_storage):
+    """Test the cache of custom integration manifests can be left unchanged."""
+    # pylint: disable=protected-access
+    hass.data[loader.DATA_CUSTOM_COMPONENTS_CACHE_SAVE] = False
+    integrations = await loader._async_get_custom_components(hass)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert set(integrations) == {"test", "test_package"}
+    assert loader.CUSTOM_COMPONENTS_STORAGE_KEY not in hass_storage
+
+
+def test_load_custom_manifests_uses_cache(tmp_path):
+    """Test manifests are only parsed again when the file changed."""
+    # pylint: disable=protected-access
+    manifest_path = tmp_path / "test" / "manifest.json"
+    manifest_path.parent.mkdir()
+    manifest_path.write_text(json.dumps({"domain": "test", "name": "Test"}))
+    (tmp_path / "no_manifest").mkdir()
+
+    manifests = loader._load_custom_manifests([str(tmp_path)], {})
+    assert list(manifests) == ["test"]
+    assert manifests["test"]["manifest"] == {"domain": "test", "name": "Test"}
+
+    manifests["test"]["manifest"]["name"] = "Cached"
+    assert loader._load_custom_manifests([str(tmp_path)], manifests) == manifests
+
+    manifest_path.write_text(json.dumps({"domain": "test", "name": "Changed"}))
+    manifests = loader._load_custom_manifests([str(tmp_path)], manifests)
+    assert manifests["test"]["manifest"]["name"] == "Changed"
+
+
+async def test_get_manifest_index(hass):
+    """Test the manifest index has built-in and custom integrations."""
+    index = await loader.async_get_manifest_index(hass)
+
+    assert index["mqtt"]["dependencies"] == ["http"]
+    assert index["test"] == {}
+
+    with patch("homeassistant.loader.async_get_custom_components") as mock_get:
+        mock_get.return_value = {
+            "mqtt": _get_test_integration(hass, "mqtt", False),
+        }
+        index = await loader.async_get_manifest_index(hass)
+
+    assert index["mqtt"] == {}
+
+
+def test_dependencies_from_index():
+    """Test resolving dependencies from the manifest index."""
+    index = {
+        "cloud": {"dependencies": ["http", "alexa"]},
+        "alexa": {"dependencies": ["http"], "after_dependencies": ["camera"]},
+        "http": {},
+        "camera": {},
+        "broken": {"dependencies": ["missing"]},
+    }
+
+    assert loader.dependencies_from_index(index, {"cloud"}) == {
+        "cloud",
+        "alexa",
+        "http",
+    }
+    assert loader.dependencies_from_index(index, {"broken", "legacy"}) == {
+        "broken",
+        "legacy",
+    }
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
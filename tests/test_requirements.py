@@ -1,4 +1,5 @@
 """Test requirements module."""
+import asyncio
 import os
 
 import pytest
@@ -91,6 +92,30 @@ async def test_install_missing_package(hass):
     assert len(mock_inst.mock_calls) == 1
 
 
+async def test_installed_versions_snapshot(hass):
+    """Test requirements are checked against a snapshot refreshed by installs."""
+    with patch(
+        "homeassistant.util.package.get_installed_versions",
+        return_value={"hello": "1.0.0"},
+    ) as mock_versions, patch(
+        "homeassistant.util.package.install_package", return_value=True
+    ) as mock_inst:
+        await asyncio.gather(
+            async_process_requirements(hass, "comp_1", ["hello==1.0.0"]),
+            async_process_requirements(hass, "comp_2", ["Hello>=0.5"]),
+            async_process_requirements(hass, "comp_3", ["hello==1.0.0"]),
+        )
+        assert len(mock_versions.mock_calls) == 1
+        assert len(mock_inst.mock_calls) == 0
+
+        await async_process_requirements(hass, "comp_4", ["world==2.0.0"])
+        assert len(mock_inst.mock_calls) == 1
+
+        await async_process_requirements(hass, "comp_5", ["hello==1.0.0", "other"])
+        assert len(mock_versions.mock_calls) == 2
+        assert len(mock_inst.mock_calls) == 2
+
+
 async def test_get_integration_with_requirements(hass):
     """Check getting an integration with loaded requirements."""
     hass.config.skip_pip = False
@@ -14,6 +14,7 @@ from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.json import (
     SerializationError,
+    dumps_compact,
     find_paths_unserializable_data,
     load_json,
     save_json,
@@ -113,6 +114,33 @@ def test_custom_encoder():
     assert data == "9"
 
 
+def test_save_and_load_compact():
+    """Test saving compact data and loading it back."""
+    fname = _path_for("test7")
+    save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname) as fh:
+        assert fh.read() == '{"a":1,"B":"two"}'
+    data = load_json(fname)
+    assert data == TEST_JSON_A
+
+
+def test_dumps_compact_custom_encoder():
+    """Test serializing compact data with a custom encoder."""
+
+    class MockJSONEncoder(JSONEncoder):
+        """Mock JSON encoder."""
+
+        def default(self, o):
+            """Mock JSON encode method."""
+            return "9"
+
+    assert dumps_compact({"a": Mock()}, encoder=MockJSONEncoder) == '{"a":"9"}'
+    assert dumps_compact({"a": 2 ** 70}) == '{"a":1180591620717411303424}'
+
+    with pytest.raises(TypeError):
+        dumps_compact({"hello": set()})
+
+
 def test_find_unserializable_data():
     """Find unserializeable data."""
     assert find_paths_unserializable_data(1) == {}
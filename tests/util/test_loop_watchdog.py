@@ -0,0 +1,113 @@
+"""Test the loop watchdog."""
+import asyncio
+import functools
+import time
+
+import pytest
+
+from homeassistant.util import loop_watchdog
+
+
+def _job(duration=0):
+    """Block for a duration."""
+    time.sleep(duration)
+    return True
+
+
+def test_target_module():
+    """Test the module of a target is found through partials and coroutines."""
+
+    async def coro():
+        pass
+
+    coroutine = coro()
+    assert loop_watchdog.target_module(_job) == __name__
+    assert loop_watchdog.target_module(functools.partial(_job, 0)) == __name__
+    assert loop_watchdog.target_module(coroutine) == __name__
+    assert loop_watchdog.target_module(time.sleep) == "time"
+    assert loop_watchdog.target_module(object()) == loop_watchdog.UNKNOWN_MODULE
+    coroutine.close()
+
+
+def test_run_records_stalls():
+    """Test jobs are timed and stalls are reported."""
+    stalls = []
+    watchdog = loop_watchdog.LoopWatchdog(
+        0.05, lambda target, module, duration: stalls.append((target, module))
+    )
+
+    assert watchdog.run(_job)
+    assert watchdog.run(_job, 0.05)
+
+    stats = watchdog.stats[__name__]
+    assert stats.calls == 2
+    assert stats.stalls == 1
+    assert stats.max_time >= 0.05
+    assert stats.time >= stats.max_time
+    assert stalls == [(_job, __name__)]
+
+
+def test_run_nested_jobs():
+    """Test jobs run from within a job are only counted for their module."""
+    watchdog = loop_watchdog.LoopWatchdog()
+
+    def outer():
+        watchdog.run(time.sleep, 0.05)
+
+    watchdog.run(outer)
+
+    assert watchdog.stats["time"].time >= 0.05
+    assert watchdog.stats[__name__].time < 0.05
+
+
+def test_run_raises():
+    """Test jobs that raise are recorded."""
+    watchdog = loop_watchdog.LoopWatchdog()
+
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        watchdog.run(fail)
+
+    assert watchdog.stats[__name__].calls == 1
+
+
+async def test_wrap_coroutine():
+    """Test each step of a wrapped coroutine is timed."""
+    watchdog = loop_watchdog.LoopWatchdog()
+
+    async def job():
+        _job(0.02)
+        await asyncio.sleep(0.1)
+        _job(0.02)
+        return "done"
+
+    assert await asyncio.create_task(watchdog.wrap_coroutine(job())) == "done"
+
+    stats = watchdog.stats[__name__]
+    assert stats.calls == 2
+    assert 0.04 <= stats.time < 0.1
+
+
+async def test_wrap_coroutine_cancel():
+    """Test wrapped coroutines can be cancelled."""
+    watchdog = loop_watchdog.LoopWatchdog()
+    cancelled = []
+
+    async def job():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    task = asyncio.create_task(watchdog.wrap_coroutine(job()))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert cancelled == [True]
+    assert watchdog.stats[__name__].calls == 2
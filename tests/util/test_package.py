@@ -248,3 +248,16 @@ def test_check_package_global():
 def test_check_package_zip():
     """Test for an installed zip package."""
     assert not package.is_installed(TEST_ZIP_REQ)
+
+
+def test_check_package_installed_versions():
+    """Test checking packages against a snapshot of installed versions."""
+    dist = list(pkg_resources.working_set)[0]
+    installed = package.get_installed_versions()
+
+    assert dist.version in installed.values()
+    assert package.is_installed(f"{dist.project_name}=={dist.version}", installed)
+    assert package.is_installed(dist.project_name.upper(), installed)
+    assert not package.is_installed(f"{dist.project_name}>{dist.version}", installed)
+    assert not package.is_installed(TEST_NEW_REQ, installed)
+    assert not package.is_installed(TEST_ZIP_REQ, installed)